@@ -1,11 +1,31 @@
 # game/core/__init__.py
 
-from .clock import Clock
+from .clock import (Clock, SimulationClock)
+from .scheduler import EventScheduler
+from .entity_store import EntityStore
 from .resources import ResourceManager
+from .rng import RandomStreams
+from .spatial import (SpatialGrid, FreeSpaceSampler, segment_distance)
+from .flow_field import (FlowField, SteeringFields)
+from .assignment import (greedy_match, hungarian_match, match_targets)
 from .world import World
+from .simulation import (SimulationJob, SimulationResult, build_configs, run_simulation, run_batch)
+from .snapshot import (capture_state, restore_state, world_to_bytes, world_from_bytes, save_snapshot, load_snapshot)
+from .forking import (ForkJob, ForkReport, fork_world, what_if)
+from .sweep import (SweepRow, grid_points, random_points, latin_hypercube_points, run_sweep)
 
 __all__ = [
-    'Clock',
+    'Clock', 'SimulationClock',
+    'EventScheduler',
+    'EntityStore',
     'ResourceManager',
+    'RandomStreams',
+    'SpatialGrid', 'FreeSpaceSampler', 'segment_distance',
+    'FlowField', 'SteeringFields',
+    'greedy_match', 'hungarian_match', 'match_targets',
     'World',
+    'SimulationJob', 'SimulationResult', 'build_configs', 'run_simulation', 'run_batch',
+    'capture_state', 'restore_state', 'world_to_bytes', 'world_from_bytes', 'save_snapshot', 'load_snapshot',
+    'ForkJob', 'ForkReport', 'fork_world', 'what_if',
+    'SweepRow', 'grid_points', 'random_points', 'latin_hypercube_points', 'run_sweep',
 ]
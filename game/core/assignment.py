@@ -0,0 +1,92 @@
+"""
+assignment.py
+
+功能: 目标分配，根据代价矩阵为每一行分配互不相同的列（贪心匹配与匈牙利算法）
+时间: 2026/10/17
+版本: 1.0
+"""
+
+import numpy as np
+
+
+def greedy_match(cost: np.ndarray, max_cost: float) -> np.ndarray:
+    """贪心匹配：按代价从小到大依次配对，返回每行分配到的列（-1 表示未分配）"""
+    result = np.full(cost.shape[0], -1)
+    rows, cols = np.nonzero(cost < max_cost)
+    taken = set()
+    for k in np.argsort(cost[rows, cols], kind="stable"):
+        row, col = rows[k], cols[k]
+        if result[row] < 0 and col not in taken:
+            result[row] = col
+            taken.add(col)
+            if len(taken) == len(result):
+                break
+    return result
+
+
+def hungarian_match(cost: np.ndarray, max_cost: float) -> np.ndarray:
+    """匈牙利算法：总代价最小的一一匹配，代价不小于 max_cost 的配对视为未分配"""
+    n, m = cost.shape
+    if n == 0 or m == 0:
+        return np.full(n, -1)
+    if n > m:
+        # 行多于列时转置求解，再换回行的视角
+        result = np.full(n, -1)
+        for col, row in enumerate(hungarian_match(cost.T, max_cost)):
+            if row >= 0:
+                result[row] = col
+        return result
+
+    # 超出范围的配对用一个足够大的代价代替，保证算法有解
+    a = np.where(cost < max_cost, cost, max_cost * (n + 1) + 1.0)
+
+    # 最短增广路径法（行数不多于列数），下标 0 为虚拟列
+    u = np.zeros(n + 1)
+    v = np.zeros(m + 1)
+    p = np.zeros(m + 1, dtype=int)     # 列 -> 匹配的行（从 1 开始，0 表示未匹配）
+    way = np.zeros(m + 1, dtype=int)   # 增广路径上的前驱列
+    for i in range(1, n + 1):
+        p[0] = i
+        j0 = 0
+        minv = np.full(m + 1, np.inf)
+        used = np.zeros(m + 1, dtype=bool)
+        while True:
+            used[j0] = True
+            free = ~used[1:]
+            reduced = a[p[j0] - 1] - u[p[j0]] - v[1:]
+            better = free & (reduced < minv[1:])
+            minv[1:][better] = reduced[better]
+            way[1:][better] = j0
+
+            candidates = np.where(free, minv[1:], np.inf)
+            j1 = int(np.argmin(candidates)) + 1
+            delta = candidates[j1 - 1]
+            u[p[used]] += delta
+            v[used] -= delta
+            minv[1:][free] -= delta
+            j0 = j1
+            if p[j0] == 0:
+                break
+
+        # 沿增广路径翻转匹配
+        while j0:
+            j1 = way[j0]
+            p[j0] = p[j1]
+            j0 = j1
+
+    result = np.full(n, -1)
+    for col in range(1, m + 1):
+        row = p[col] - 1
+        if row >= 0 and cost[row, col - 1] < max_cost:
+            result[row] = col - 1
+    return result
+
+
+MATCHERS = {"greedy": greedy_match, "hungarian": hungarian_match}
+
+
+def match_targets(cost: np.ndarray, max_cost: float, method: str = "greedy") -> np.ndarray:
+    """按指定方式为每行分配互不相同的列，返回每行分配到的列（-1 表示未分配）"""
+    if method not in MATCHERS:
+        raise ValueError(f"未知的分配方式: {method}")
+    return MATCHERS[method](cost, max_cost)
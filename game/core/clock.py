@@ -8,31 +8,64 @@ clock.py
 
 import pygame
 
-from game.utils import (color, get_font)
+from game.utils import (color, get_font, render_text, FRAME_TIME)
+
+
+class SimulationClock:
+    """固定步长的模拟时钟，每个 tick 为所有子系统提供同一个 dt，倍速通过每帧运行更多 tick 实现"""
+
+    def __init__(self, step: float = FRAME_TIME, budget: float = 10.0):
+        self.step = step              # 每个 tick 的时长（毫秒）
+        self.budget = budget          # 每帧用于模拟的真实时间预算（毫秒），超出后丢弃积压
+        self.time = 0.0               # 累计模拟时间
+        self.tick_count = 0           # 累计 tick 数
+        self.accumulator = 0.0        # 尚未消耗的模拟时间
+        self.effective_speed = 1.0    # 实际达到的倍速（平滑后），超出预算时低于所选倍速
+
+    def ticks_due(self, real_time: float, speed: int = 1) -> int:
+        """根据经过的真实时间和倍速，计算本帧应推进的 tick 数"""
+        self.accumulator += real_time * speed
+        ticks = int(self.accumulator // self.step)
+        self.accumulator -= ticks * self.step
+        return ticks
+
+    def drop_backlog(self) -> None:
+        """丢弃积压的时间（超出预算时调用，避免越追越慢）"""
+        self.accumulator = 0.0
+
+    def record(self, real_time: float, ticks: int, smoothing: float = 0.1) -> None:
+        """记录本帧实际推进的 tick 数，按指数平滑更新实际倍速"""
+        if real_time <= 0:
+            return
+        rate = ticks * self.step / real_time
+        self.effective_speed += (rate - self.effective_speed) * smoothing
+
+    def tick(self, pause: bool) -> float:
+        """推进一个 tick，返回本 tick 的模拟时长（暂停时为 0）"""
+        if pause:
+            return 0
+        self.time += self.step
+        self.tick_count += 1
+        return self.step
 
 
 class Clock:
     """管理游戏暂停、倍速等事件"""
-    
-    def __init__(self, initial_speed: int, speeds: tuple[int, ...]):
+
+    def __init__(self, initial_speed: int, speeds: tuple[int, ...], headless: bool = False):
         self.years = 0
         self.months = 3
         self.month_time = 5000
         self.speed = initial_speed
         self.speeds = speeds
-        self.font = get_font(name='SimSun', size=24)
-        self.last_update_time = pygame.time.get_ticks()
+        self.font = None if headless else get_font(name='SimSun', size=24)
         self.elapsed_time = 0
 
-    def update(self, pause: bool) -> None:
+    def update(self, delta_time: float) -> None:
         """更新时间"""
-        # 活跃时间检查
-        now = pygame.time.get_ticks()
-        delta_time = now - self.last_update_time
-        self.last_update_time = now
-        if pause:
+        # 暂停时 delta_time 为 0
+        if not delta_time:
             return
-        delta_time *= self.speed
         self.elapsed_time += delta_time
 
         if self.elapsed_time >= self.month_time:
@@ -46,7 +79,7 @@ class Clock:
     def draw(self, screen: pygame.surface.Surface) -> None:
         """绘制时间"""
         time_text = f"{self.years}年{self.months}月"
-        text_surface = self.font.render(time_text, True, color.BLACK)
+        text_surface = render_text(self.font, time_text, color.BLACK)
         screen.blit(text_surface, (11, 15))
 
     def change_speed(self) -> None:
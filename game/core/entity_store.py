@@ -0,0 +1,84 @@
+"""
+entity_store.py
+
+功能: 实体注册表，提供稳定的整数 ID、O(1) 删除与帧末统一删除
+时间: 2026/10/17
+版本: 1.0
+"""
+
+from __future__ import annotations
+from typing import Any, Iterable, Iterator, Optional
+
+
+Entity = Any   # 任意实体，注册后获得 eid 属性
+
+
+class EntityStore:
+    """以交换删除的方式存储实体，被标记死亡的实体在帧末统一移除"""
+
+    def __init__(self, entities: Iterable[Entity] = ()):
+        self.items: list[Entity] = []          # 紧凑存储的实体
+        self.slots: dict[int, int] = {}        # 实体 ID -> 存储位置
+        self.pending: dict[int, Entity] = {}   # 待删除的实体（按标记顺序）
+        self.next_id = 0                       # 下一个分配的 ID
+        self.extend(entities)
+
+    def __len__(self) -> int:
+        """实体数量（包含本帧已标记、尚未移除的实体）"""
+        return len(self.items)
+
+    def __iter__(self) -> Iterator[Entity]:
+        return iter(self.items)
+
+    def __contains__(self, entity: Entity) -> bool:
+        slot = self.slots.get(getattr(entity, "eid", None))
+        return slot is not None and self.items[slot] is entity
+
+    def get(self, eid: int) -> Optional[Entity]:
+        """根据 ID 获取实体"""
+        slot = self.slots.get(eid)
+        return None if slot is None else self.items[slot]
+
+    def add(self, entity: Entity) -> int:
+        """注册实体并分配 ID"""
+        entity.eid = self.next_id
+        self.next_id += 1
+        self.slots[entity.eid] = len(self.items)
+        self.items.append(entity)
+        return entity.eid
+
+    def extend(self, entities: Iterable[Entity]) -> None:
+        """批量注册实体"""
+        for entity in entities:
+            self.add(entity)
+
+    def restore(self, entities: Iterable[Entity], next_id: int) -> None:
+        """按原有 ID 和顺序重新载入实体（用于从快照恢复）"""
+        self.items.clear()
+        self.slots.clear()
+        self.pending.clear()
+        for entity in entities:
+            self.slots[entity.eid] = len(self.items)
+            self.items.append(entity)
+        self.next_id = next_id
+
+    def kill(self, entity: Entity) -> None:
+        """标记实体死亡，帧末统一移除（重复标记无影响）"""
+        if entity in self:
+            self.pending[entity.eid] = entity
+
+    def is_alive(self, entity: Entity) -> bool:
+        """实体已注册且未被标记死亡"""
+        return entity in self and entity.eid not in self.pending
+
+    def flush(self) -> list[Entity]:
+        """移除所有已标记的实体，返回被移除的实体"""
+        removed = list(self.pending.values())
+        for entity in removed:
+            slot = self.slots.pop(entity.eid)
+            last = self.items.pop()
+            if last is not entity:
+                self.items[slot] = last
+                self.slots[last.eid] = slot
+        self.pending.clear()
+        return removed
@@ -0,0 +1,183 @@
+"""
+flow_field.py
+
+功能: 粗网格势场，源增减或跨格移动时增量叠加，按梯度以 O(1) 采样移动方向
+时间: 2026/10/17
+版本: 1.0
+"""
+
+from __future__ import annotations
+from typing import Any, Iterable, Optional
+import math
+
+import numpy as np
+
+from game.utils import RabbitConfig
+
+
+Entity = Any   # 任意带有 x、y 坐标的实体
+
+SCALE = 1 << 20   # 核函数的定点放大倍数（整数累加，增删顺序不影响结果）
+
+
+class FlowField:
+    """每个源按半径内递减的核叠加到周围格子，只有源跨格移动时才重新叠加"""
+
+    def __init__(self, width: float, height: float, cell_size: int, radius: float):
+        self.cell_size = cell_size   # 格子边长
+        self.cols = max(1, math.ceil(width / cell_size))
+        self.rows = max(1, math.ceil(height / cell_size))
+        self.sources: dict[Entity, tuple[int, int]] = {}   # 源 -> 所在格子
+        self.buckets: dict[tuple[int, int], set[Entity]] = {}   # 格子 -> 其中的源（查找最近的源）
+
+        self.radius = 0.0   # 核半径（半径外的格子不受影响）
+        self.reach = 0      # 核覆盖的格子范围
+        self.kernel: Optional[np.ndarray] = None      # (2 * reach + 1) 见方的整数核
+        self.potential: Optional[np.ndarray] = None   # 势场，四周各留出 reach 格，叠加时不必裁剪
+        self.set_radius(radius)
+
+    def __len__(self) -> int:
+        return len(self.sources)
+
+    def __contains__(self, entity: Entity) -> bool:
+        return entity in self.sources
+
+    def set_radius(self, radius: float) -> None:
+        """修改核半径（半径不变时忽略），并按新的核重新叠加所有源"""
+        if radius <= 0:
+            raise ValueError(f"势场半径必须为正数: {radius}")
+        if radius == self.radius:
+            return
+        self.radius = radius
+        self.reach = math.ceil(radius / self.cell_size)
+
+        # 核函数 (1 - d / r)^2：越近越大，半径处降为 0；半径内的格子至少为 1，保证覆盖判断准确
+        offsets = np.arange(-self.reach, self.reach + 1) * self.cell_size
+        dist = np.hypot(offsets[:, None], offsets[None, :])
+        inside = dist < radius
+        kernel = np.maximum(np.round((1 - dist / radius) ** 2 * SCALE), 1)
+        self.kernel = np.where(inside, kernel, 0).astype(np.int64)
+
+        self.potential = np.zeros((self.rows + 2 * self.reach, self.cols + 2 * self.reach), dtype=np.int64)
+        for cell in self.sources.values():
+            self._stamp(cell, 1)
+
+    def _cell_of(self, x: float, y: float) -> tuple[int, int]:
+        """计算坐标所在的格子（限制在网格范围内）"""
+        col = min(max(int(x // self.cell_size), 0), self.cols - 1)
+        row = min(max(int(y // self.cell_size), 0), self.rows - 1)
+        return col, row
+
+    def _stamp(self, cell: tuple[int, int], sign: int) -> None:
+        """在格子周围叠加（sign=1）或撤销（sign=-1）一个核"""
+        col, row = cell
+        size = 2 * self.reach + 1
+        window = self.potential[row:row + size, col:col + size]
+        if sign > 0:
+            window += self.kernel
+        else:
+            window -= self.kernel
+
+    def add(self, entity: Entity) -> None:
+        """加入一个源（已存在时按当前位置更新）"""
+        self.update(entity)
+
+    def remove(self, entity: Entity) -> None:
+        """移除一个源（不存在时忽略）"""
+        cell = self.sources.pop(entity, None)
+        if cell is not None:
+            self._stamp(cell, -1)
+            self._unbucket(entity, cell)
+
+    def update(self, entity: Entity) -> None:
+        """源移动后更新势场，只有跨格时才重新叠加"""
+        cell = self._cell_of(entity.x, entity.y)
+        old_cell = self.sources.get(entity)
+        if old_cell == cell:
+            return
+        if old_cell is not None:
+            self._stamp(old_cell, -1)
+            self._unbucket(entity, old_cell)
+        self._stamp(cell, 1)
+        self.sources[entity] = cell
+        self.buckets.setdefault(cell, set()).add(entity)
+
+    def _unbucket(self, entity: Entity, cell: tuple[int, int]) -> None:
+        """从格子的源集合中移除（集合为空时删除该格子）"""
+        bucket = self.buckets[cell]
+        bucket.discard(entity)
+        if not bucket:
+            del self.buckets[cell]
+
+    def sync(self, entities: Iterable[Entity]) -> None:
+        """与实体列表对齐：更新所有实体的位置，移除不在列表中的源"""
+        present = set()
+        for entity in entities:
+            self.update(entity)
+            present.add(entity)
+        for entity in [e for e in self.sources if e not in present]:
+            self.remove(entity)
+
+    def rebuild(self, entities: Iterable[Entity]) -> None:
+        """根据实体列表重建势场"""
+        self.sources.clear()
+        self.buckets.clear()
+        self.potential.fill(0)
+        for entity in entities:
+            self.add(entity)
+
+    def gradient(self, x: float, y: float) -> Optional[tuple[float, float]]:
+        """该位置所在格子的梯度（中心差分，指向势增大的方向），不在任何源的半径内时返回 None"""
+        col, row = self._cell_of(x, y)
+        r, c = row + self.reach, col + self.reach
+        potential = self.potential
+        if potential[r, c] <= 0:
+            return None
+        gx = int(potential[r, c + 1]) - int(potential[r, c - 1])
+        gy = int(potential[r + 1, c]) - int(potential[r - 1, c])
+        return gx / SCALE, gy / SCALE
+
+    def nearest(self, x: float, y: float) -> Optional[Entity]:
+        """核覆盖范围内离 (x, y) 最近的源（梯度为 0 时用于确定方向），没有时返回 None"""
+        col, row = self._cell_of(x, y)
+        best, best_dist = None, math.inf
+        for c in range(col - self.reach, col + self.reach + 1):
+            for r in range(row - self.reach, row + self.reach + 1):
+                for entity in self.buckets.get((c, r), ()):
+                    dist = (entity.x - x) ** 2 + (entity.y - y) ** 2
+                    if dist < best_dist:
+                        best, best_dist = entity, dist
+        return best
+
+
+class SteeringFields:
+    """兔子转向用的三个势场：食物吸引、治愈药草吸引、鳄鱼危险"""
+
+    def __init__(self, width: float, height: float, cell_size: int, config: RabbitConfig):
+        self.food = FlowField(width, height, cell_size, config.min_plant_distance)
+        self.medicine = FlowField(width, height, cell_size, config.min_plant_distance_infected)
+        self.danger = FlowField(width, height, cell_size, config.min_croc_distance)
+
+    def configure(self, config: RabbitConfig) -> None:
+        """势场半径跟随兔子的感知范围（科技树会修改）"""
+        self.food.set_radius(config.min_plant_distance)
+        self.medicine.set_radius(config.min_plant_distance_infected)
+        self.danger.set_radius(config.min_croc_distance)
+
+    def add_plant(self, plant: Entity) -> None:
+        """新植物加入食物场，治愈药草同时加入药草场"""
+        self.food.add(plant)
+        if plant.medicative:
+            self.medicine.add(plant)
+
+    def remove_plant(self, plant: Entity) -> None:
+        """植物死亡，从两个场中移除"""
+        self.food.remove(plant)
+        self.medicine.remove(plant)
+
+    def rebuild(self, plants: Iterable[Entity], crocodiles: Iterable[Entity]) -> None:
+        """根据植物和鳄鱼重建所有势场"""
+        plants = list(plants)
+        self.food.rebuild(plants)
+        self.medicine.rebuild(plant for plant in plants if plant.medicative)
+        self.danger.rebuild(crocodiles)
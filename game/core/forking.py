@@ -0,0 +1,99 @@
+"""
+forking.py
+
+功能: 世界分叉，从当前状态派生多个不同种子的子模拟，评估某个操作对结局分布的影响
+时间: 2026/10/17
+版本: 1.0
+"""
+
+from __future__ import annotations
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Optional
+
+from game.core import World
+from game.core.simulation import (OUTCOMES, SimulationResult, elapsed_months, run_world)
+from game.core.snapshot import (world_to_bytes, world_from_bytes)
+
+
+@dataclass
+class ForkJob:
+    """一个子模拟的参数"""
+
+    snapshot: bytes                 # 分叉点的世界快照
+    seed: int                       # 子模拟的随机种子
+    months: int                     # 向前模拟的月数
+    action: Optional[str] = None    # 分叉后立即使用的道具名称，None 表示不做任何操作
+
+
+@dataclass
+class ForkReport:
+    """同一操作下所有子模拟的结局分布"""
+
+    action: Optional[str]           # 使用的道具
+    results: list[SimulationResult]   # 各子模拟的结果
+
+    @property
+    def probabilities(self) -> dict[str, float]:
+        """各结局的概率"""
+        counter = Counter(r.outcome for r in self.results)
+        return {k: counter[k] / len(self.results) for k in OUTCOMES}
+
+    @property
+    def mean_survival_months(self) -> float:
+        """平均存活月数"""
+        return sum(r.survival_months for r in self.results) / len(self.results)
+
+
+def run_fork(job: ForkJob) -> SimulationResult:
+    """在当前进程中恢复快照、更换种子、执行操作，并向前模拟指定月数"""
+    world = world_from_bytes(job.snapshot, headless=True)
+    world.pause = False
+    world.reseed(job.seed)
+    if job.action is not None:
+        world.crafting_system.get_item(job.action).use_func()   # 直接生效，不消耗道具库存
+
+    target = elapsed_months(world) + job.months
+    return run_world(world, lambda w: elapsed_months(w) >= target, job.seed)
+
+
+def _check_forks(forks: int) -> None:
+    """子模拟数量至少为 1（结局概率和平均存活月数按子模拟数量求平均）"""
+    if forks < 1:
+        raise ValueError(f"子模拟数量必须至少为 1: {forks}")
+
+
+def _run_jobs(jobs: list[ForkJob], workers: Optional[int]) -> list[SimulationResult]:
+    """并行运行子模拟（workers=1 时在当前进程中运行）"""
+    if workers == 1:
+        return [run_fork(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(run_fork, jobs))
+
+
+def fork_world(
+        world: World, forks: int, months: int, action: Optional[str] = None,
+        seed: int = 0, workers: Optional[int] = None
+) -> ForkReport:
+    """从世界的当前状态分叉出 forks 个子模拟（快照传给各进程，不影响原世界）"""
+    _check_forks(forks)
+    snapshot = world_to_bytes(world)
+    jobs = [ForkJob(snapshot=snapshot, seed=seed + i, months=months, action=action) for i in range(forks)]
+    return ForkReport(action=action, results=_run_jobs(jobs, workers))
+
+
+def what_if(
+        world: World, action: str, forks: int = 16, months: int = 12,
+        seed: int = 0, workers: Optional[int] = None
+) -> tuple[ForkReport, ForkReport]:
+    """比较 "什么都不做" 与 "现在使用该道具" 的结局分布（两组使用相同的种子，一起调度）"""
+    _check_forks(forks)
+    snapshot = world_to_bytes(world)
+    jobs = [
+        ForkJob(snapshot=snapshot, seed=seed + i, months=months, action=chosen)
+        for chosen in (None, action)
+        for i in range(forks)
+    ]
+    results = _run_jobs(jobs, workers)
+    return ForkReport(action=None, results=results[:forks]), ForkReport(action=action, results=results[forks:])
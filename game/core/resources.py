@@ -8,17 +8,16 @@ resources.py
 
 import pygame
 
-from game.utils import get_font
+from game.utils import (get_font, render_text)
+from .scheduler import EventScheduler
 
 
 class ResourceManager:
     """管理游戏资源，实现三类资源的获取"""
 
-    eco_interval = 8000   # 随时间获得生态点
-    
     def __init__(
-            self, font_name: str = "SimSun", font_size: int = 20,
-            position: tuple[int, int] = (500, 20), test: int = 0
+            self, scheduler: EventScheduler, font_name: str = "SimSun", font_size: int = 20,
+            position: tuple[int, int] = (500, 20), test: int = 0, headless: bool = False
     ):
         self.leafium = 0    # 绿素：植物贡献
         self.animite = 0    # 兽能：动物贡献
@@ -27,10 +26,12 @@ class ResourceManager:
         if test:
             self.leafium = self.animite = self.ecopoint = 1000
 
-        self.active_time = 0
-        self.last_update_time = pygame.time.get_ticks()
+        self.eco_interval = 8000   # 随时间获得生态点
+        self.scheduler = scheduler
+        self.scheduler.register("resources.ecopoint", self.gain_ecopoint)
+        self.scheduler.schedule("resources.ecopoint", self.eco_interval)
 
-        self.font = get_font(font_name, font_size)
+        self.font = None if headless else get_font(font_name, font_size)
         self.position = position
 
     def gain_leafium(self, amount: int = 1) -> None:
@@ -41,23 +42,13 @@ class ResourceManager:
         """增加兽能"""
         self.animite += amount
 
-    def update_ecopoints(self, time_speed: int, pause: bool) -> None:
-        """更新生态点"""
-        # 活跃时间检查
-        now = pygame.time.get_ticks()
-        delta_time = now - self.last_update_time
-        self.last_update_time = now
-        if pause:
-            return
-
-        delta_time *= time_speed
-        self.active_time += delta_time
-        if self.active_time > self.eco_interval:
-            self.active_time = 0
-            self.ecopoint += 1
+    def gain_ecopoint(self) -> None:
+        """定时获得一个生态点，并安排下一次"""
+        self.ecopoint += 1
+        self.scheduler.schedule("resources.ecopoint", self.eco_interval)
 
     def draw(self, screen: pygame.surface.Surface) -> None:
         """绘制资源"""
         text = f"绿素 {self.leafium}  兽能 {self.animite}  生态点 {self.ecopoint}"
-        surface = self.font.render(text, True, (0, 0, 0))
+        surface = render_text(self.font, text, (0, 0, 0))
         screen.blit(surface, self.position)
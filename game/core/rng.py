@@ -0,0 +1,44 @@
+"""
+rng.py
+
+功能: 由世界种子派生各子系统独立的随机数流
+时间: 2026/10/17
+版本: 1.0
+"""
+
+from typing import Optional
+import random
+
+import numpy as np
+
+
+class RandomStreams:
+    """每个子系统按名称获得独立的随机数生成器，互不干扰，同一种子下可完全复现"""
+
+    def __init__(self, seed: Optional[int] = None):
+        # 未指定种子时随机选取一个，并记录下来，便于事后复现
+        self.seed = seed if seed is not None else random.randrange(2 ** 63)
+        self.streams: dict[str, random.Random] = {}
+
+    def _derive(self, name: str) -> int:
+        """由世界种子和子系统名称派生子种子"""
+        return random.Random(f"{self.seed}-{name}").getrandbits(64)
+
+    def get(self, name: str) -> random.Random:
+        """获取子系统的随机数生成器（同名返回同一个）"""
+        if name not in self.streams:
+            self.streams[name] = random.Random(self._derive(name))
+        return self.streams[name]
+
+    def numpy(self, name: str) -> np.random.Generator:
+        """为子系统创建 NumPy 随机数生成器"""
+        return np.random.default_rng(self._derive(f"{name}-numpy"))
+
+    def get_state(self) -> dict[str, tuple]:
+        """所有已创建随机数流的内部状态"""
+        return {name: rng.getstate() for name, rng in self.streams.items()}
+
+    def set_state(self, state: dict[str, tuple]) -> None:
+        """恢复随机数流的内部状态"""
+        for name, rng_state in state.items():
+            self.get(name).setstate(rng_state)
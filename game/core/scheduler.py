@@ -0,0 +1,92 @@
+"""
+scheduler.py
+
+功能: 定时事件调度器，基于模拟时钟和小顶堆，只在事件到期时触发回调
+时间: 2026/10/17
+版本: 1.0
+"""
+
+from __future__ import annotations
+from typing import Any, Callable, Optional
+import heapq
+
+
+class EventScheduler:
+    """按到期时间排序的事件队列，每个事件以名称区分，同名事件同一时刻最多一个"""
+
+    def __init__(self):
+        self.time = 0.0                                    # 当前调度时间（与模拟时钟同步）
+        self.queue: list[list] = []                        # 小顶堆：[到期时间, 序号, 名称, 是否有效]
+        self.events: dict[str, list] = {}                  # 名称 -> 有效的事件条目
+        self.handlers: dict[str, Callable[[], None]] = {}  # 名称 -> 回调
+        self.counter = 0                                   # 序号，保证同一时刻先安排的先触发
+
+    def register(self, key: str, callback: Callable[[], None]) -> None:
+        """注册事件回调（回调不参与快照，恢复时由各子系统重新注册）"""
+        self.handlers[key] = callback
+
+    def schedule(self, key: str, delay: float) -> None:
+        """在 delay 毫秒后触发事件，已安排的同名事件会被取代"""
+        self.cancel(key)
+        entry = [self.time + delay, self.counter, key, True]
+        self.counter += 1
+        self.events[key] = entry
+        heapq.heappush(self.queue, entry)
+
+    def cancel(self, key: str) -> None:
+        """取消事件（惰性删除，出堆时跳过）"""
+        entry = self.events.pop(key, None)
+        if entry is not None:
+            entry[3] = False
+
+    def postpone(self, key: str, delay: float) -> None:
+        """推迟事件（delay 为负时提前），事件不存在时则新安排一个"""
+        self.schedule(key, self.remaining(key) + delay)
+
+    def is_scheduled(self, key: str) -> bool:
+        """事件是否在等待触发"""
+        return key in self.events
+
+    def remaining(self, key: str) -> float:
+        """事件距离触发的剩余时间，未安排时为 0"""
+        entry = self.events.get(key)
+        return 0 if entry is None else max(0.0, entry[0] - self.time)
+
+    def advance(self, now: float) -> int:
+        """推进到 now，按到期顺序触发所有到期事件，返回触发的事件数"""
+        fired = 0
+        queue = self.queue
+        while queue and queue[0][0] <= now:
+            due, _, key, active = heapq.heappop(queue)
+            if not active:
+                continue
+            del self.events[key]
+
+            # 触发时把调度时间对齐到事件的到期时刻，回调中重新安排的周期事件不会累积误差
+            self.time = due
+            self.handlers[key]()
+            fired += 1
+        self.time = now
+        return fired
+
+    def get_state(self) -> dict[str, Any]:
+        """调度器的状态（仅包含有效事件，不含回调）"""
+        return {
+            "time": self.time,
+            "counter": self.counter,
+            "events": sorted((entry[0], entry[1], key) for key, entry in self.events.items()),
+        }
+
+    def set_state(self, state: dict[str, Any]) -> None:
+        """恢复调度器的状态，替换当前所有事件"""
+        self.time = state["time"]
+        self.counter = state["counter"]
+        self.events = {key: [due, seq, key, True] for due, seq, key in state["events"]}
+        self.queue = list(self.events.values())
+        heapq.heapify(self.queue)
+
+    def next_due(self) -> Optional[float]:
+        """最近一个有效事件的到期时间"""
+        while self.queue and not self.queue[0][3]:
+            heapq.heappop(self.queue)
+        return self.queue[0][0] if self.queue else None
@@ -0,0 +1,128 @@
+"""
+simulation.py
+
+功能: 无界面批量模拟，在多进程中运行相互独立的世界并汇总结果
+时间: 2026/10/17
+版本: 1.0
+"""
+
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, fields, replace
+from typing import Any, Callable, Iterable, Optional
+
+from game.core import World
+from game.utils import (MapConfig, RabbitConfig, CrocodileConfig, PlantConfig, SeasonConfig)
+
+
+# 配置前缀 -> (World 参数名, 配置类)
+CONFIG_CLASSES = {
+    "rabbit": ("rabbit_config", RabbitConfig),
+    "croc": ("croc_config", CrocodileConfig),
+    "plant": ("plant_config", PlantConfig),
+    "season": ("season_config", SeasonConfig),
+}
+
+OUTCOMES = {"ending1": "植物灭绝", "ending2": "兔子灭绝", "ending3": "鳄鱼灭绝", "survived": "存活"}
+
+
+@dataclass
+class SimulationJob:
+    """一次模拟的参数"""
+
+    seed: int                       # 随机种子
+    overrides: dict[str, Any] = field(default_factory=dict)   # 配置覆盖，如 {"rabbit.ave_speed": 1.0}
+    max_years: int = 10             # 最长模拟年数
+    vectorized: bool = False        # 是否使用 NumPy 批量移动引擎
+
+
+@dataclass
+class SimulationResult:
+    """一次模拟的结果"""
+
+    seed: int                       # 随机种子
+    overrides: dict[str, Any]       # 配置覆盖
+    outcome: str                    # 结局：ending1 / ending2 / ending3 / survived
+    years: int                      # 结束时的年份
+    months: int                     # 结束时的月份
+    survival_months: int            # 存活的总月数
+    ticks: int                      # 模拟的 tick 数
+    peak_plants: int                # 植物数量峰值
+    peak_rabbits: int               # 兔子数量峰值
+    peak_crocodiles: int            # 鳄鱼数量峰值
+
+
+def build_configs(overrides: dict[str, Any]) -> dict[str, Any]:
+    """根据 "前缀.字段" 形式的覆盖项创建配置，返回可直接传给 World 的参数"""
+    grouped: dict[str, dict[str, Any]] = {}
+    for key, value in overrides.items():
+        prefix, _, name = key.partition(".")
+        if prefix not in CONFIG_CLASSES or not name:
+            raise KeyError(f"未知的配置项: {key}")
+        grouped.setdefault(prefix, {})[name] = value
+
+    configs = {}
+    for prefix, values in grouped.items():
+        arg_name, config_cls = CONFIG_CLASSES[prefix]
+        names = {f.name for f in fields(config_cls)}
+        for name in values:
+            if name not in names:
+                raise KeyError(f"未知的配置项: {prefix}.{name}")
+
+        # 派生的平方距离随原距离一起更新
+        for name in list(values):
+            square = f"{name}_square"
+            if square in names and square not in values:
+                values[square] = values[name] ** 2
+
+        configs[arg_name] = replace(config_cls(), **values)
+    return configs
+
+
+def elapsed_months(world: World) -> int:
+    """世界已经历的总月数（游戏从第 0 年 3 月开始）"""
+    return world.clock.years * 12 + world.clock.months - 3
+
+
+def run_world(
+        world: World, done: Callable[[World], bool], seed: int, overrides: Optional[dict[str, Any]] = None
+) -> SimulationResult:
+    """推进世界，直到出现结局或 done(world) 为真，返回模拟结果"""
+    peak_plants = len(world.plants)
+    peak_rabbits = len(world.rabbits)
+    peak_crocodiles = len(world.crocodiles)
+    while not world.end and not done(world):
+        world.step()
+        peak_plants = max(peak_plants, len(world.plants))
+        peak_rabbits = max(peak_rabbits, len(world.rabbits))
+        peak_crocodiles = max(peak_crocodiles, len(world.crocodiles))
+
+    outcome = "survived"
+    for ending in ("ending1", "ending2", "ending3"):
+        if getattr(world, ending):
+            outcome = ending
+
+    return SimulationResult(
+        seed=seed, overrides=overrides or {}, outcome=outcome,
+        years=world.clock.years, months=world.clock.months, survival_months=elapsed_months(world),
+        ticks=world.sim_clock.tick_count,
+        peak_plants=peak_plants, peak_rabbits=peak_rabbits, peak_crocodiles=peak_crocodiles,
+    )
+
+
+def run_simulation(job: SimulationJob) -> SimulationResult:
+    """运行一个无界面世界，直到出现结局或经历的时间达到年数上限"""
+    world = World(
+        MapConfig.width, MapConfig.height, vectorized=job.vectorized, headless=True,
+        seed=job.seed, **build_configs(job.overrides)
+    )
+    return run_world(world, lambda w: elapsed_months(w) >= job.max_years * 12, job.seed, job.overrides)
+
+
+def run_batch(jobs: Iterable[SimulationJob], workers: Optional[int] = None) -> list[SimulationResult]:
+    """在进程池中并行运行多次模拟，结果顺序与任务顺序一致（workers=1 时在当前进程中运行）"""
+    jobs = list(jobs)
+    if workers == 1:
+        return [run_simulation(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(run_simulation, jobs))
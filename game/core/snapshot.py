@@ -0,0 +1,213 @@
+"""
+snapshot.py
+
+功能: 世界快照，将完整的模拟状态序列化为紧凑的二进制数据，并能快速恢复
+时间: 2026/10/17
+版本: 1.0
+"""
+
+from __future__ import annotations
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Iterable
+import pickle
+import zlib
+
+import numpy as np
+
+from game.core import World
+from game.entities import (Animal, Plant, Rabbit, Crocodile, EngineField)
+
+
+SNAPSHOT_VERSION = 5
+EXCLUDED_ATTRS = {"config", "rng", "_engine", "_slot"}   # 实体上不属于状态的属性
+
+SEASON_ATTRS = ("index", "current", "color", "target_color", "is_raining", "rain_duration")
+DISASTER_ATTRS = ("disaster_interval", "mid_state", "current_disaster_text", "active_draw_time")
+RESOURCE_ATTRS = ("leafium", "animite", "ecopoint", "eco_interval")
+CLOCK_ATTRS = ("years", "months", "month_time", "speed", "speeds", "elapsed_time")
+SIM_CLOCK_ATTRS = ("time", "tick_count", "accumulator")
+WORLD_ATTRS = ("pause", "end", "ending1", "ending2", "ending3", "assignment_time")
+
+
+def _pack_column(values: list) -> Any:
+    """数值列压缩为 NumPy 数组，其余保持列表"""
+    if values and all(type(v) in (int, float, bool) for v in values):
+        arr = np.asarray(values)
+        if arr.dtype.kind in "iufb":
+            return arr
+    return values
+
+
+def _capture_entities(entities: Iterable[Any], fields: Iterable[str] = ()) -> dict[str, Any]:
+    """按列保存实体的全部属性（包括托管在引擎中的属性）"""
+    entities = list(entities)
+    names = list(fields)
+    for entity in entities:
+        for name in vars(entity):
+            if name not in EXCLUDED_ATTRS and name not in names:
+                names.append(name)
+
+    columns = {}
+    for name in names:
+        columns[name] = _pack_column([getattr(entity, name) for entity in entities])
+    return {"count": len(entities), "columns": columns}
+
+
+def _restore_entities(cls: type, data: dict[str, Any], **shared: Any) -> list[Any]:
+    """根据按列保存的属性重建实体"""
+    columns = {name: col.tolist() if isinstance(col, np.ndarray) else col for name, col in data["columns"].items()}
+    entities = []
+    for i in range(data["count"]):
+        entity = cls.__new__(cls)
+        for name, value in shared.items():
+            setattr(entity, name, value)
+        for name, col in columns.items():
+            setattr(entity, name, col[i])
+        entities.append(entity)
+    return entities
+
+
+def _engine_fields(species: type[Animal]) -> list[str]:
+    """物种上由 EngineField 托管的属性名"""
+    return [name for klass in species.__mro__ for name, attr in vars(klass).items() if isinstance(attr, EngineField)]
+
+
+def capture_state(world: World) -> dict[str, Any]:
+    """提取世界的完整模拟状态（纯数据，不含贴图、字体等资源）"""
+    state = {
+        "version": SNAPSHOT_VERSION,
+        "width": world.width,
+        "height": world.height,
+        "seed": world.seed,
+        "seeded": world.seeded,
+        "options": {name: value for name, value in world.options.items() if name != "headless"},
+        "world": {name: getattr(world, name) for name in WORLD_ATTRS},
+        "rngs": world.rngs.get_state(),
+        "configs": {
+            "rabbit_config": asdict(world.rabbit_config),
+            "croc_config": asdict(world.croc_config),
+            "plant_config": asdict(world.plant_config),
+            "season_config": asdict(world.season_config),
+        },
+        "clock": {name: getattr(world.clock, name) for name in CLOCK_ATTRS},
+        "sim_clock": {name: getattr(world.sim_clock, name) for name in SIM_CLOCK_ATTRS},
+        "scheduler": world.scheduler.get_state(),
+        "epidemic": world.epidemic.get_state(),
+        "season": {name: getattr(world.season, name) for name in SEASON_ATTRS},
+        "disaster": {name: getattr(world.disaster, name) for name in DISASTER_ATTRS},
+        "resources": {name: getattr(world.resource_manager, name) for name in RESOURCE_ATTRS},
+        "techs": {area: [(t["unlocked"], t["applied"]) for t in techs] for area, techs in world.tech_tree.techs.items()},
+        "buildings": {name: b.visible for name, b in world.tech_tree.buildings.items()},
+        "items": [(item.quantity, item.is_crafting) for item in world.crafting_system.items],
+        "plant_manager": {"active_time": world.plant_manager.active_time},
+        "plants": _capture_entities(world.plants),
+        "rabbits": _capture_entities(world.rabbits, _engine_fields(Rabbit)),
+        "crocodiles": _capture_entities(world.crocodiles, _engine_fields(Crocodile)),
+        "next_ids": (world.plants.next_id, world.rabbits.next_id, world.crocodiles.next_id),
+    }
+
+    # 空位采样网格的可用列表顺序会影响之后的采样结果
+    sampler = world.plant_manager.sampler
+    state["sampler"] = {"free": list(sampler.free), "exhausted": np.asarray(sampler.exhausted)}
+
+    # 引擎中的槽位顺序会影响之后的随机数分配
+    if world.vectorized:
+        state["engines"] = {
+            name: {
+                "order": [animal.eid for animal in engine.animals],
+                "rng": engine.rng.bit_generator.state,
+                "speeds": (engine.ave_speed, engine.min_speed, engine.max_speed),
+            }
+            for name, engine in (("rabbit", world.rabbit_engine), ("crocodile", world.croc_engine))
+        }
+    return state
+
+
+def restore_state(state: dict[str, Any], headless: bool = False) -> World:
+    """根据模拟状态重建世界"""
+    if state["version"] != SNAPSHOT_VERSION:
+        raise ValueError(f"不支持的快照版本: {state['version']}")
+
+    # 按原有构造参数重建（重置世界时仍回到科技生效前的配置），再原地恢复当前配置，各子系统持有的引用不变
+    world = World(state["width"], state["height"], headless=headless, seed=state["seed"], **state["options"])
+    world.seeded = state["seeded"]
+    for name, values in state["configs"].items():
+        vars(getattr(world, name)).update(values)
+    world.rngs.set_state(state["rngs"])
+
+    for target, key, names in (
+            (world, "world", WORLD_ATTRS), (world.clock, "clock", CLOCK_ATTRS),
+            (world.sim_clock, "sim_clock", SIM_CLOCK_ATTRS), (world.season, "season", SEASON_ATTRS),
+            (world.disaster, "disaster", DISASTER_ATTRS), (world.resource_manager, "resources", RESOURCE_ATTRS),
+    ):
+        for name in names:
+            setattr(target, name, state[key][name])
+    world.scheduler.set_state(state["scheduler"])   # 替换构造时安排的初始事件
+    world.epidemic.set_state(state["epidemic"])
+    if world.season.is_raining and not headless:
+        world.season.spawn_raindrops()
+
+    # 科技树和道具
+    for area, flags in state["techs"].items():
+        for tech, (unlocked, applied) in zip(world.tech_tree.techs[area], flags):
+            tech["unlocked"], tech["applied"] = unlocked, applied
+    for name, visible in state["buildings"].items():
+        world.tech_tree.buildings[name].visible = visible
+    for item, (quantity, is_crafting) in zip(world.crafting_system.items, state["items"]):
+        item.quantity, item.is_crafting = quantity, is_crafting
+
+    # 实体
+    plant_next, rabbit_next, croc_next = state["next_ids"]
+    plants = _restore_entities(Plant, state["plants"])
+    rabbits = _restore_entities(Rabbit, state["rabbits"], config=world.rabbit_config, rng=world.rngs.get("rabbit"))
+    crocodiles = _restore_entities(
+        Crocodile, state["crocodiles"], config=world.croc_config, rng=world.rngs.get("crocodile")
+    )
+    world.plants.restore(plants, plant_next)
+    world.rabbits.restore(rabbits, rabbit_next)
+    world.crocodiles.restore(crocodiles, croc_next)
+
+    # 植物管理器、空位采样网格、空间网格和势场
+    manager = world.plant_manager
+    manager.active_time = state["plant_manager"]["active_time"]
+    sampler = manager.sampler
+    sampler.rebuild(plants)
+    sampler.exhausted = state["sampler"]["exhausted"].tolist()
+    sampler.free = list(state["sampler"]["free"])
+    sampler.free_index = [-1] * len(sampler.free_index)
+    for pos, idx in enumerate(sampler.free):
+        sampler.free_index[idx] = pos
+    world.plant_grid.rebuild(plants)
+    world.fields.rebuild(plants, crocodiles)
+
+    # 批量移动引擎
+    if world.vectorized:
+        for name, engine, store in (
+                ("rabbit", world.rabbit_engine, world.rabbits), ("crocodile", world.croc_engine, world.crocodiles)
+        ):
+            data = state["engines"][name]
+            engine.sync(store.get(eid) for eid in data["order"])
+            engine.rng.bit_generator.state = data["rng"]
+            engine.ave_speed, engine.min_speed, engine.max_speed = data["speeds"]
+    return world
+
+
+def world_to_bytes(world: World, level: int = 6) -> bytes:
+    """将世界序列化为压缩的二进制数据"""
+    return zlib.compress(pickle.dumps(capture_state(world), protocol=pickle.HIGHEST_PROTOCOL), level)
+
+
+def world_from_bytes(data: bytes, headless: bool = False) -> World:
+    """从二进制数据恢复世界"""
+    return restore_state(pickle.loads(zlib.decompress(data)), headless=headless)
+
+
+def save_snapshot(world: World, path: str | Path) -> None:
+    """将世界快照写入文件"""
+    Path(path).write_bytes(world_to_bytes(world))
+
+
+def load_snapshot(path: str | Path, headless: bool = False) -> World:
+    """从文件读取世界快照"""
+    return world_from_bytes(Path(path).read_bytes(), headless=headless)
@@ -0,0 +1,432 @@
+"""
+spatial.py
+
+功能: 均匀空间哈希网格与空位采样网格，为实体提供邻近查询和放置位置
+时间: 2026/10/17
+版本: 1.0
+"""
+
+from __future__ import annotations
+from typing import Any, Callable, Iterable, Iterator, Optional
+import math
+import random
+
+import numpy as np
+
+
+Entity = Any   # 任意带有 x、y 坐标的实体
+
+
+def segment_distance(px: float, py: float, ax: float, ay: float, bx: float, by: float) -> float:
+    """点 P 到线段 AB 的最短距离"""
+    dx, dy = bx - ax, by - ay
+    length_square = dx * dx + dy * dy
+    if length_square == 0:
+        return math.hypot(px - ax, py - ay)
+    t = max(0.0, min(1.0, ((px - ax) * dx + (py - ay) * dy) / length_square))
+    return math.hypot(px - ax - t * dx, py - ay - t * dy)
+
+
+class SpatialGrid:
+    """将实体按坐标划分到固定大小的格子中，避免逐个遍历所有实体"""
+
+    def __init__(self, cell_size: int = 64):
+        self.cell_size = cell_size   # 格子边长
+        self.cells: dict[tuple[int, int], dict[Entity, tuple[float, float]]] = {}   # 格子 -> 格内实体及其坐标（有序）
+        self.entity_cells: dict[Entity, tuple[int, int]] = {}   # 实体 -> 所在格子
+        self.max_step = 0.0   # 自上次清空以来，单个实体一次移动的最大位移（供扫掠查询放宽范围）
+
+    def __len__(self) -> int:
+        return len(self.entity_cells)
+
+    def __contains__(self, entity: Entity) -> bool:
+        return entity in self.entity_cells
+
+    def __iter__(self) -> Iterator[Entity]:
+        return iter(self.entity_cells)
+
+    def _cell_of(self, x: float, y: float) -> tuple[int, int]:
+        """计算坐标所在的格子"""
+        return int(x // self.cell_size), int(y // self.cell_size)
+
+    def clear(self) -> None:
+        """清空网格"""
+        self.cells.clear()
+        self.entity_cells.clear()
+        self.max_step = 0.0
+
+    def rebuild(self, entities: Iterable[Entity]) -> None:
+        """根据实体列表重建网格"""
+        self.clear()
+        for entity in entities:
+            self.insert(entity)
+
+    def insert(self, entity: Entity) -> None:
+        """加入实体"""
+        x, y = entity.x, entity.y
+        cell = self._cell_of(x, y)
+        self.cells.setdefault(cell, {})[entity] = (x, y)
+        self.entity_cells[entity] = cell
+
+    def remove(self, entity: Entity) -> None:
+        """移除实体（不存在时忽略）"""
+        cell = self.entity_cells.pop(entity, None)
+        if cell is None:
+            return
+        bucket = self.cells[cell]
+        del bucket[entity]
+        if not bucket:
+            del self.cells[cell]
+
+    def update(self, entity: Entity) -> None:
+        """实体移动后更新所在格子与缓存坐标"""
+        x, y = entity.x, entity.y
+        old_cell = self.entity_cells.get(entity)
+        new_cell = self._cell_of(x, y)
+        if old_cell is not None:
+            old_x, old_y = self.cells[old_cell][entity]
+            self.max_step = max(self.max_step, math.hypot(x - old_x, y - old_y))
+        if old_cell == new_cell:
+            self.cells[new_cell][entity] = (x, y)
+            return
+        if old_cell is not None:
+            self.remove(entity)
+        self.cells.setdefault(new_cell, {})[entity] = (x, y)
+        self.entity_cells[entity] = new_cell
+
+    def query_radius(
+            self, x: float, y: float, radius: float, exclude: Optional[Entity] = None
+    ) -> list[tuple[Entity, float]]:
+        """查询半径内（不含边界）的所有实体，返回 (实体, 距离) 列表"""
+        result = []
+        cx, cy = self._cell_of(x, y)
+        reach = math.ceil(radius / self.cell_size)
+
+        for gx in range(cx - reach, cx + reach + 1):
+            for gy in range(cy - reach, cy + reach + 1):
+                bucket = self.cells.get((gx, gy))
+                if not bucket:
+                    continue
+                for entity, (ex, ey) in bucket.items():
+                    if entity is exclude:
+                        continue
+                    dist = math.hypot(x - ex, y - ey)
+                    if dist < radius:
+                        result.append((entity, dist))
+        return result
+
+    def query_radius_batch(
+            self, points: list[tuple[float, float]], radius: float
+    ) -> list[list[tuple[Entity, float]]]:
+        """批量半径查询：同一格子内的查询点共用一次邻域遍历，并用 NumPy 一次算出所有距离"""
+        results: list[list[tuple[Entity, float]]] = [[] for _ in points]
+        groups: dict[tuple[int, int], list[int]] = {}
+        for i, (x, y) in enumerate(points):
+            groups.setdefault(self._cell_of(x, y), []).append(i)
+        reach = math.ceil(radius / self.cell_size)
+
+        for (cx, cy), indices in groups.items():
+            # 收集该格子邻域内的候选实体
+            candidates, coords = [], []
+            for gx in range(cx - reach, cx + reach + 1):
+                for gy in range(cy - reach, cy + reach + 1):
+                    bucket = self.cells.get((gx, gy))
+                    if bucket:
+                        candidates.extend(bucket.keys())
+                        coords.extend(bucket.values())
+            if not candidates:
+                continue
+
+            # 查询点 × 候选实体的距离矩阵
+            coords = np.asarray(coords)
+            query = np.asarray([points[i] for i in indices])
+            dist = np.hypot(query[:, 0, None] - coords[None, :, 0], query[:, 1, None] - coords[None, :, 1])
+            for row, i in enumerate(indices):
+                for j in np.flatnonzero(dist[row] < radius):
+                    results[i].append((candidates[j], float(dist[row, j])))
+        return results
+
+    def query_segment(
+            self, ax: float, ay: float, bx: float, by: float, radius: float, exclude: Optional[Entity] = None
+    ) -> list[tuple[Entity, float]]:
+        """查询与线段 AB 距离小于半径的所有实体（扫掠检测），返回 (实体, 距离) 列表"""
+        result = []
+        x0, y0 = self._cell_of(min(ax, bx) - radius, min(ay, by) - radius)
+        x1, y1 = self._cell_of(max(ax, bx) + radius, max(ay, by) + radius)
+
+        for gx in range(x0, x1 + 1):
+            for gy in range(y0, y1 + 1):
+                bucket = self.cells.get((gx, gy))
+                if not bucket:
+                    continue
+                for entity, (ex, ey) in bucket.items():
+                    if entity is exclude:
+                        continue
+                    dist = segment_distance(ex, ey, ax, ay, bx, by)
+                    if dist < radius:
+                        result.append((entity, dist))
+        return result
+
+    def nearest(
+            self, x: float, y: float, radius: float, exclude: Optional[Entity] = None,
+            predicate: Optional[Callable[[Entity], bool]] = None
+    ) -> Optional[Entity]:
+        """由近及远逐圈查找半径内最近的实体"""
+        closest = None
+        closest_distance = radius
+        cx, cy = self._cell_of(x, y)
+        max_ring = math.ceil(radius / self.cell_size)
+
+        for ring in range(max_ring + 1):
+            # 该圈格子内的实体与查询点的最小可能距离已不小于当前最优，提前结束
+            if ring > 0 and (ring - 1) * self.cell_size >= closest_distance:
+                break
+
+            for cell in self._ring_cells(cx, cy, ring):
+                bucket = self.cells.get(cell)
+                if not bucket:
+                    continue
+                for entity, (ex, ey) in bucket.items():
+                    if entity is exclude or (predicate is not None and not predicate(entity)):
+                        continue
+                    dist = math.hypot(x - ex, y - ey)
+                    if dist < closest_distance:
+                        closest = entity
+                        closest_distance = dist
+        return closest
+
+    @staticmethod
+    def _ring_cells(cx: int, cy: int, ring: int) -> Iterator[tuple[int, int]]:
+        """遍历以 (cx, cy) 为中心、第 ring 圈上的格子"""
+        if ring == 0:
+            yield cx, cy
+            return
+        for gx in range(cx - ring, cx + ring + 1):
+            yield gx, cy - ring
+            yield gx, cy + ring
+        for gy in range(cy - ring + 1, cy + ring):
+            yield cx - ring, gy
+            yield cx + ring, gy
+
+
+class FreeSpaceSampler:
+    """背景占用网格：格子对角线等于最小间距，维护可用格子列表，以近似常数时间采样空位"""
+
+    def __init__(
+            self, width: float, height: float, min_distance: float,
+            margin: tuple[float, float] = (0, 0), attempts: int = 10, rng: Any = random
+    ):
+        self.min_distance = min_distance
+        self.min_distance_square = min_distance ** 2
+        self.cell_size = min_distance / math.sqrt(2)   # 每个格子内至多容纳一个点
+        self.attempts = attempts   # 每次采样的最大尝试次数
+        self.rng = rng
+
+        # 可放置区域
+        self.x0, self.y0 = margin
+        self.x1, self.y1 = width - margin[0], height - margin[1]
+        self.cols = max(1, math.ceil((self.x1 - self.x0) / self.cell_size))
+        self.rows = max(1, math.ceil((self.y1 - self.y0) / self.cell_size))
+        self.reach = math.ceil(min_distance / self.cell_size)   # 可能受影响的格子范围
+
+        n = self.cols * self.rows
+        self.occupants: dict[int, list[Entity]] = {}   # 格子 -> 格内的点
+        self.positions: dict[Entity, tuple[float, float]] = {}   # 点 -> 坐标
+        self.cover = [0] * n            # 被多少个点完全覆盖
+        self.exhausted = [False] * n    # 被多个点共同覆盖、探测后已无空位
+        self.free = list(range(n))      # 可用格子列表
+        self.free_index = list(range(n))   # 格子在可用列表中的位置，-1 表示不可用
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    @property
+    def is_full(self) -> bool:
+        """地图是否已没有可用空位"""
+        return not self.free
+
+    def _cell_of(self, x: float, y: float) -> tuple[int, int]:
+        """计算坐标所在的格子（限制在网格范围内）"""
+        col = min(max(int((x - self.x0) // self.cell_size), 0), self.cols - 1)
+        row = min(max(int((y - self.y0) // self.cell_size), 0), self.rows - 1)
+        return col, row
+
+    def _cell_bounds(self, col: int, row: int) -> tuple[float, float, float, float]:
+        """格子的边界（裁剪到可放置区域）"""
+        left = self.x0 + col * self.cell_size
+        top = self.y0 + row * self.cell_size
+        return left, top, min(left + self.cell_size, self.x1), min(top + self.cell_size, self.y1)
+
+    def _neighbors(self, col: int, row: int) -> Iterator[tuple[int, int]]:
+        """遍历可能与该格子内的点发生冲突的格子"""
+        for c in range(max(col - self.reach, 0), min(col + self.reach + 1, self.cols)):
+            for r in range(max(row - self.reach, 0), min(row + self.reach + 1, self.rows)):
+                yield c, r
+
+    def _covers(self, x: float, y: float, col: int, row: int) -> bool:
+        """判断点 (x, y) 是否让整个格子都不可放置"""
+        left, top, right, bottom = self._cell_bounds(col, row)
+        dx = max(abs(x - left), abs(x - right))
+        dy = max(abs(y - top), abs(y - bottom))
+        return dx * dx + dy * dy < self.min_distance_square
+
+    def _refresh(self, idx: int) -> None:
+        """根据占用与覆盖情况，更新格子是否可用"""
+        available = self.cover[idx] == 0 and not self.exhausted[idx] and idx not in self.occupants
+        pos = self.free_index[idx]
+        if available and pos < 0:
+            self.free_index[idx] = len(self.free)
+            self.free.append(idx)
+        elif not available and pos >= 0:
+            last = self.free.pop()
+            if last != idx:
+                self.free[pos] = last
+                self.free_index[last] = pos
+            self.free_index[idx] = -1
+
+    def _apply(self, x: float, y: float, delta: int) -> None:
+        """增减点 (x, y) 对周围格子的覆盖计数，移除点时重新开放周围已探测的格子"""
+        col, row = self._cell_of(x, y)
+        for c, r in self._neighbors(col, row):
+            idx = r * self.cols + c
+            if self._covers(x, y, c, r):
+                self.cover[idx] += delta
+            if delta < 0:
+                self.exhausted[idx] = False
+            self._refresh(idx)
+
+    def insert(self, entity: Entity) -> None:
+        """加入一个点"""
+        x, y = entity.x, entity.y
+        col, row = self._cell_of(x, y)
+        idx = row * self.cols + col
+        self.positions[entity] = (x, y)
+        self.occupants.setdefault(idx, []).append(entity)
+        self._refresh(idx)
+        self._apply(x, y, 1)
+
+    def remove(self, entity: Entity) -> None:
+        """移除一个点（不存在时忽略）"""
+        position = self.positions.pop(entity, None)
+        if position is None:
+            return
+        x, y = position
+        col, row = self._cell_of(x, y)
+        idx = row * self.cols + col
+        bucket = self.occupants[idx]
+        bucket.remove(entity)
+        if not bucket:
+            del self.occupants[idx]
+        self._apply(x, y, -1)
+        self._refresh(idx)
+
+    def rebuild(self, entities: Iterable[Entity]) -> None:
+        """根据实体列表重建占用网格"""
+        for entity in list(self.positions):
+            self.remove(entity)
+        for entity in entities:
+            self.insert(entity)
+
+    def is_valid(self, x: float, y: float) -> bool:
+        """判断该位置与所有已有点的距离是否都不小于最小间距"""
+        col, row = self._cell_of(x, y)
+        for c, r in self._neighbors(col, row):
+            for entity in self.occupants.get(r * self.cols + c, ()):
+                px, py = self.positions[entity]
+                if (x - px) ** 2 + (y - py) ** 2 < self.min_distance_square:
+                    return False
+        return True
+
+    def _probe(self, idx: int, steps: int = 4) -> Optional[tuple[float, float]]:
+        """在格子内按点阵探测空位，点阵上没有时再精确查找，确实没有空位才标记该格子已无空位"""
+        left, top, right, bottom = self._cell_bounds(idx % self.cols, idx // self.cols)
+        for i in range(steps):
+            for j in range(steps):
+                x = left + (right - left) * (i + 0.5) / steps
+                y = top + (bottom - top) * (j + 0.5) / steps
+                if self.is_valid(x, y):
+                    return x, y
+
+        position = self._exact_free(idx)
+        if position is None:
+            self.exhausted[idx] = True
+            self._refresh(idx)
+        return position
+
+    def _exact_free(self, idx: int) -> Optional[tuple[float, float]]:
+        """精确查找格子内的空位
+
+        空位区域是格子减去各点半径内的圆盘。区域非空时，其中沿某个方向最靠前的点一定是
+        格子的角点、圆与格子边的交点或两圆的交点，因此只需逐个检查这些候选点。
+        """
+        left, top, right, bottom = self._cell_bounds(idx % self.cols, idx // self.cols)
+        d = self.min_distance
+        d_square = self.min_distance_square
+
+        # 只有距离格子不超过最小间距的点会影响格子
+        centers = []
+        for c, r in self._neighbors(idx % self.cols, idx // self.cols):
+            for entity in self.occupants.get(r * self.cols + c, ()):
+                px, py = self.positions[entity]
+                dx = max(left - px, 0, px - right)
+                dy = max(top - py, 0, py - bottom)
+                if dx * dx + dy * dy < d_square:
+                    centers.append((px, py))
+
+        candidates = [(left, top), (right, top), (left, bottom), (right, bottom)]
+        for px, py in centers:
+            # 圆与竖直边、水平边的交点
+            for x in (left, right):
+                h = d_square - (x - px) ** 2
+                if h >= 0:
+                    candidates += [(x, py - math.sqrt(h)), (x, py + math.sqrt(h))]
+            for y in (top, bottom):
+                h = d_square - (y - py) ** 2
+                if h >= 0:
+                    candidates += [(px - math.sqrt(h), y), (px + math.sqrt(h), y)]
+
+        # 两圆的交点
+        for i, (ax, ay) in enumerate(centers):
+            for bx, by in centers[i + 1:]:
+                dist = math.hypot(bx - ax, by - ay)
+                if dist == 0 or dist >= 2 * d:
+                    continue
+                mx, my = (ax + bx) / 2, (ay + by) / 2
+                h = math.sqrt(d_square - (dist / 2) ** 2)
+                ox, oy = -(by - ay) / dist * h, (bx - ax) / dist * h
+                candidates += [(mx + ox, my + oy), (mx - ox, my - oy)]
+
+        # 候选点恰好落在圆周上，浮点误差可能让它略微进入圆内：放宽比较找到候选点后，
+        # 再在其周围取一个严格有效的点（只剩一个点那样面积为零的空位视为没有空位）
+        tolerance = d_square * (1 - 1e-9)
+        for x, y in candidates:
+            x = min(max(x, left), right)
+            y = min(max(y, top), bottom)
+            if any((x - px) ** 2 + (y - py) ** 2 < tolerance for px, py in centers):
+                continue
+            for step in (0.0, 1e-6 * d, 1e-4 * d, 1e-2 * d):
+                for k in range(8 if step else 1):
+                    angle = k * math.pi / 4
+                    nx = min(max(x + step * math.cos(angle), left), right)
+                    ny = min(max(y + step * math.sin(angle), top), bottom)
+                    if self.is_valid(nx, ny):
+                        return nx, ny
+        return None
+
+    def sample(self) -> Optional[tuple[float, float]]:
+        """随机返回一个可放置的位置，地图已满或多次尝试失败时返回 None"""
+        for _ in range(self.attempts):
+            if not self.free:
+                return None
+            idx = self.free[self.rng.randrange(len(self.free))]
+            left, top, right, bottom = self._cell_bounds(idx % self.cols, idx // self.cols)
+            x = self.rng.uniform(left, right)
+            y = self.rng.uniform(top, bottom)
+            if self.is_valid(x, y):
+                return x, y
+
+            # 随机位置无效时，探测整个格子
+            position = self._probe(idx)
+            if position is not None:
+                return position
+        return None
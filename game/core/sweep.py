@@ -0,0 +1,93 @@
+"""
+sweep.py
+
+功能: 配置参数扫描，按网格、随机或拉丁超立方采样生成参数点，并行模拟后汇总灭绝概率
+时间: 2026/10/17
+版本: 1.0
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass
+from itertools import product
+from typing import Any, Optional, Sequence
+import random
+
+from game.core.simulation import (CONFIG_CLASSES, OUTCOMES, SimulationJob, SimulationResult, run_batch)
+
+
+@dataclass
+class SweepRow:
+    """一个参数点的汇总结果"""
+
+    overrides: dict[str, Any]       # 参数点
+    runs: int                       # 模拟次数
+    probabilities: dict[str, float]   # 各结局的概率（ending1 / ending2 / ending3 / survived）
+    mean_survival_months: float     # 平均存活月数
+
+
+def _cast(key: str, value: float) -> Any:
+    """按配置字段的默认值类型转换采样值（整数字段取整）"""
+    prefix, _, name = key.partition(".")
+    _, config_cls = CONFIG_CLASSES[prefix]
+    default = getattr(config_cls(), name)
+    if isinstance(default, bool):
+        return value >= 0.5
+    if isinstance(default, int):
+        return int(round(value))
+    return float(value)
+
+
+def grid_points(values: dict[str, Sequence[Any]]) -> list[dict[str, Any]]:
+    """网格采样：所有取值的笛卡尔积"""
+    keys = list(values)
+    return [dict(zip(keys, combo)) for combo in product(*(values[k] for k in keys))]
+
+
+def random_points(
+        ranges: dict[str, tuple[float, float]], samples: int, rng: Optional[random.Random] = None
+) -> list[dict[str, Any]]:
+    """随机采样：每个字段在 [下限, 上限] 内独立均匀取值"""
+    rng = rng or random.Random()
+    return [
+        {key: _cast(key, rng.uniform(low, high)) for key, (low, high) in ranges.items()}
+        for _ in range(samples)
+    ]
+
+
+def latin_hypercube_points(
+        ranges: dict[str, tuple[float, float]], samples: int, rng: Optional[random.Random] = None
+) -> list[dict[str, Any]]:
+    """拉丁超立方采样：每个字段的范围等分为 samples 段，每段恰好取一个点"""
+    rng = rng or random.Random()
+    columns = {}
+    for key, (low, high) in ranges.items():
+        strata = list(range(samples))
+        rng.shuffle(strata)
+        width = (high - low) / samples
+        columns[key] = [low + (s + rng.random()) * width for s in strata]
+    return [{key: _cast(key, columns[key][i]) for key in ranges} for i in range(samples)]
+
+
+def aggregate(points: list[dict[str, Any]], results: list[SimulationResult], runs: int) -> list[SweepRow]:
+    """按参数点汇总模拟结果（results 按参数点顺序、每点 runs 个排列）"""
+    rows = []
+    for i, point in enumerate(points):
+        chunk = results[i * runs:(i + 1) * runs]
+        probabilities = {k: sum(r.outcome == k for r in chunk) / runs for k in OUTCOMES}
+        mean_months = sum(r.survival_months for r in chunk) / runs
+        rows.append(SweepRow(overrides=point, runs=runs, probabilities=probabilities, mean_survival_months=mean_months))
+    return rows
+
+
+def run_sweep(
+        points: list[dict[str, Any]], runs: int = 8, max_years: int = 10, seed: int = 0,
+        workers: Optional[int] = None, vectorized: bool = False
+) -> list[SweepRow]:
+    """对每个参数点运行 runs 次模拟（所有任务一起调度），返回汇总表"""
+    # 各参数点使用同一组种子，使不同参数点之间的差异不受随机波动影响
+    jobs = [
+        SimulationJob(seed=seed + j, overrides=point, max_years=max_years, vectorized=vectorized)
+        for point in points
+        for j in range(runs)
+    ]
+    return aggregate(points, run_batch(jobs, workers=workers), runs)
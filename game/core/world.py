@@ -6,13 +6,21 @@ world.py
 版本: 1.0
 """
 
+from typing import Optional
+import copy
+import time
+
+import numpy as np
 import pygame
 
-from game.core import (Clock, ResourceManager)
-from game.utils import (RabbitConfig, CrocodileConfig, PlantConfig, SeasonConfig, draw_guide)
-from game.environment import (Season, DisasterManager)
+from game.core import (
+    Clock, SimulationClock, EventScheduler, ResourceManager, SpatialGrid, SteeringFields, EntityStore, RandomStreams
+)
+from game.utils import (MapConfig, RabbitConfig, CrocodileConfig, PlantConfig, SeasonConfig, draw_guide)
+from game.environment import (Season, DisasterManager, Epidemic)
 from game.systems import (CraftingSystem, TechTree)
-from game.entities import (Plant, Rabbit, Crocodile, Animal)
+from game.ui import SpriteLayer
+from game.entities import (PlantManager, Rabbit, Crocodile, Animal, AnimalEngine)
 
 
 class World:
@@ -20,11 +28,26 @@ class World:
 
     def __init__(
             self, width: int, height: int, test_state: int = 0,
-            initial_speed: int = 1, speeds: tuple[int, ...] = (1, 2, 4)
+            initial_speed: int = 1, speeds: tuple[int, ...] = (1, 2, 4, 16, 64, 256),
+            vectorized: bool = False, headless: bool = False,
+            rabbit_config: Optional[RabbitConfig] = None, croc_config: Optional[CrocodileConfig] = None,
+            plant_config: Optional[PlantConfig] = None, season_config: Optional[SeasonConfig] = None,
+            seed: Optional[int] = None
     ):
+        # 构造参数（重置世界时按原样重建；配置保存副本，不受科技树对配置的修改影响）
+        self.options = {
+            "test_state": test_state, "initial_speed": initial_speed, "speeds": speeds,
+            "vectorized": vectorized, "headless": headless,
+            "rabbit_config": copy.deepcopy(rabbit_config), "croc_config": copy.deepcopy(croc_config),
+            "plant_config": copy.deepcopy(plant_config), "season_config": copy.deepcopy(season_config),
+        }
+        self.seeded = seed is not None   # 是否指定了种子（指定时重置后沿用当前种子）
+
         # 基础状态
         self.width = width      # 地图宽度
         self.height = height    # 地图高度
+        self.vectorized = vectorized   # 是否使用 NumPy 批量移动引擎
+        self.headless = headless       # 无界面模式：不加载贴图、字体和音效，只做模拟
         self.pause = False      # 世界暂停状态
         self.end = False        # 世界结束状态
         self.ending1 = False    # 结局 1
@@ -35,37 +58,63 @@ class World:
         self.guide_visible = False     # 指南可见性
         self.last_pause_guide = None   # 上次指南暂停状态
 
+        # 随机数流（各子系统独立，由同一个世界种子派生）
+        self.rngs = RandomStreams(seed)
+        self.seed = self.rngs.seed
+
         # 配置和系统初始化（时间、季节、灾害、资源）
-        self.clock = Clock(initial_speed, speeds)
-        self.season_config = SeasonConfig()
-        Season.config = self.season_config
-        self.season = Season()
-        self.disaster = DisasterManager()
-        self.resource_manager = ResourceManager(test=test_state)
+        self.clock = Clock(initial_speed, speeds, headless=headless)
+        self.sim_clock = SimulationClock()
+        self.scheduler = EventScheduler()   # 定时事件（季节、天气、灾害、生态点、道具制作、植物状态）
+        self.season_config = season_config or SeasonConfig()
+        self.season = Season(self.season_config, self.scheduler, headless=headless, rng=self.rngs.get("season"))
+        self.disaster = DisasterManager(self.scheduler, headless=headless, rng=self.rngs.get("disaster"))
+        self.resource_manager = ResourceManager(self.scheduler, test=test_state, headless=headless)
 
         # 配置和实体（兔子、鳄鱼、植物）
         self.dead_animals = []
+        self.assignment_time = 0.0   # 距下一次鳄鱼全局猎物分配的时间（毫秒）
+
+        self.rabbit_config = rabbit_config or RabbitConfig()
+        self.rabbits = EntityStore(Rabbit.initialize_animals(self.rabbit_config, self.rngs.get("rabbit")))
+
+        self.croc_config = croc_config or CrocodileConfig()
+        self.crocodiles = EntityStore(Crocodile.initialize_animals(self.croc_config, self.rngs.get("crocodile")))
 
-        self.rabbit_config = RabbitConfig()
-        Rabbit.config = self.rabbit_config
-        self.rabbits = Rabbit.initialize_animals(self.rabbit_config)
+        self.plant_config = plant_config or PlantConfig()
+        self.plant_manager = PlantManager(self.plant_config, self.scheduler, self.rngs.get("plant"))
+        self.plants = EntityStore(self.plant_manager.initialize_plants(self.plant_config.initial_num))
 
-        self.croc_config = CrocodileConfig()
-        Crocodile.config = self.croc_config
-        self.crocodiles = Crocodile.initialize_animals(self.croc_config)
+        # 空间网格（所有邻近查询共用）
+        self.plant_grid = SpatialGrid(MapConfig.grid_cell_size)
+        self.rabbit_grid = SpatialGrid(MapConfig.grid_cell_size)
+        self.croc_grid = SpatialGrid(MapConfig.grid_cell_size)
+        self.plant_grid.rebuild(self.plants)
 
-        self.plant_config = PlantConfig()
-        Plant.config = self.plant_config
-        self.plants = Plant.initialize_plants(self.plant_config.initial_num)
+        # 兔子转向用的势场（食物、治愈药草、鳄鱼），随植物增减和鳄鱼跨格移动增量更新
+        self.fields = SteeringFields(width, height, MapConfig.field_cell_size, self.rabbit_config)
+        self.fields.rebuild(self.plants, self.crocodiles)
+
+        # 兔子瘟疫的传播
+        self.epidemic = Epidemic(self.rabbit_config, SpatialGrid(MapConfig.grid_cell_size), self.rngs.get("epidemic"))
+
+        # 批量移动引擎（可选）
+        self.rabbit_engine = self.croc_engine = None
+        if self.vectorized:
+            self.rabbit_engine = AnimalEngine(Rabbit, self.rabbit_config, rng=self.rngs.numpy("rabbit"))
+            self.croc_engine = AnimalEngine(Crocodile, self.croc_config, rng=self.rngs.numpy("crocodile"))
+            self.rabbit_engine.sync(self.rabbits)
+            self.croc_engine.sync(self.crocodiles)
 
         # 科技树和道具系统
-        self.tech_tree = TechTree(self.resource_manager, self.width, self.height)
+        self.tech_tree = TechTree(self, self.width, self.height, headless=headless)
+        self.buildings_layer: Optional[SpriteLayer] = None   # 缓存的建筑层（静态）
         self.crafting_system = CraftingSystem(self, self.width, self.height)
 
     @property
     def animals(self) -> list[Animal]:
         """获取所有动物"""
-        return self.rabbits + self.crocodiles
+        return [*self.rabbits, *self.crocodiles]
 
     def can_update(self) -> bool:
         """检测是否结束"""
@@ -75,48 +124,145 @@ class World:
         """检测是否暂停"""
         return not self.pause and not self.end
 
-    def update_always(self) -> None:
-        """始终更新"""
-        self.resource_manager.update_ecopoints(self.clock.speed, self.pause)
-        Plant.add_new_plant(self.plants, self.season, self.resource_manager, self.clock.speed, self.pause)
-        self.season.update(self.clock.speed, self.pause)
-        self.clock.update(self.pause)
-        self.disaster.update(self, self.season, self.clock.speed, self.pause)
-        self.crafting_system.update(self.clock.speed, self.pause)
-
-        for animal in self.animals:
-            animal.move(
-                self.crocodiles, self.rabbits, self.dead_animals,
-                self.plants, self.plant_config,
-                self.season, self.clock.speed, self.pause
-            )
+    def advance(self, real_time: float) -> int:
+        """按经过的真实时间推进世界，返回推进的 tick 数
+
+        倍速时每帧运行多个固定步长的子步（中间不绘制），动物每步的位移不随倍速增大；
+        超出每帧的时间预算时丢弃积压，实际倍速随之降低（记录在 sim_clock.effective_speed）。
+        """
+        due = self.sim_clock.ticks_due(real_time, self.clock.speed)
+        if self.pause:
+            due = min(due, 1)   # 暂停时模拟时间不前进，无需重复运行
 
-        Plant.remove_plants_near_animals(
-            self.plants, self.rabbits,
-            self.season, self.resource_manager,
-            self.clock.speed, self.pause
+        deadline = time.perf_counter() + self.sim_clock.budget / 1000
+        ticks = 0
+        while ticks < due and self.can_update():
+            self.step()
+            ticks += 1
+            if time.perf_counter() > deadline:
+                self.sim_clock.drop_backlog()
+                break
+        if not self.pause and self.can_update():
+            self.sim_clock.record(real_time, ticks)
+
+        # 季节颜色渐变和雨滴每帧更新一次，与倍速无关
+        self.season.update()
+        return ticks
+
+    def step(self) -> None:
+        """推进一个固定步长的 tick"""
+        if not self.can_update():
+            return
+        self.check_end()
+        delta_time = self.sim_clock.tick(self.pause)
+        self.update_always(delta_time)
+        if self.can_progress():
+            self.update_when_active()
+
+    def update_always(self, delta_time: float) -> None:
+        """始终更新（暂停时 delta_time 为 0）"""
+        # 瘟疫统计在所有可能感染兔子的系统（定时事件、灾害）之前清零
+        self.epidemic.begin_tick()
+
+        # 动物网格每帧重建，以包含上一帧的出生与死亡；植物网格增量维护
+        self.rabbit_grid.rebuild(self.rabbits)
+        self.croc_grid.rebuild(self.crocodiles)
+
+        # 势场半径跟随科技树修改的感知范围，危险场跟随鳄鱼的出生、死亡与移动
+        self.fields.configure(self.rabbit_config)
+        self.fields.danger.sync(self.crocodiles)
+
+        # 触发本 tick 内到期的定时事件（暂停时模拟时间不前进，不会触发）
+        self.scheduler.advance(self.sim_clock.time)
+
+        self.plant_manager.add_new_plant(
+            self.plants, self.plant_grid, self.fields,
+            self.season, self.resource_manager, delta_time
+        )
+        self.clock.update(delta_time)
+        self.disaster.update(self, self.season, delta_time)
+
+        # 兔子之间按传染率传播瘟疫
+        self.epidemic.update(self.rabbits, self.sim_clock.time, delta_time)
+
+        # 鳄鱼的全局猎物分配（避免多只鳄鱼追同一只兔子），与各自选择猎物一样按决策间隔进行
+        self.assignment_time -= delta_time
+        if self.assignment_time <= 0:
+            self.assignment_time = max(0.0, self.assignment_time + self.croc_config.decision_interval)
+            Crocodile.assign_prey(self.crocodiles, self.rabbits, self.croc_config)
+
+        if self.vectorized:
+            for species, engine in ((Rabbit, self.rabbit_engine), (Crocodile, self.croc_engine)):
+                species.move_all(
+                    engine, self.croc_grid, self.rabbit_grid, self.dead_animals,
+                    self.plant_grid, self.plant_config, self.fields,
+                    self.season, delta_time
+                )
+        else:
+            for animal in self.animals:
+                animal.move(
+                    self.croc_grid, self.rabbit_grid, self.dead_animals,
+                    self.plant_grid, self.plant_config, self.fields,
+                    self.season, delta_time
+                )
+
+        self.plant_manager.remove_plants_near_animals(
+            self.plants, self.plant_grid, self.rabbit_grid, self.fields,
+            self.season, self.resource_manager, delta_time
         )
 
     def update_when_active(self) -> None:
         """非暂停时更新"""
-        self.rabbits.extend(Rabbit.add_new_animal(
+        new_rabbits = Rabbit.add_new_animal(
             self.rabbits, self.rabbit_config, self.animals,
-            self.resource_manager, self.season
-        ))
-        
-        self.crocodiles.extend(Crocodile.add_new_animal(
+            self.resource_manager, self.season, self.rngs.get("rabbit")
+        )
+        new_crocodiles = Crocodile.add_new_animal(
             self.crocodiles, self.croc_config, self.animals,
-            self.resource_manager, self.season
-        ))
+            self.resource_manager, self.season, self.rngs.get("crocodile")
+        )
+        self.rabbits.extend(new_rabbits)
+        self.crocodiles.extend(new_crocodiles)
 
-        self.rabbits = Rabbit.remove_old_animals(self.rabbits)
-        self.crocodiles = Crocodile.remove_old_animals(self.crocodiles)
+        Rabbit.remove_old_animals(self.rabbits)
+        Crocodile.remove_old_animals(self.crocodiles)
 
         for dead in self.dead_animals:
-            if isinstance(dead, Rabbit) and dead in self.rabbits:
-                self.rabbits.remove(dead)
+            self.rabbits.kill(dead)
         self.dead_animals.clear()
 
+        # 帧末统一移除死亡实体
+        self.plants.flush()
+        dead_rabbits = self.rabbits.flush()
+        dead_crocodiles = self.crocodiles.flush()
+
+        if self.vectorized:
+            for animal in dead_rabbits:
+                self.rabbit_engine.detach(animal)
+            for animal in dead_crocodiles:
+                self.croc_engine.detach(animal)
+            for animal in new_rabbits:
+                self.rabbit_engine.attach(animal)
+            for animal in new_crocodiles:
+                self.croc_engine.attach(animal)
+
+    def reseed(self, seed: int) -> None:
+        """更换世界种子，并把新的随机数流分配给各子系统（用于从同一状态分叉出不同的未来）"""
+        self.rngs = RandomStreams(seed)
+        self.seed = self.rngs.seed
+        self.seeded = True
+        self.season.rng = self.rngs.get("season")
+        self.disaster.rng = self.rngs.get("disaster")
+        self.epidemic.rng = self.rngs.get("epidemic")
+        self.plant_manager.rng = self.plant_manager.sampler.rng = self.rngs.get("plant")
+        for animal in self.rabbits:
+            animal.rng = self.rngs.get("rabbit")
+        for animal in self.crocodiles:
+            animal.rng = self.rngs.get("crocodile")
+        if self.vectorized:
+            self.rabbit_engine.rng = self.rngs.numpy("rabbit")
+            self.croc_engine.rng = self.rngs.numpy("crocodile")
+
     def check_end(self) -> None:
         """检测结束状态"""
         if len(self.plants) == 0:
@@ -127,26 +273,52 @@ class World:
             self.end = self.ending3 = True
 
     def restart(self) -> None:
-        """重置世界"""
-        self.__init__(self.width, self.height)
+        """重置世界：按构造参数重建，指定过种子（或调用过 reseed）时沿用当前种子，否则换一个新种子"""
+        self.__init__(self.width, self.height, seed=self.seed if self.seeded else None, **self.options)
+
+    def needs_full_redraw(self) -> bool:
+        """是否需要整屏重绘（雨滴、科技树和指南覆盖整个画面）"""
+        return self.season.is_raining or self.tech_tree.visible or self.guide_visible
+
+    def sprite_layers(self) -> list[SpriteLayer]:
+        """按绘制顺序生成建筑（静态层）、植物、动物三层精灵（科技树打开时不绘制）"""
+        if self.tech_tree.visible:
+            return []
+
+        # 动物：批量引擎中直接使用位置数组
+        if self.vectorized:
+            animals = SpriteLayer.concat([
+                SpriteLayer.from_arrays(engine.animals, engine["x"], engine["y"])
+                for engine in (self.rabbit_engine, self.croc_engine)
+            ])
+        else:
+            animals = SpriteLayer.from_entities(self.animals)
+        return [self.static_layer(), SpriteLayer.from_entities(self.plants.items), animals]
+
+    def static_layer(self) -> SpriteLayer:
+        """建筑层：建筑不会移动，只在建成（可见的建筑变化）时重新生成"""
+        buildings = [building for building in self.tech_tree.buildings.values() if building.visible]
+        if self.buildings_layer is None or self.buildings_layer.entities != buildings:
+            self.buildings_layer = SpriteLayer.from_arrays(
+                buildings, np.array([b.pos[0] for b in buildings], dtype=float),
+                np.array([b.pos[1] for b in buildings], dtype=float)
+            )
+        return self.buildings_layer
 
     def draw(self, screen: pygame.surface.Surface) -> None:
         """绘制世界"""
-        # 绘制建筑、植物、动物
-        if not self.tech_tree.visible:
-            for building in self.tech_tree.buildings.values():
-                building.draw(screen)
-            for plant in self.plants:
-                plant.draw(screen)
-            for animal in self.animals:
-                animal.draw(screen)
+        # 绘制建筑、植物、动物（每层一次 blits）
+        for layer in self.sprite_layers():
+            screen.blits(layer.blit_sequence(), False)
+        self.draw_overlay(screen)
 
-        # 绘制科技树、季节、状态、时间、资源、道具
+    def draw_overlay(self, screen: pygame.surface.Surface) -> None:
+        """绘制科技树、季节、状态、时间、资源、道具和指南"""
         self.tech_tree.draw(screen)
         self.season.draw(screen)
         self.clock.draw(screen)
         self.resource_manager.draw(screen)
-        self.disaster.draw(screen, self.clock.speed, self.pause)
+        self.disaster.draw(screen)
         self.crafting_system.draw(screen)
 
         if self.guide_visible:
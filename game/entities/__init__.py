@@ -1,13 +1,15 @@
 # game/entities/__init__.py
 
 from .biological.animal import Animal
+from .biological.engine import (EngineField, AnimalEngine)
 from .biological.animal_species import (Rabbit, Crocodile)
-from .biological.plant import Plant
+from .biological.plant import (Plant, PlantManager)
 from .buildings.building import Building
 
 __all__ = [
     'Animal',
+    'EngineField', 'AnimalEngine',
     'Rabbit', 'Crocodile',
-    'Plant',
+    'Plant', 'PlantManager',
     'Building',
 ]
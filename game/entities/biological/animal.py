@@ -7,14 +7,15 @@ animal.py
 """
 
 from __future__ import annotations
-from typing import Optional
+from typing import Any, Optional
 import random
 import math
 
 import pygame
 
-from game.utils import (MapConfig, RabbitConfig, CrocodileConfig)
-from game.core import ResourceManager
+from .engine import (EngineField, AnimalEngine)
+from game.utils import (MapConfig, RabbitConfig, CrocodileConfig, load_image)
+from game.core import (ResourceManager, EntityStore)
 from game.environment import Season
 
 
@@ -24,52 +25,112 @@ AnimalConfig = RabbitConfig | CrocodileConfig
 class Animal:
     """管理动物的创建、繁殖、死亡等事件"""
 
-    loaded_images = {}
-
-    def __init__(self, x: float, y: float, config: AnimalConfig):
+    # 可由 AnimalEngine 托管的属性（挂接后读写引擎数组）
+    x = EngineField()
+    y = EngineField()
+    prev_x = EngineField()   # 本 tick 移动前的位置（用于扫掠检测）
+    prev_y = EngineField()
+    speed = EngineField()
+    angle = EngineField()
+    age = EngineField()
+    eaten = EngineField()
+    boost_active_time = EngineField()
+
+    _engine: Optional[AnimalEngine] = None   # 所属引擎
+    _slot: Optional[int] = None              # 引擎中的槽位
+
+    def __init__(self, x: float, y: float, config: AnimalConfig, rng: Any = random):
         # 基本属性
         self.config = config
+        self.rng = rng   # 所属物种的随机数生成器
         self.x = x
         self.y = y
+        self.prev_x = x
+        self.prev_y = y
         self.size = config.size
 
-        if config.image not in Animal.loaded_images:
-            Animal.loaded_images[config.image] = pygame.transform.smoothscale(
-                pygame.image.load(config.image).convert_alpha(),
-                (self.size[0] * 2, self.size[1] * 2)
-            )
-        self.image = Animal.loaded_images[config.image]
+        self.image_path = config.image   # 贴图路径（绘制时才加载）
 
         # 速度属性
         self.ave_speed = config.ave_speed
         self.range_speed = config.range_speed
         self.min_speed = self.ave_speed - self.range_speed
         self.max_speed = self.ave_speed + self.range_speed
-        self.speed = random.uniform(self.min_speed, self.max_speed)
+        self.speed = self.rng.uniform(self.min_speed, self.max_speed)
         self.speed_change_rate = config.speed_change_rate
 
         # 角度属性
-        self.angle = random.uniform(0, 2 * math.pi)
+        self.angle = self.rng.uniform(0, 2 * math.pi)
         self.angle_change_rate = config.angle_change_rate
 
+        # 决策属性（随机相位，使各个体的目标选择错开到不同帧）
+        self.decision_time = self.rng.uniform(0, config.decision_interval)
+
         # 年龄属性
         self.age = 0
         self.ave_age = config.ave_age
         self.range_age = config.range_age
-        self.age_random = 60000 * random.uniform(self.ave_age - self.range_age, self.ave_age + self.range_age)
+        self.age_random = 60000 * self.rng.uniform(self.ave_age - self.range_age, self.ave_age + self.range_age)
 
         # 实时变化的属性
         self.eaten = 0.0
+        self.boost_active_time = 0   # 累计加速时间
+
+    @property
+    def image(self) -> pygame.surface.Surface:
+        """当前贴图"""
+        return load_image(self.image_path, (self.size[0] * 2, self.size[1] * 2))
 
     def draw(self, screen: pygame.surface.Surface) -> None:
         """绘制动物"""
         rect = self.image.get_rect(center=(self.x, self.y))
         screen.blit(self.image, rect)
 
+    def _apply_motion(self) -> None:
+        """按当前速度和角度移动，处理边界反弹"""
+        dx = self.speed * math.cos(self.angle)
+        dy = self.speed * math.sin(self.angle)
+
+        # 边界反弹
+        if not (self.size[0] <= self.x + dx <= MapConfig.width - self.size[0]):
+            self.angle = math.pi - self.angle
+        if not (self.size[1] <= self.y + dy <= MapConfig.height - self.size[1]):
+            self.angle = -self.angle
+
+        # 更新位置
+        self.prev_x, self.prev_y = self.x, self.y
+        self.x += dx
+        self.y += dy
+        self.x = max(self.size[0], min(MapConfig.width - self.size[0], self.x))
+        self.y = max(self.size[1], min(MapConfig.height - self.size[1], self.y))
+
+    def _decision_due(self, delta_time: float) -> bool:
+        """推进决策计时，到期时返回 True（两次决策之间沿用缓存的目标）
+
+        2000 只兔子、间隔 150 毫秒时，目标选择本身约减少 6~9 倍，但整帧只快约 2 倍：
+        逐只执行的 _steer 和其余逐个体逻辑仍是 Python 循环，不随决策频率下降。
+        """
+        self.decision_time -= delta_time
+        if self.decision_time > 0:
+            return False
+        self.decision_time = max(0.0, self.decision_time + self.config.decision_interval)
+        return True
+
+    def _apply_boost(self, delta_time: float) -> None:
+        """是否在加速状态"""
+        if self.config.boosting and self.boost_active_time > 0:
+            self.boost_active_time -= delta_time
+            self.speed *= self.config.boost_rate
+        else:
+            self.boost_active_time = 0
+            self.config.boosting = False
+
     @staticmethod
-    def remove_old_animals(animals: list[Animal]) -> Optional[list[Animal]]:
-        """移除动物"""
-        return [animal for animal in animals if animal.age < animal.age_random]
+    def remove_old_animals(animals: EntityStore) -> None:
+        """标记寿命已尽的动物，帧末统一移除"""
+        for animal in animals:
+            if animal.age >= animal.age_random:
+                animals.kill(animal)
 
     @classmethod
     def _is_too_close_a(cls, new_animal: Animal, animals: list[Animal], config: AnimalConfig) -> bool:
@@ -81,19 +142,19 @@ class Animal:
         return False
 
     @staticmethod
-    def _calculate_new_pos(config: AnimalConfig) -> tuple[float, float]:
-        new_x = random.uniform(config.size[0], MapConfig.width - config.size[0])
-        new_y = random.uniform(config.size[1], MapConfig.height - config.size[1])
+    def _calculate_new_pos(config: AnimalConfig, rng: Any) -> tuple[float, float]:
+        new_x = rng.uniform(config.size[0], MapConfig.width - config.size[0])
+        new_y = rng.uniform(config.size[1], MapConfig.height - config.size[1])
         return new_x, new_y
 
     @classmethod
-    def initialize_animals(cls, config: AnimalConfig) -> list[Animal]:
+    def initialize_animals(cls, config: AnimalConfig, rng: Any = random) -> list[Animal]:
         """初始化动物"""
         animals = []
         for _ in range(config.initial_num):
             for _ in range(100):
-                new_x, new_y = cls._calculate_new_pos(config)
-                new_animal = cls(new_x, new_y, config)
+                new_x, new_y = cls._calculate_new_pos(config, rng)
+                new_animal = cls(new_x, new_y, config, rng)
                 if not cls._is_too_close_a(new_animal, animals, config):
                     animals.append(new_animal)
                     break
@@ -101,8 +162,8 @@ class Animal:
 
     @classmethod
     def add_new_animal(
-            cls, animals: list[Animal], config: AnimalConfig, all_animals: list[Animal],
-            resource_manager: ResourceManager, season: Season
+            cls, animals: EntityStore, config: AnimalConfig, all_animals: list[Animal],
+            resource_manager: ResourceManager, season: Season, rng: Any = random
     ) -> list[Animal]:
         """动物繁殖"""
         new_animals = []
@@ -116,8 +177,8 @@ class Animal:
                     animal.energy = 0
                 
                 for _ in range(100):
-                    new_x, new_y = cls._calculate_new_pos(config)
-                    new_animal = cls(new_x, new_y, config)
+                    new_x, new_y = cls._calculate_new_pos(config, rng)
+                    new_animal = cls(new_x, new_y, config, rng)
                     if not cls._is_too_close_a(new_animal, all_animals, config):
                         new_animals.append(new_animal)
                         resource_manager.gain_animite(config.reproduction_resource)
@@ -137,7 +198,7 @@ class Animal:
             self.ave_speed = self.config.ave_speed
             self.min_speed = self.ave_speed - self.range_speed
             self.max_speed = self.ave_speed + self.range_speed
-            self.speed = random.uniform(self.min_speed, self.max_speed)
+            self.speed = self.rng.uniform(self.min_speed, self.max_speed)
 
         # 动物年龄有变化
         if self.ave_age != self.config.ave_age or self.range_age != self.config.range_age:
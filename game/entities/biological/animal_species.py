@@ -7,16 +7,18 @@ animal_species.py
 """
 
 from __future__ import annotations
-from typing import Optional
+from typing import Any, Iterable, Optional
 import math
 import random
 import heapq
 
+import numpy as np
 import pygame
 
 from .animal import Animal
-from .plant import Plant
-from game.utils import (MapConfig, RabbitConfig, CrocodileConfig, PlantConfig)
+from .engine import (EngineField, AnimalEngine)
+from game.utils import (MapConfig, RabbitConfig, CrocodileConfig, PlantConfig, FRAME_TIME)
+from game.core import (SpatialGrid, FlowField, SteeringFields, segment_distance, match_targets)
 from game.environment import Season
 
 
@@ -25,15 +27,14 @@ class Crocodile(Animal):
 
     carnivore = True   # 食肉动物标签
 
-    def __init__(self, x: float, y: float, config: CrocodileConfig):
-        super().__init__(x, y, config)
+    def __init__(self, x: float, y: float, config: CrocodileConfig, rng: Any = random):
+        super().__init__(x, y, config, rng)
         self.active_time = 0         # 累计活跃时间
-        self.boost_active_time = 0   # 累计加速时间
-        self.last_update_time = pygame.time.get_ticks()    # 上次检查时间
 
-        self.edge_margin = random.randrange(80, 120)   # 目标边缘间距
+        self.edge_margin = self.rng.randrange(80, 120)   # 目标边缘间距
 
         self.hungry = True           # 控制觅食行为
+        self.prey_pos = None         # 上次决策选中的猎物位置
         self.rest_duration = 15000   # 休息时长
         self.eat_num = 0             # 吃兔子的数量
         self.rest_num = 1            # 休息要求吃兔子的数量
@@ -41,61 +42,88 @@ class Crocodile(Animal):
         self.rest_speed_rate = 0.6   # 游走时移速的减少倍率
 
     def move(
-            self, crocodiles: list[Crocodile], rabbits: list[Rabbit],
+            self, croc_grid: SpatialGrid, rabbit_grid: SpatialGrid,
             dead_animals: Optional[list[Animal]],
-            plants: list[Plant], plant_config: PlantConfig,
-            season: Season, time_speed: int, pause: bool
+            plant_grid: SpatialGrid, plant_config: PlantConfig, fields: SteeringFields,
+            season: Season, delta_time: float
     ) -> None:
         """鳄鱼移动"""
-        # 活跃时间检查
-        now = pygame.time.get_ticks()
-        delta_time = now - self.last_update_time
-        self.last_update_time = now
-        if pause:
+        # 暂停时 delta_time 为 0
+        if not delta_time:
             return
-        delta_time *= time_speed
 
         # 检测科技树造成的属性变化
         self.update_basic_stats()
-        
+
         # 年龄增长与速度扰动
         self.age += delta_time
-        self.speed += random.uniform(-self.speed_change_rate, self.speed_change_rate)
-        self.angle += random.uniform(-self.angle_change_rate, self.angle_change_rate)
+        self.speed += self.rng.uniform(-self.speed_change_rate, self.speed_change_rate)
+        self.angle += self.rng.uniform(-self.angle_change_rate, self.angle_change_rate)
         self.speed = min(max(self.speed, self.min_speed), self.max_speed)
 
-        # 计算倍速和季节倍率
-        self.speed *= time_speed
+        # 计算时间步长和季节倍率
+        self.speed *= delta_time / FRAME_TIME
         self.speed *= season.get_multiplier_a()
 
         # 是否在加速状态
-        if self.config.boosting and self.boost_active_time > 0:
-            self.boost_active_time -= delta_time
-            self.speed *= self.config.boost_rate
-        else:
-            self.boost_active_time = 0
-            self.config.boosting = False
+        self._apply_boost(delta_time)
+
+        # 捕食或休息行为
+        self._hunt_or_rest(rabbit_grid, dead_animals, delta_time)
+
+        # 执行移动，并沿本 tick 的移动轨迹检测捕食
+        self._apply_motion()
+        croc_grid.update(self)
+        self._catch_prey(rabbit_grid, dead_animals)
 
-        # ----- 捕食或休息行为 -----
-        # 饥饿时捕食
+    @classmethod
+    def move_all(
+            cls, engine: AnimalEngine, croc_grid: SpatialGrid, rabbit_grid: SpatialGrid,
+            dead_animals: Optional[list[Animal]],
+            plant_grid: SpatialGrid, plant_config: PlantConfig, fields: SteeringFields,
+            season: Season, delta_time: float
+    ) -> None:
+        """以向量化方式推进引擎中的所有鳄鱼"""
+        # 暂停时 delta_time 为 0
+        if not delta_time or engine.count == 0:
+            return
+
+        # 检测科技树造成的属性变化
+        engine.update_basic_stats()
+
+        # 年龄增长与速度扰动
+        engine["age"][:] += delta_time
+        engine.jitter()
+        speed = engine["speed"]
+        np.clip(speed, engine.min_speed, engine.max_speed, out=speed)
+
+        # 计算时间步长和季节倍率，是否在加速状态
+        speed *= delta_time / FRAME_TIME * season.get_multiplier_a()
+        engine.apply_boost(delta_time)
+
+        # 捕食或休息行为（逐只决策）
+        for croc in engine.animals:
+            croc._hunt_or_rest(rabbit_grid, dead_animals, delta_time)
+
+        # 整体移动，并沿本 tick 的移动轨迹检测捕食
+        engine.integrate()
+        for croc in engine.animals:
+            croc_grid.update(croc)
+            croc._catch_prey(rabbit_grid, dead_animals)
+
+    def _hunt_or_rest(self, rabbit_grid: SpatialGrid, dead_animals: Optional[list[Animal]], delta_time: float) -> None:
+        """捕食或休息行为"""
+        # 按决策间隔各自选择最近的猎物，两次决策之间朝缓存的猎物位置前进（全局分配时由 assign_prey 按同样的间隔统一分配）
+        if self.config.assignment == "nearest" and self._decision_due(delta_time):
+            prey = self._find_prey(rabbit_grid, self.config.min_hunt_distance) if self.hungry else None
+            self.prey_pos = None if prey is None else (prey.x, prey.y)
+
+        # 饥饿时朝猎物前进（移动后由 _catch_prey 判断是否捕获）
         if self.hungry:
-            prey = self._find_prey(rabbits, self.config.min_hunt_distance)
-            if prey:
-                self.angle = math.atan2(prey.y - self.y, prey.x - self.x)
-                self.angle += random.uniform(-math.pi / 8, math.pi / 8)
-                dist = math.hypot(self.x - prey.x, self.y - prey.y)
-
-                # 捕食成功
-                if dist < self.config.min_eat_distance:
-                    dead_animals.append(prey)
-                    self.eaten += 1
-                    self.eat_num += 1
-
-                    # 吃饱了就休息
-                    if self.eat_num >= self.rest_num:
-                        self.eat_num = 0
-                        self.hungry = False
-        
+            if self.prey_pos is not None:
+                self.angle = math.atan2(self.prey_pos[1] - self.y, self.prey_pos[0] - self.x)
+                self.angle += self.rng.uniform(-math.pi / 8, math.pi / 8)
+
         # 靠近边缘或徘徊
         else:
             self.active_time += delta_time
@@ -111,44 +139,70 @@ class Crocodile(Animal):
                 target_x = 0 if self.x < MapConfig.width / 2 else MapConfig.width
                 target_y = 0 if self.y < MapConfig.height / 2 else MapConfig.height
                 self.angle = math.atan2(target_y - self.y, target_x - self.x)
-                self.angle += random.uniform(-math.pi / 6, math.pi / 6)
+                self.angle += self.rng.uniform(-math.pi / 6, math.pi / 6)
                 self.speed *= self.full_speed_rate
             else:
                 # 在边缘，随机游走
                 self.speed *= self.rest_speed_rate
-            
+
             # 检查是否超过休息时间
             if self.active_time > self.rest_duration:
                 self.active_time = 0
                 self.hungry = True  # 进入下一轮捕食
 
-        # ----- 执行移动 -----
-        dx = self.speed * math.cos(self.angle)
-        dy = self.speed * math.sin(self.angle)
+    def _catch_prey(self, rabbit_grid: SpatialGrid, dead_animals: Optional[list[Animal]]) -> None:
+        """扫掠检测：本 tick 内与猎物的最近距离小于进食范围即捕获，结果与步长无关"""
+        if not self.hungry or self.prey_pos is None:
+            return
 
-        # 边界反弹
-        if not (self.size[0] <= self.x + dx <= MapConfig.width - self.size[0]):
-            self.angle = math.pi - self.angle
-        if not (self.size[1] <= self.y + dy <= MapConfig.height - self.size[1]):
-            self.angle = -self.angle
+        # 双方都在移动，按相对运动计算本 tick 内的最近距离
+        reach = self.config.min_eat_distance + rabbit_grid.max_step
+        prey, closest = None, self.config.min_eat_distance
+        for other, _ in rabbit_grid.query_segment(self.prev_x, self.prev_y, self.x, self.y, reach):
+            dist = segment_distance(
+                0, 0, self.prev_x - other.prev_x, self.prev_y - other.prev_y, self.x - other.x, self.y - other.y
+            )
+            if dist < closest:
+                prey, closest = other, dist
+
+        # 捕食成功
+        if prey:
+            dead_animals.append(prey)
+            self.prey_pos = None
+            self.eaten += 1
+            self.eat_num += 1
+
+            # 吃饱了就休息
+            if self.eat_num >= self.rest_num:
+                self.eat_num = 0
+                self.hungry = False
+
+    @staticmethod
+    def assign_prey(crocodiles: Iterable[Crocodile], rabbits: Iterable[Rabbit], config: CrocodileConfig) -> None:
+        """全局猎物分配：一次算出饥饿鳄鱼 × 兔子的距离矩阵，为每只鳄鱼分配互不相同的猎物"""
+        if config.assignment == "nearest":
+            return
+        hunters = [croc for croc in crocodiles if croc.hungry]
+        prey = list(rabbits)
+        if not hunters:
+            return
+        if not prey:
+            for croc in hunters:
+                croc.prey_pos = None
+            return
 
-        # 更新位置
-        self.x += dx
-        self.y += dy
-        self.x = max(self.size[0], min(MapConfig.width - self.size[0], self.x))
-        self.y = max(self.size[1], min(MapConfig.height - self.size[1], self.y))
+        hunter_xy = np.array([(croc.x, croc.y) for croc in hunters])
+        prey_xy = np.array([(rabbit.x, rabbit.y) for rabbit in prey])
+        dist = np.hypot(
+            hunter_xy[:, 0, None] - prey_xy[None, :, 0], hunter_xy[:, 1, None] - prey_xy[None, :, 1]
+        )
+        targets = match_targets(dist, config.min_hunt_distance, config.assignment)
+        for croc, target in zip(hunters, targets):
+            croc.prey_pos = None if target < 0 else (prey[target].x, prey[target].y)
 
-    def _find_prey(self, rabbits: list[Rabbit], detection_radius: int) -> Rabbit | None:
+    def _find_prey(self, rabbit_grid: SpatialGrid, detection_radius: int) -> Rabbit | None:
         """寻找附近的猎物 herbivore"""
-        closest_prey = None
-        closest_distance = float('inf')
-
-        for other in rabbits:
-            distance = math.hypot(self.x - other.x, self.y - other.y)
-            if distance < detection_radius and distance < closest_distance:
-                closest_prey = other
-                closest_distance = distance
-        return closest_prey
+        return rabbit_grid.nearest(self.x, self.y, detection_radius)
 
 
 class Rabbit(Animal):
@@ -156,10 +210,12 @@ class Rabbit(Animal):
 
     herbivore = True   # 食草动物
 
-    def __init__(self, x: float, y: float, config: RabbitConfig):
-        super().__init__(x, y, config)
-        self.boost_active_time = 0   # 累计加速时间
-        self.last_update_time = pygame.time.get_ticks()   # 上次检查时间
+    # 可由 AnimalEngine 托管的属性
+    energy = EngineField(int)
+    infected = EngineField(bool)
+
+    def __init__(self, x: float, y: float, config: RabbitConfig, rng: Any = random):
+        super().__init__(x, y, config, rng)
 
         self.margin = 60             # 边界阈值
         self.escape_weight = 1.0     # 逃离权重
@@ -171,24 +227,24 @@ class Rabbit(Animal):
         self.infected = False        # 是否感染
         self.immune = False          # 是否免疫传染病
 
+        self.threat = None           # 上次决策得到的捕食者加权中心（势场方式为沿危险梯度的点）
+        self.neighbor = None         # 上次决策得到的最近同类位置
+        self.food = None             # 上次决策选中的植物位置（势场方式为沿食物梯度的点）
+
     def move(
-            self, crocodiles: list[Crocodile], rabbits: list[Rabbit],
+            self, croc_grid: SpatialGrid, rabbit_grid: SpatialGrid,
             dead_animals: Optional[list[Animal]],
-             plants: list[Plant], plant_config: PlantConfig,
-            season: Season, time_speed: int, pause: bool
+            plant_grid: SpatialGrid, plant_config: PlantConfig, fields: SteeringFields,
+            season: Season, delta_time: float
     ) -> None:
         """兔子移动"""
-        # 活跃时间检查
-        now = pygame.time.get_ticks()
-        delta_time = now - self.last_update_time
-        self.last_update_time = now
-        if pause:
+        # 暂停时 delta_time 为 0
+        if not delta_time:
             return
-        delta_time *= time_speed
 
         # 检测科技树造成的属性变化
         self.update_basic_stats()
-        
+
         # 年龄增长
         self.age += delta_time
 
@@ -196,15 +252,8 @@ class Rabbit(Animal):
         if self.infected:
             self.age += delta_time * self.config.infected_multiplier  # 再额外增长一次，等效于寿命加倍流失
 
-            # 检查传染给其他兔子
-            for other in rabbits:
-                if other != self and not other.infected:
-                    dist = math.hypot(self.x - other.x, self.y - other.y)
-                    if dist < self.config.infection_range:
-                        other.infect(self.config.image_infected)
-
         # 速度扰动、吃植物加速、感染减速
-        self.speed += random.uniform(-self.speed_change_rate, self.speed_change_rate)
+        self.speed += self.rng.uniform(-self.speed_change_rate, self.speed_change_rate)
 
         eat_boost = min(self.energy, self.config.max_eat_boost) * self.config.plant_eat_boost
         infection_down = self.config.infection_speed_down if self.infected else 0
@@ -215,23 +264,127 @@ class Rabbit(Animal):
         self.speed = min(max(self.speed, low_speed), up_speed)
 
         # 角度扰动
-        self.angle += random.uniform(-self.angle_change_rate, self.angle_change_rate)
+        self.angle += self.rng.uniform(-self.angle_change_rate, self.angle_change_rate)
 
-        # 计算倍速和季节倍率
-        self.speed *= time_speed
+        # 计算时间步长和季节倍率
+        self.speed *= delta_time / FRAME_TIME
         self.speed *= season.get_multiplier_a()
 
         # 是否在加速状态
-        if self.config.boosting and self.boost_active_time > 0:
-            self.boost_active_time -= delta_time
-            self.speed *= self.config.boost_rate
+        self._apply_boost(delta_time)
+
+        # 逃离、避让、觅食
+        self._steer(croc_grid, rabbit_grid, plant_grid, plant_config, fields, delta_time)
+
+        # 移动逻辑
+        self._apply_motion()
+        rabbit_grid.update(self)
+
+    @classmethod
+    def move_all(
+            cls, engine: AnimalEngine, croc_grid: SpatialGrid, rabbit_grid: SpatialGrid,
+            dead_animals: Optional[list[Animal]],
+            plant_grid: SpatialGrid, plant_config: PlantConfig, fields: SteeringFields,
+            season: Season, delta_time: float
+    ) -> None:
+        """以向量化方式推进引擎中的所有兔子"""
+        # 暂停时 delta_time 为 0
+        if not delta_time or engine.count == 0:
+            return
+        config = engine.config
+
+        # 检测科技树造成的属性变化
+        engine.update_basic_stats()
+
+        # 年龄增长，感染的兔子加速寿命消耗
+        infected = engine["infected"]
+        age = engine["age"]
+        age += delta_time
+        age[infected] += delta_time * config.infected_multiplier
+
+        # 速度和角度扰动，吃植物加速、感染减速
+        engine.jitter()
+        speed = engine["speed"]
+        shift = np.minimum(engine["energy"], config.max_eat_boost) * config.plant_eat_boost
+        shift -= engine["infected"] * config.infection_speed_down
+        np.clip(speed, engine.min_speed + shift, engine.max_speed + shift, out=speed)
+
+        # 计算时间步长和季节倍率，是否在加速状态
+        speed *= delta_time / FRAME_TIME * season.get_multiplier_a()
+        engine.apply_boost(delta_time)
+
+        # 逃离、避让、觅食（逐只决策）
+        for rabbit in engine.animals:
+            rabbit._steer(croc_grid, rabbit_grid, plant_grid, plant_config, fields, delta_time)
+
+        # 整体移动
+        engine.integrate()
+        for rabbit in engine.animals:
+            rabbit_grid.update(rabbit)
+
+    def _decide(
+            self, croc_grid: SpatialGrid, rabbit_grid: SpatialGrid,
+            plant_grid: SpatialGrid, plant_config: PlantConfig, fields: SteeringFields
+    ) -> None:
+        """目标选择：感知捕食者、同类和植物，结果缓存到下一次决策"""
+        by_field = self.config.steering == "field"
+        x, y = self.x, self.y
+
+        # 势场方式沿危险梯度取一个点作为威胁中心（长度取边界阈值，梯度只提供方向）
+        if by_field:
+            self.threat = self._field_target(x, y, fields.danger, self.margin)
+        else:
+            self.threat = self._find_predator(croc_grid, self.config.min_croc_distance)
+        self.neighbor = self.food = None
+        if self.threat:
+            return
+
+        other = rabbit_grid.nearest(x, y, self.config.min_distance, exclude=self)
+        if other is not None:
+            self.neighbor = (other.x, other.y)
+
+        if plant_config.is_invincible:
+            return
+
+        # 如果自身感染，并且范围里有治愈药草，否则选择普通植物
+        if by_field:
+            if self.infected:
+                self.food = self._field_target(x, y, fields.medicine, self.margin)
+            if self.food is None:
+                self.food = self._field_target(x, y, fields.food, self.margin)
         else:
-            self.boost_active_time = 0
-            self.config.boosting = False
+            all_plants, healing_plants = self._find_plant(plant_grid)
+            if self.infected and healing_plants:
+                self.food = healing_plants[0][1:]
+            elif all_plants:
+                self.food = all_plants[0][1:]
+
+    @staticmethod
+    def _field_target(x: float, y: float, field: FlowField, distance: float) -> Optional[tuple[float, float]]:
+        """从 (x, y) 沿梯度方向前进 distance 的目标点，不在势场范围内时返回 None
+
+        在源所在的格子里或多个源相互抵消时梯度为 0，此时改用最近的源的位置。
+        """
+        gradient = field.gradient(x, y)
+        if gradient is None:
+            return None
+        gx, gy = gradient
+        length = math.hypot(gx, gy)
+        if not length:
+            source = field.nearest(x, y)
+            return None if source is None else (source.x, source.y)
+        return x + gx / length * distance, y + gy / length * distance
+
+    def _steer(
+            self, croc_grid: SpatialGrid, rabbit_grid: SpatialGrid,
+            plant_grid: SpatialGrid, plant_config: PlantConfig, fields: SteeringFields, delta_time: float
+    ) -> None:
+        """按优先级决定移动方向（目标选择按决策间隔进行，转向每帧进行）"""
+        if self._decision_due(delta_time):
+            self._decide(croc_grid, rabbit_grid, plant_grid, plant_config, fields)
 
-        # ----- 优先级 -----
-        # 最优先：找最近捕食者并远离
-        pre_center = self._find_predator(crocodiles, self.config.min_croc_distance)
+        # 最优先：远离捕食者
+        pre_center = self.threat
         if pre_center:
             # 逃离方向（远离捕食者 + 预测）
             dx = self.x - pre_center[0]
@@ -256,7 +409,7 @@ class Rabbit(Animal):
             # 水平方向撞墙，沿 y 滑动
             if not (self.size[0] <= next_x <= MapConfig.width - self.size[0]):
                 angle = math.copysign(math.pi / 2, test_dy)
-            
+
             # 垂直方向撞墙，沿 x 滑动
             if not (self.size[1] <= next_y <= MapConfig.height - self.size[1]):
                 angle = 0 if test_dx > 0 else math.pi
@@ -266,65 +419,33 @@ class Rabbit(Animal):
             proximity_y = min(abs(self.y - self.margin), abs(self.y - (MapConfig.height - self.margin))) / self.margin
             proximity = min(proximity_x, proximity_y)
             noise = max(self.min_noise, self.max_noise * proximity)
-            angle += random.uniform(-noise, noise)
+            angle += self.rng.uniform(-noise, noise)
 
             # 应用角度
             self.angle = angle
 
         else:
             # 最低优先：避免同类过近
-            for other in rabbits:
-                if other != self:
-                    dist = math.hypot(self.x - other.x, self.y - other.y)
-                    if dist < self.config.min_distance:
-                        avoid_angle = math.atan2(self.y - other.y, self.x - other.x)
-                        self.angle = avoid_angle + random.uniform(0, math.pi / 2)
-                        break
-            
-            # 次优先：靠近植物
-            if not plant_config.is_invincible:
-                all_plants, healing_plants = self._find_plant(plants)
-
-                # 如果自身感染，并且范围里有治愈药草
-                if self.infected and healing_plants:
-                    target_x, target_y = healing_plants[0][1], healing_plants[0][2]
-                    self.angle = math.atan2(target_y - self.y, target_x - self.x)
-                    self.angle += random.uniform(-math.pi / 10, math.pi / 10)
-
-                # 如果范围里有普通植物
-                elif all_plants:
-                    target_x, target_y = all_plants[0][1], all_plants[0][2]
-                    self.angle = math.atan2(target_y - self.y, target_x - self.x)
-                    self.angle += random.uniform(-math.pi / 10, math.pi / 10)
-
-        # ----- 移动逻辑 -----
-        dx = self.speed * math.cos(self.angle)
-        dy = self.speed * math.sin(self.angle)
-
-        # 边界反弹
-        if not (self.size[0] <= self.x + dx <= MapConfig.width - self.size[0]):
-            self.angle = math.pi - self.angle
-        if not (self.size[1] <= self.y + dy <= MapConfig.height - self.size[1]):
-            self.angle = -self.angle
-
-        # 更新位置
-        self.x += dx
-        self.y += dy
-        self.x = max(self.size[0], min(MapConfig.width - self.size[0], self.x))
-        self.y = max(self.size[1], min(MapConfig.height - self.size[1], self.y))
-
-    def _find_predator(self, crocodiles: list[Crocodile], detection_radius: int) -> Optional[tuple[float, float]]:
+            if self.neighbor is not None:
+                avoid_angle = math.atan2(self.y - self.neighbor[1], self.x - self.neighbor[0])
+                self.angle = avoid_angle + self.rng.uniform(0, math.pi / 2)
+
+            # 次优先：靠近植物（护盾期间植物不可食用）
+            if self.food is not None and not plant_config.is_invincible:
+                target_x, target_y = self.food
+                self.angle = math.atan2(target_y - self.y, target_x - self.x)
+                self.angle += self.rng.uniform(-math.pi / 10, math.pi / 10)
+
+    def _find_predator(self, croc_grid: SpatialGrid, detection_radius: int) -> Optional[tuple[float, float]]:
         """寻找最近的食肉动物 carnivore"""
         predators = []
         weights = []
         ε = 1e-3
 
-        for other in crocodiles:
-            distance = math.hypot(self.x - other.x, self.y - other.y)
-            if distance < detection_radius:
-                weight = 1 / (distance ** 2 + ε)  # 越近权重越大
-                predators.append((other.x, other.y, weight))
-                weights.append(weight)
+        for other, distance in croc_grid.query_radius(self.x, self.y, detection_radius):
+            weight = 1 / (distance ** 2 + ε)  # 越近权重越大
+            predators.append((other.x, other.y, weight))
+            weights.append(weight)
 
         if not predators:
             return None
@@ -344,21 +465,21 @@ class Rabbit(Animal):
         return 0.0
 
     def _find_plant(
-            self, plants: list[Plant]
+            self, plant_grid: SpatialGrid
     ) -> tuple[list[tuple[float, float, float]], list[tuple[float, float, float]]]:
         """寻找最近的草和治愈药草"""
         all_plants, healing_plants = [], []
+        search_radius = max(self.config.min_plant_distance, self.config.min_plant_distance_infected)
 
-        for plant in plants:
+        for plant, dist in plant_grid.query_radius(self.x, self.y, search_radius):
             cur_x, cur_y = plant.x, plant.y
-            dist = math.hypot(self.x - cur_x, self.y - cur_y)
 
             if dist < self.config.min_plant_distance:
                 heapq.heappush(all_plants, (dist, cur_x, cur_y))
-            
+
             if plant.medicative and dist < self.config.min_plant_distance_infected:
                 heapq.heappush(healing_plants, (dist, cur_x, cur_y))
-        
+
         return all_plants, healing_plants
 
     def infect(self, virus_image_path: str) -> None:
@@ -366,20 +487,15 @@ class Rabbit(Animal):
         # 如果免疫，则不感染
         if self.immune:
             return
-        
+
         # 受感染，获得免疫力，下次不会被感染
         self.infected = True
         self.immune = True
 
         # 替换贴图
-        if virus_image_path not in Animal.loaded_images:
-            Animal.loaded_images[virus_image_path] = pygame.transform.smoothscale(
-                pygame.image.load(virus_image_path).convert_alpha(),
-                (self.size[0] * 2, self.size[1] * 2)
-            )
-        self.image = Animal.loaded_images[virus_image_path]
+        self.image_path = virus_image_path
 
     def disinfect(self) -> None:
         """兔子被治愈，替换贴图"""
         self.infected = False
-        self.image = Animal.loaded_images[self.config.image]
+        self.image_path = self.config.image
@@ -0,0 +1,193 @@
+"""
+engine.py
+
+功能: 基于 NumPy 结构数组（SoA）的动物批量移动引擎
+时间: 2026/10/17
+版本: 1.0
+"""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Optional
+
+import numpy as np
+
+from game.utils import MapConfig
+
+
+if TYPE_CHECKING:
+    from .animal import Animal, AnimalConfig
+
+
+class EngineField:
+    """动物属性描述符：挂接到引擎时读写引擎数组，否则读写实例字典"""
+
+    DTYPES = {float: np.float64, int: np.int64, bool: np.bool_}
+
+    def __init__(self, cast: Callable[[Any], Any] = float):
+        self.cast = cast
+        self.dtype = self.DTYPES[cast]
+        self.name = None
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, obj: Any, objtype: type = None) -> Any:
+        if obj is None:
+            return self
+        engine = obj._engine
+        if engine is None:
+            return obj.__dict__[self.name]
+        return self.cast(engine.arrays[self.name][obj._slot])
+
+    def __set__(self, obj: Any, value: Any) -> None:
+        engine = obj._engine
+        if engine is None:
+            obj.__dict__[self.name] = value
+        else:
+            engine.arrays[self.name][obj._slot] = value
+
+
+class AnimalEngine:
+    """以连续数组保存同一物种的位置、速度、角度、年龄等属性，并整体推进"""
+
+    def __init__(
+            self, species: type[Animal], config: AnimalConfig, capacity: int = 64,
+            rng: Optional[np.random.Generator] = None
+    ):
+        self.species = species
+        self.config = config
+        self.rng = rng if rng is not None else np.random.default_rng()
+
+        # 收集物种上所有 EngineField 属性
+        self.fields: dict[str, EngineField] = {}
+        for klass in reversed(species.__mro__):
+            for name, attr in vars(klass).items():
+                if isinstance(attr, EngineField):
+                    self.fields[name] = attr
+
+        self.capacity = capacity
+        self.count = 0
+        self.animals: list[Animal] = []    # 槽位 -> 动物
+        self.arrays = {name: np.zeros(capacity, dtype=field.dtype) for name, field in self.fields.items()}
+
+        # 引擎级的速度属性，用于检测科技树造成的变化
+        self.ave_speed = config.ave_speed
+        self.min_speed = config.ave_speed - config.range_speed
+        self.max_speed = config.ave_speed + config.range_speed
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        """获取某一属性当前有效部分的数组视图"""
+        return self.arrays[name][:self.count]
+
+    def _grow(self) -> None:
+        """容量翻倍"""
+        self.capacity *= 2
+        for name, arr in self.arrays.items():
+            new_arr = np.zeros(self.capacity, dtype=arr.dtype)
+            new_arr[:self.count] = arr[:self.count]
+            self.arrays[name] = new_arr
+
+    def attach(self, animal: Animal) -> None:
+        """把动物的属性搬入引擎数组，动物对象从此成为数组视图"""
+        if animal._engine is self:
+            return
+        if self.count == self.capacity:
+            self._grow()
+
+        slot = self.count
+        for name in self.fields:
+            self.arrays[name][slot] = animal.__dict__.pop(name)
+        animal._engine = self
+        animal._slot = slot
+        self.animals.append(animal)
+        self.count += 1
+
+    def detach(self, animal: Animal) -> None:
+        """把属性写回动物对象，并用末尾槽位填补空缺"""
+        slot = animal._slot
+        for name, field in self.fields.items():
+            animal.__dict__[name] = field.cast(self.arrays[name][slot])
+        animal._engine = None
+        animal._slot = None
+
+        last = self.count - 1
+        if slot != last:
+            moved = self.animals[last]
+            for arr in self.arrays.values():
+                arr[slot] = arr[last]
+            moved._slot = slot
+            self.animals[slot] = moved
+        self.animals.pop()
+        self.count -= 1
+
+    def sync(self, animals: Iterable[Animal]) -> None:
+        """与动物列表对齐：移除已不存在的动物，挂接新出生的动物"""
+        animals = list(animals)
+        alive = set(animals)
+        for animal in self.animals[:]:
+            if animal not in alive:
+                self.detach(animal)
+        for animal in animals:
+            if animal._engine is not self:
+                self.attach(animal)
+
+    def update_basic_stats(self) -> None:
+        """检测科技树造成的速度变化"""
+        if self.ave_speed == self.config.ave_speed:
+            return
+        self.ave_speed = self.config.ave_speed
+        self.min_speed = self.ave_speed - self.config.range_speed
+        self.max_speed = self.ave_speed + self.config.range_speed
+        self["speed"][:] = self.rng.uniform(self.min_speed, self.max_speed, self.count)
+        for animal in self.animals:
+            animal.ave_speed = self.ave_speed
+            animal.min_speed = self.min_speed
+            animal.max_speed = self.max_speed
+
+    def jitter(self) -> None:
+        """速度与角度的随机扰动"""
+        n = self.count
+        rate = self.config.speed_change_rate
+        self["speed"][:] += self.rng.uniform(-rate, rate, n)
+        rate = self.config.angle_change_rate
+        self["angle"][:] += self.rng.uniform(-rate, rate, n)
+
+    def apply_boost(self, delta_time: float) -> None:
+        """加速状态：有剩余加速时间的动物提速，其余动物清零"""
+        boost_time = self["boost_active_time"]
+        if not self.config.boosting:
+            boost_time[:] = 0
+            return
+
+        boosted = boost_time > 0
+        boost_time[boosted] -= delta_time
+        boost_time[~boosted] = 0
+        self["speed"][boosted] *= self.config.boost_rate
+        if not boosted.all():
+            self.config.boosting = False
+
+    def integrate(self) -> None:
+        """按当前速度和角度整体移动，处理边界反弹"""
+        speed, angle = self["speed"], self["angle"]
+        x, y = self["x"], self["y"]
+        size_x, size_y = self.config.size
+        max_x, max_y = MapConfig.width - size_x, MapConfig.height - size_y
+
+        dx = speed * np.cos(angle)
+        dy = speed * np.sin(angle)
+
+        # 边界反弹
+        next_x, next_y = x + dx, y + dy
+        bounce_x = (next_x < size_x) | (next_x > max_x)
+        angle[bounce_x] = np.pi - angle[bounce_x]
+        bounce_y = (next_y < size_y) | (next_y > max_y)
+        angle[bounce_y] = -angle[bounce_y]
+
+        # 更新位置
+        self["prev_x"][:] = x
+        self["prev_y"][:] = y
+        np.clip(next_x, size_x, max_x, out=x)
+        np.clip(next_y, size_y, max_y, out=y)
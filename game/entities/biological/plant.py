@@ -7,13 +7,15 @@ plant.py
 """
 
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 import random
 
 import pygame
 
-from game.utils import (MapConfig, PlantConfig)
-from game.core import ResourceManager
+from game.utils import (MapConfig, PlantConfig, load_image, hazard_probability)
+from game.core import (
+    ResourceManager, SpatialGrid, FreeSpaceSampler, SteeringFields, EntityStore, EventScheduler, segment_distance
+)
 from game.environment import Season
 
 
@@ -22,209 +24,182 @@ if TYPE_CHECKING:
 
 
 class Plant:
-    """管理植物的创建、繁殖、死亡等事件"""
-
-    config: PlantConfig = None
-    active_time = 0
-    states = {
-        "boosting": 0,
-        "is_medicative": 0,
-        "is_invincible": 0,
-    }
-    last_update_time = pygame.time.get_ticks()
-    last_remove_time = pygame.time.get_ticks()
-    loaded_images = {}
-    
+    """植物实体"""
+
     def __init__(self, x: float, y: float, config: PlantConfig):
         self.x = x
         self.y = y
         self.size = config.size
-
-        self._load_image(config.image)
-        self._load_image(config.image_medicative)
-        self.image = Plant.loaded_images[config.image]
+        self.image_path = config.image   # 贴图路径（绘制时才加载）
 
         self.medicative = False   # 是否有治愈性
 
-    @classmethod
-    def _load_image(cls, image_path: str) -> None:
-        """预加载贴图资源"""
-        if image_path not in cls.loaded_images:
-            cls.loaded_images[image_path] = pygame.transform.smoothscale(
-                pygame.image.load(image_path).convert_alpha(),
-                (cls.config.size[0] * 2, cls.config.size[1] * 2)
-            )
+    @property
+    def image(self) -> pygame.surface.Surface:
+        """当前贴图"""
+        return load_image(self.image_path, (self.size[0] * 2, self.size[1] * 2))
 
     def draw(self, screen: pygame.surface.Surface) -> None:
         """绘制植物"""
         rect = self.image.get_rect(center=(self.x, self.y))
         screen.blit(self.image, rect)
 
-    @staticmethod
-    def _is_too_close_p(new_plant: Plant, plants: list[Plant]) -> bool:
-        """控制植物距离"""
-        for plant in plants:
-            distance = (new_plant.x - plant.x) ** 2 + (new_plant.y - plant.y) ** 2
-            if distance < Plant.config.min_distance_square:
-                return True
-        return False
-
-    @staticmethod
-    def _create_new_plant(config: PlantConfig) -> Plant:
-        """新建一个植物实例"""
-        new_x = random.uniform(config.size[0], MapConfig.width - config.size[0])
-        new_y = random.uniform(config.size[1], MapConfig.height - config.size[1])
-        return Plant(new_x, new_y, config)
-
-    @classmethod
-    def initialize_plants(cls, num_plants: int) -> list[Plant]:
+
+class PlantManager:
+    """管理植物的创建、繁殖、死亡等事件（每个世界一个实例）"""
+
+    STATES = ("boosting", "is_medicative", "is_invincible")   # 限时的特殊状态
+
+    def __init__(self, config: PlantConfig, scheduler: EventScheduler, rng: Any = random):
+        self.config = config    # 植物属性配置
+        self.scheduler = scheduler   # 特殊状态的结束由定时事件触发
+        self.rng = rng          # 植物放置、繁殖与枯萎的随机数生成器
+        self.active_time = 0    # 累计繁殖时间
+        for state in self.STATES:
+            self.scheduler.register(f"plant.{state}", lambda s=state: setattr(self.config, s, False))
+        self.sampler = FreeSpaceSampler(   # 空位采样网格
+            MapConfig.width, MapConfig.height, config.min_distance, margin=config.size, rng=rng
+        )
+
+    def _create_new_plant(self) -> Plant | None:
+        """在空位上新建一个植物实例，没有空位时返回 None"""
+        position = self.sampler.sample()
+        if position is None:
+            return None
+        new_plant = Plant(*position, self.config)
+        self.sampler.insert(new_plant)
+        return new_plant
+
+    def initialize_plants(self, num_plants: int) -> list[Plant]:
         """初始化植物"""
         plants = []
         for _ in range(num_plants):
-            for _ in range(100):
-                new_plant = cls._create_new_plant(cls.config)
-                if not cls._is_too_close_p(new_plant, plants):
-                    plants.append(new_plant)
-                    break
+            new_plant = self._create_new_plant()
+            if new_plant is not None:
+                plants.append(new_plant)
+            elif self.sampler.is_full:
+                break
         return plants
 
-    @classmethod
     def add_new_plant(
-            cls, plants: list[Plant],
-            season: Season, resource_manager: ResourceManager,
-            time_speed: int, pause: bool
+            self, plants: EntityStore, plant_grid: SpatialGrid, fields: SteeringFields,
+            season: Season, resource_manager: ResourceManager, delta_time: float
     ) -> None:
         """植物繁殖"""
         # 如果还有植物，则植物可以繁衍
         if len(plants) != 0:
-            # 活跃时间检查
-            now = pygame.time.get_ticks()
-            delta_time = now - cls.last_update_time
-            cls.last_update_time = now
-            if pause:
+            # 暂停时 delta_time 为 0
+            if not delta_time:
                 return
-            delta_time *= time_speed
-            cls.active_time += delta_time
+            self.active_time += delta_time
 
             # 计算季节倍率
-            base_interval = cls.config.reproduction_interval
+            base_interval = self.config.reproduction_interval
             base_interval *= season.get_multiplier_p()
 
             # 判断是否在下雨
             if season.is_raining:
-                base_interval *= cls.config.rain_bonus
+                base_interval *= self.config.rain_bonus
 
             # 判断是否处于加速状态
-            if cls._update_state("boosting", delta_time):
-                interval = base_interval * cls.config.boost_rate   # 加速生长
+            if self.config.boosting:
+                interval = base_interval * self.config.boost_rate   # 加速生长
             else:
                 interval = base_interval
 
-            # 判断是否拥有治愈能力
-            cls._update_state("is_medicative", delta_time)
-
             # 如果过去一定时间
-            if cls.active_time > interval:
-                cls.active_time = 0
+            if self.active_time > interval:
+                self.active_time = 0
 
                 # 判断是否双倍繁殖
-                cur_num = 0
-                if cls.config.double_reproduction and random.random() < cls.config.double_reproduction_rate:
+                if self.config.double_reproduction and self.rng.random() < self.config.double_reproduction_rate:
                     target_num = 2
                 else:
                     target_num = 1
 
-                # 尝试一定次数
-                for _ in range(100 * target_num):
-                    new_plant = cls._create_new_plant(cls.config)
+                for _ in range(target_num):
+                    # 地图已满则立即停止
+                    if self.sampler.is_full:
+                        break
 
-                    # 判断该位置能否生成植物
-                    if not cls._is_too_close_p(new_plant, plants):
+                    # 在空位生成植物
+                    new_plant = self._create_new_plant()
+                    if new_plant is None:
+                        continue
 
-                        # 决定该植物是否有治愈能力
-                        if cls.config.is_medicative and random.random() < cls.config.medicative_prob:
-                            new_plant.medicative = True
-                            new_plant.image = Plant.loaded_images[cls.config.image_medicative]
+                    # 决定该植物是否有治愈能力
+                    if self.config.is_medicative and self.rng.random() < self.config.medicative_prob:
+                        new_plant.medicative = True
+                        new_plant.image_path = self.config.image_medicative
 
-                        # 添加植物，增长资源
-                        plants.append(new_plant)
-                        resource_manager.gain_leafium()
+                    # 添加植物，增长资源
+                    plants.add(new_plant)
+                    plant_grid.insert(new_plant)
+                    fields.add_plant(new_plant)
+                    resource_manager.gain_leafium()
 
-                        # 达到要求则退出
-                        cur_num += 1
-                        if cur_num >= target_num:
-                            break
-
-    @classmethod
     def remove_plants_near_animals(
-            cls, plants: list[Plant], animals: list[Rabbit],
-            season: Season, resource_manager: ResourceManager,
-            time_speed: int, pause: bool
+            self, plants: EntityStore, plant_grid: SpatialGrid, rabbit_grid: SpatialGrid, fields: SteeringFields,
+            season: Season, resource_manager: ResourceManager, delta_time: float
     ) -> None:
         """移除植物"""
-        # 活跃时间检查
-        now = pygame.time.get_ticks()
-        delta_time = now - cls.last_remove_time
-        cls.last_remove_time = now
-        if pause:
+        # 暂停时 delta_time 为 0
+        if not delta_time:
             return
-        delta_time *= time_speed
 
         # 判断植物是否有护盾
-        if cls._update_state("is_invincible", delta_time):
+        if self.config.is_invincible:
             return
 
-        # 找到所有离兔子太近的植物
-        plants_to_remove = []
+        # 找到所有被兔子吃掉的植物（沿兔子本 tick 的移动轨迹做扫掠检测，结果与步长无关）
         for plant in plants:
-            animal = cls._is_too_close_a(plant, animals)
+            animal = self._is_too_close_a(plant, rabbit_grid)
             if animal:
-                plants_to_remove.append(plant)    # 植物加入到待删除列表
+                self._kill_plant(plant, plants, plant_grid, fields)   # 植物标记死亡，帧末统一删除
                 animal.eaten += 1                 # 对应的动物增加吃植物数量
                 animal.energy += 1                # 对应的动物增加能量
                 if plant.medicative and animal.infected:   # 对应的动物被治愈，并增加一个生态点
                     animal.disinfect()
                     resource_manager.ecopoint += 1
-        
-        # 统一删除植物
-        for plant in plants_to_remove:
-            plants.remove(plant)
-
-        # 冬天拥有一定死亡概率
-        if season.current == "冬天" and not cls.config.survive_winter:
-            withering_prob = 0.1 / 100 * cls.config.winter_harshness
-            if cls.config.is_fragile:
-                withering_prob *= 2
-
-            for plant in plants[:]:    # 复制列表，避免边遍历边修改
-                if random.random() < withering_prob:  # 死亡概率，越大越容易死亡
-                    plants.remove(plant)
+
+        # 冬天按枯萎率批量抽样：先抽取本 tick 的死亡数量，再随机选出枯萎的植物
+        if season.current == "冬天" and not self.config.survive_winter:
+            withering_rate = self.config.withering_rate * self.config.winter_harshness
+            if self.config.is_fragile:
+                withering_rate *= 2
+
+            alive = [plant for plant in plants if plants.is_alive(plant)]
+            count = self.rng.binomialvariate(len(alive), hazard_probability(withering_rate, delta_time))
+            for plant in self.rng.sample(alive, count):
+                self._kill_plant(plant, plants, plant_grid, fields)
         
         elif season.current == "春天":
-            cls.config.is_fragile = False
-
-    @staticmethod
-    def _is_too_close_a(plant: Plant, animals: list[Rabbit]) -> Rabbit | None:
-        """判断是否被吃"""
-        for animal in animals:
-            if getattr(animal, "herbivore", False):
-                distance = (plant.x - animal.x) ** 2 + (plant.y - animal.y) ** 2
-                if distance < Plant.config.min_animal_distance_square:
-                    return animal
-        return None
-
-    @classmethod
-    def boost_growth(cls) -> None:
+            self.config.is_fragile = False
+
+    def _kill_plant(self, plant: Plant, plants: EntityStore, plant_grid: SpatialGrid, fields: SteeringFields) -> None:
+        """标记植物死亡，并立即从网格和势场中移除，避免本帧再被查询到"""
+        plants.kill(plant)
+        plant_grid.remove(plant)
+        fields.remove_plant(plant)
+        self.sampler.remove(plant)
+
+    def _is_too_close_a(self, plant: Plant, rabbit_grid: SpatialGrid) -> Rabbit | None:
+        """判断是否被吃：本 tick 移动轨迹离植物最近、且在被吃范围内的兔子"""
+        radius = self.config.min_animal_distance
+        eater, closest = None, radius
+        for animal, _ in rabbit_grid.query_radius(plant.x, plant.y, radius + rabbit_grid.max_step):
+            if not getattr(animal, "herbivore", False):
+                continue
+            dist = segment_distance(plant.x, plant.y, animal.prev_x, animal.prev_y, animal.x, animal.y)
+            if dist < closest:
+                eater, closest = animal, dist
+        return eater
+
+    def boost_growth(self) -> None:
         """触发植物加速生长"""
-        cls.config.boosting = True
-
-    @classmethod
-    def _update_state(cls, state: str, delta_time: int) -> bool:
-        """更新状态"""
-        if getattr(cls.config, state, False) and cls.states[state] > 0:
-            cls.states[state] -= delta_time
-            return True
-        else:
-            cls.states[state] = 0
-            setattr(cls.config, state, False)
-            return False
+        self.extend_state("boosting", self.config.boost_duration)
+
+    def extend_state(self, state: str, duration: float) -> None:
+        """开启特殊状态，已开启时累加剩余时长"""
+        setattr(self.config, state, True)
+        self.scheduler.postpone(f"plant.{state}", duration)
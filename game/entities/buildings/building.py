@@ -8,16 +8,24 @@ building.py
 
 import pygame
 
+from game.utils import load_image
+
 
 class Building:
     """创建和管理建筑实体"""
 
     def __init__(self, name: str, image_path: str, pos: tuple[int, int], size: tuple[int, int]):
         self.name = name
-        self.image = pygame.transform.smoothscale(pygame.image.load(image_path).convert_alpha(), size)
+        self.image_path = image_path   # 贴图路径（绘制时才加载）
+        self.size = size
         self.pos = pos
         self.visible = False
 
+    @property
+    def image(self) -> pygame.surface.Surface:
+        """建筑贴图"""
+        return load_image(self.image_path, self.size)
+
     def draw(self, screen: pygame.surface.Surface) -> None:
         """绘制建筑"""
         if self.visible:
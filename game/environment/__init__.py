@@ -1,9 +1,11 @@
 # game/environment/__init__.py
 
 from .disaster import DisasterManager
+from .epidemic import Epidemic
 from .season import Season
 
 __all__ = [
     'DisasterManager',
+    'Epidemic',
     'Season',
 ]
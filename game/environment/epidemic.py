@@ -0,0 +1,150 @@
+"""
+epidemic.py
+
+功能: 兔子瘟疫的传播系统，批量查找易感邻居，记录感染时间、康复与死亡
+时间: 2026/10/17
+版本: 1.0
+"""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any
+import random
+
+from game.utils import (RabbitConfig, hazard_probability)
+
+
+if TYPE_CHECKING:
+    from game.core import (EntityStore, SpatialGrid)
+    from game.entities import Rabbit
+
+
+class Epidemic:
+    """按接触传染率传播瘟疫，并统计每个 tick 的新增感染、康复和死亡"""
+
+    def __init__(self, config: RabbitConfig, grid: SpatialGrid, rng: Any = random):
+        self.config = config    # 兔子属性配置（传染半径、传染率、康复率）
+        self.grid = grid        # 临时空间网格（每 tick 只放入感染者或易感者中的一方）
+        self.rng = rng          # 传染与康复抽样的随机数生成器
+
+        self.infected_at: dict[int, float] = {}   # 感染中的兔子 ID -> 感染时刻（模拟时间）
+
+        # 本 tick 的统计
+        self.contacts = 0       # "感染者 - 易感者" 接触次数
+        self.new_cases = 0      # 新增感染
+        self.recoveries = 0     # 康复（自然康复或吃到治愈药草）
+        self.deaths = 0         # 感染期间死亡
+
+        # 累计统计
+        self.total_cases = 0
+        self.total_recoveries = 0
+        self.total_deaths = 0
+
+    @property
+    def infected_count(self) -> int:
+        """当前感染中的兔子数量"""
+        return len(self.infected_at)
+
+    def infect(self, rabbit: Rabbit, now: float) -> bool:
+        """感染一只兔子并记录感染时刻，已感染或免疫时返回 False"""
+        if rabbit.infected or rabbit.immune:
+            return False
+        rabbit.infect(self.config.image_infected)
+        self.infected_at[rabbit.eid] = now
+        self.new_cases += 1
+        self.total_cases += 1
+        return True
+
+    def begin_tick(self) -> None:
+        """清零本 tick 的统计（在灾害等其他途径可能感染兔子之前调用）"""
+        self.contacts = self.new_cases = self.recoveries = self.deaths = 0
+
+    def update(self, rabbits: EntityStore, now: float, delta_time: float) -> None:
+        """推进一个 tick：核对感染记录、自然康复、按接触传播（统计在 begin_tick 之后累计）"""
+        # 暂停时 delta_time 为 0
+        if not delta_time:
+            return
+
+        infected = self._reconcile(rabbits, now)
+        if not infected:
+            return
+
+        # 自然康复（康复率为 0 时只能靠治愈药草）
+        if self.config.recovery_rate > 0:
+            count = self.rng.binomialvariate(len(infected), hazard_probability(self.config.recovery_rate, delta_time))
+            for rabbit in self.rng.sample(infected, count):
+                rabbit.disinfect()
+                self._record_recovery(rabbit.eid)
+                infected.remove(rabbit)
+
+        # 收集所有 "感染者 - 易感者" 接触（被多个感染者接触的兔子会出现多次）
+        exposures = self._exposures(infected, [r for r in rabbits if self._is_susceptible(r, rabbits)])
+        self.contacts = len(exposures)
+        if not exposures:
+            return
+
+        # 每次接触独立传染：先抽取传染次数，再选出被传染的接触
+        count = self.rng.binomialvariate(len(exposures), hazard_probability(self.config.infection_rate, delta_time))
+        for other in self.rng.sample(exposures, count):
+            self.infect(other, now)
+
+    @staticmethod
+    def _is_susceptible(rabbit: Rabbit, rabbits: EntityStore) -> bool:
+        """未感染、未免疫且存活"""
+        return not rabbit.infected and not rabbit.immune and rabbits.is_alive(rabbit)
+
+    def _exposures(self, infected: list[Rabbit], susceptible: list[Rabbit]) -> list[Rabbit]:
+        """批量查找接触：数量较少的一方作为查询点，另一方放入临时网格，返回每次接触中的易感兔子"""
+        if not infected or not susceptible:
+            return []
+
+        from_infected = len(infected) <= len(susceptible)
+        sources, targets = (infected, susceptible) if from_infected else (susceptible, infected)
+        self.grid.rebuild(targets)
+        found = self.grid.query_radius_batch([(r.x, r.y) for r in sources], self.config.infection_range)
+
+        exposures = []
+        for source, hits in zip(sources, found):
+            if from_infected:
+                exposures.extend(other for other, _ in hits)
+            else:
+                exposures.extend([source] * len(hits))
+        return exposures
+
+    def _reconcile(self, rabbits: EntityStore, now: float) -> list[Rabbit]:
+        """与兔子的实际状态对齐，返回存活的感染者
+
+        由灾害或其他途径感染的兔子补登记；已死亡或已被治愈药草治愈的兔子结束记录。
+        """
+        for eid in list(self.infected_at):
+            rabbit = rabbits.get(eid)
+            if rabbit is None or not rabbits.is_alive(rabbit):
+                del self.infected_at[eid]
+                self.deaths += 1
+                self.total_deaths += 1
+            elif not rabbit.infected:
+                self._record_recovery(eid)
+
+        infected = []
+        for rabbit in rabbits:
+            if rabbit.infected and rabbits.is_alive(rabbit):
+                self.infected_at.setdefault(rabbit.eid, now)
+                infected.append(rabbit)
+        return infected
+
+    def _record_recovery(self, eid: int) -> None:
+        """记录康复"""
+        del self.infected_at[eid]
+        self.recoveries += 1
+        self.total_recoveries += 1
+
+    def get_state(self) -> dict[str, Any]:
+        """传播系统的状态（用于快照）"""
+        return {
+            "infected_at": dict(self.infected_at),
+            "totals": (self.total_cases, self.total_recoveries, self.total_deaths),
+        }
+
+    def set_state(self, state: dict[str, Any]) -> None:
+        """恢复传播系统的状态"""
+        self.infected_at = dict(state["infected_at"])
+        self.total_cases, self.total_recoveries, self.total_deaths = state["totals"]
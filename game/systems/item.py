@@ -11,9 +11,8 @@ from typing import Callable, TYPE_CHECKING
 
 import pygame
 
-from game.entities import Plant
 from game.ui import Button
-from game.utils import (ITEM_PATH, get_font)
+from game.utils import (ITEM_PATH, get_font, render_text, load_image, get_panel)
 
 
 if TYPE_CHECKING:
@@ -26,7 +25,7 @@ class Item:
     def __init__(self, name: str, icon_path: str, cost: dict[str, int], craft_time: int, use_func: Callable[[], None]):
         self.name = name                 # 道具名称
         self.quantity = 0                # 道具数量
-        self.icon = pygame.transform.smoothscale(pygame.image.load(icon_path).convert_alpha(), (80, 80))   # 道具贴图
+        self.icon_path = icon_path       # 道具贴图路径（绘制时才加载）
         self.cost = cost                 # 道具消耗
         self.is_crafting = False         # 制作状态
         self.craft_time = craft_time     # 制作时间
@@ -34,6 +33,16 @@ class Item:
         self.btn_craft = None            # 道具制作按钮
         self.btn_use = None              # 道具使用按钮
 
+    @property
+    def icon(self) -> pygame.surface.Surface:
+        """道具贴图"""
+        return load_image(self.icon_path, (80, 80))
+
+    @property
+    def small_icon(self) -> pygame.surface.Surface:
+        """生效提示用的小贴图"""
+        return load_image(self.icon_path, (32, 32))
+
 
 class CraftingSystem:
     """管理道具的生效效果、制作状态及其使用"""
@@ -46,14 +55,14 @@ class CraftingSystem:
         self.visible = False     # 是否展开道具界面
         self.world = world
         self.resource_manager = world.resource_manager
+        self.scheduler = world.scheduler   # 道具制作完成由定时事件触发
 
-        self.font = get_font(name="SimSun", size=16)
-        self.name_font = get_font(name="SimSun", size=16)
+        self.headless = world.headless   # 无界面模式：不加载字体、不创建按钮
+        self.font = None if self.headless else get_font(name="SimSun", size=16)
+        self.name_font = None if self.headless else get_font(name="SimSun", size=16)
 
         self.items = []                        # 所有道具
         self.buttons = []                      # 所有按钮（仅创建一次）
-        self.active_time = {}                  # 每个道具的制造计时
-        self.last_update_time = pygame.time.get_ticks()
 
         self.create_default_items()
 
@@ -70,8 +79,7 @@ class CraftingSystem:
         def use_heal() -> None:
             """生成治愈性药草"""
             config = self.world.plant_config
-            config.is_medicative = True
-            Plant.states["is_medicative"] += config.medicative_duration
+            self.world.plant_manager.extend_state("is_medicative", config.medicative_duration)
 
         def use_speed() -> None:
             """给鳄鱼加速"""
@@ -87,8 +95,7 @@ class CraftingSystem:
         def use_invincible() -> None:
             """植物护盾"""
             config = self.world.plant_config
-            config.is_invincible = True
-            Plant.states["is_invincible"] += config.invincible_duration
+            self.world.plant_manager.extend_state("is_invincible", config.invincible_duration)
 
         # 添加道具
         self.items.append(Item(
@@ -108,7 +115,12 @@ class CraftingSystem:
             cost={"leafium": 10}, craft_time=10000, use_func=use_invincible)
         )
 
-        # 为每个道具分配两个按钮（制作 + 使用）
+        # 注册制作完成事件，并为每个道具分配两个按钮（制作 + 使用）
+        for item in self.items:
+            self.scheduler.register(f"craft.{item.name}", lambda i=item: self.finish_craft(i))
+        if self.headless:
+            return
+
         x_start = 160
         y_start = self.height - 160
         box_size = 150
@@ -132,7 +144,6 @@ class CraftingSystem:
 
             # 加入按钮管理列表
             self.buttons.extend([item.btn_craft, item.btn_use])
-            self.active_time[item.name] = 0
 
     def toggle_visible(self) -> None:
         """展开或收起道具面板"""
@@ -151,6 +162,19 @@ class CraftingSystem:
         for k, v in item.cost.items():
             setattr(self.resource_manager, k, getattr(self.resource_manager, k) - v)
         item.is_crafting = True
+        self.scheduler.schedule(f"craft.{item.name}", item.craft_time)
+
+    def finish_craft(self, item: Item) -> None:
+        """道具制作完成"""
+        item.is_crafting = False
+        item.quantity += 1
+
+    def get_item(self, name: str) -> Item:
+        """根据名称获取道具"""
+        for item in self.items:
+            if item.name == name:
+                return item
+        raise KeyError(f"未知的道具: {name}")
 
     def try_use(self, item: Item) -> None:
         """使用道具，触发效果"""
@@ -158,24 +182,6 @@ class CraftingSystem:
             item.use_func()
             item.quantity -= 1
 
-    def update(self, time_speed: int, pause: bool) -> None:
-        """更新道具制造进度"""
-        now = pygame.time.get_ticks()
-        delta_time = now - self.last_update_time
-        self.last_update_time = now
-        if pause:
-            return
-
-        delta_time *= time_speed
-
-        for item in self.items:
-            if item.is_crafting:
-                self.active_time[item.name] += delta_time
-                if self.active_time[item.name] > item.craft_time:
-                    self.active_time[item.name] = 0
-                    item.is_crafting = False
-                    item.quantity += 1
-
     def draw(self, screen: pygame.Surface) -> None:
         """绘制道具界面，包括图标、文字、进度条和按钮"""        
         self.draw_active_icons(screen)
@@ -202,9 +208,7 @@ class CraftingSystem:
             y = y_start
 
             # 背景框（带透明度）
-            bg_surface = pygame.Surface((box_size, box_size), pygame.SRCALPHA)
-            bg_surface.fill((240, 240, 240, 140))
-            screen.blit(bg_surface, (x, y))
+            screen.blit(get_panel((box_size, box_size), (240, 240, 240, 140)), (x, y))
             pygame.draw.rect(screen, (112, 128, 144), (x, y, box_size, box_size), 2)
 
             # 图标
@@ -214,28 +218,28 @@ class CraftingSystem:
             name_x = x + 115
             name_y = y + 10
             for ch in item.name:
-                ch_surface = self.name_font.render(ch, True, (50, 50, 50))
+                ch_surface = render_text(self.name_font, ch, (50, 50, 50))
                 screen.blit(ch_surface, (name_x, name_y))
                 name_y += ch_surface.get_height() + 1  # 行间距可调
 
             # 数量
-            qty_surface = self.font.render(f"x{item.quantity}", True, (0, 0, 0))
+            qty_surface = render_text(self.font, f"x{item.quantity}", (0, 0, 0))
             screen.blit(qty_surface, (x + 10, y + 10))
 
             # 资源消耗
             cost_text = ", ".join([f"{self.RESOUCE_NAME[k]}:{v}" for k, v in item.cost.items()])
-            cost_surface = self.font.render(cost_text, True, (100, 50, 50))
+            cost_surface = render_text(self.font, cost_text, (100, 50, 50))
             screen.blit(cost_surface, (x + 10, y + 82))
 
             # 制作进度条与剩余时间
             if item.is_crafting:
-                remaining_time = item.craft_time - self.active_time[item.name]
+                remaining_time = self.scheduler.remaining(f"craft.{item.name}")
 
                 bar_w = int((1 - remaining_time / item.craft_time) * (box_size - 20))
                 pygame.draw.rect(screen, (100, 200, 100), (x + 10, y + 105, bar_w, 5))
 
-                time_left = remaining_time // 1000 + 1
-                time_surface = self.font.render(f"{time_left}s", True, (150, 0, 0))
+                time_left = int(remaining_time // 1000) + 1
+                time_surface = render_text(self.font, f"{time_left}s", (150, 0, 0))
                 screen.blit(time_surface, (x + box_size - 40, y + 82))
 
             # 按钮绘制
@@ -249,13 +253,13 @@ class CraftingSystem:
         active_icons = []
 
         if self.world.plant_config.is_medicative:
-            active_icons.append(self.items[0].icon)  # 治愈药草
+            active_icons.append(self.items[0].small_icon)  # 治愈药草
 
         if self.world.croc_config.boosting:
-            active_icons.append(self.items[1].icon)  # 加速鳄鱼
+            active_icons.append(self.items[1].small_icon)  # 加速鳄鱼
 
         if self.world.plant_config.is_invincible:
-            active_icons.append(self.items[3].icon)  # 植物护盾
+            active_icons.append(self.items[3].small_icon)  # 植物护盾
 
         icon_size = 32
         padding = 5
@@ -263,8 +267,7 @@ class CraftingSystem:
         y = 50
 
         for i, icon in enumerate(active_icons):
-            icon_small = pygame.transform.smoothscale(icon, (icon_size, icon_size))
-            screen.blit(icon_small, (start_x + i * (icon_size + padding), y))
+            screen.blit(icon, (start_x + i * (icon_size + padding), y))
 
     def handle_event(self, event: pygame.event.Event) -> None:
         """转发事件给所有按钮"""
@@ -6,12 +6,17 @@ tech_tree.py
 版本: 1.0
 """
 
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
 import pygame
 
-from game.core import ResourceManager
-from game.utils import (BUILDING_PATH, color, sound_manager, get_font)
-from game.entities import (Rabbit, Crocodile, Plant, Building)
-from game.environment import Season
+from game.utils import (BUILDING_PATH, color, sound_manager, get_font, render_text, get_panel)
+from game.entities import Building
+
+
+if TYPE_CHECKING:
+    from game.core import World
 
 
 class TechTree:
@@ -20,13 +25,15 @@ class TechTree:
     RESOUCE_NAME = {"leafium": "绿素", "animite": "兽能", "ecopoint": "生态点"}
 
     def __init__(
-            self, resource_manager: ResourceManager, width: int, height: int,
-            font_name: str = "SimSun", font_size: int = 20
+            self, world: World, width: int, height: int,
+            font_name: str = "SimSun", font_size: int = 20, headless: bool = False
     ):
-        self.resource_manager = resource_manager   # 资源管理器
+        self.world = world                         # 所属世界（科技效果作用于该世界的配置）
+        self.resource_manager = world.resource_manager   # 资源管理器
+        self.headless = headless       # 无界面模式：不加载字体、不播放音效
         self.width = width             # 屏幕宽度
         self.height = height           # 屏幕高度
-        self.font = get_font(font_name, font_size)   # 创建字体
+        self.font = None if headless else get_font(font_name, font_size)   # 创建字体
         self.visible = False           # 可见性
         self.unlock_message = None     # 解锁提示文字
         self.unlock_time = 0           # 解锁时间
@@ -85,6 +92,13 @@ class TechTree:
 
         self.rects = []  # 存储按钮区域
 
+        # 面板缓存：布局只在屏幕尺寸变化时计算，合成的面板只在解锁、悬停变化或布局变化时重新绘制
+        self.layout_size = None   # 计算布局时的屏幕尺寸
+        self.labels = []          # 区域标题及其位置
+        self.panel_rect = None    # 面板覆盖的区域（所有标题和方框的外接矩形）
+        self.panel = None         # 合成好的面板
+        self.panel_key = None     # 合成面板时的悬停和解锁状态
+
         self.buildings = {
             "植物庇护站": Building(
                 name="植物庇护站", image_path=BUILDING_PATH / "plant_shelter.png",
@@ -133,64 +147,76 @@ class TechTree:
         self.unlock_time = pygame.time.get_ticks()
 
     def apply_effects(self) -> None:
-        """根据已解锁科技，修改系统配置"""
+        """根据已解锁科技，修改所属世界的配置"""
+        plant_config = self.world.plant_config
+        rabbit_config = self.world.rabbit_config
+        croc_config = self.world.croc_config
+        season_config = self.world.season_config
+
         for area, techs in self.techs.items():
             for i, tech in enumerate(techs):
                 if tech["unlocked"] and not tech["applied"]:
-                    sound_manager.sound_dict["click_tech"].play()
+                    if not self.headless:
+                        sound_manager.sound_dict["click_tech"].play()
                     name = tech["name"]
 
                     # 植物科技
                     if name == "繁殖加速-α型":    # 繁殖加速-α型：略微提高植物的繁殖速度
-                        Plant.config.reproduction_interval -= 500
+                        plant_config.reproduction_interval -= 500
                     elif name == "繁殖加速-β型":  # 繁殖加速-β型：植物每次有概率双倍繁殖
-                        Plant.config.double_reproduction = True
+                        plant_config.double_reproduction = True
                     elif name == "亲水基因":      # 亲水基因：植物在下雨时繁殖更快，但冬天更容易死亡
-                        Plant.config.rain_bonus = 0.5
-                        Plant.config.winter_harshness = 1.5
+                        plant_config.rain_bonus = 0.5
+                        plant_config.winter_harshness = 1.5
                     elif name == "耐寒基因":      # 耐寒基因：植物在冬天不再因严寒而死亡
-                        Plant.config.survive_winter = True
+                        plant_config.survive_winter = True
 
                     # 动物科技
                     elif name == "兔子：速度增强":  # 兔子：速度增强：兔子速度更快，但觅食范围略微缩小
-                        Rabbit.config.ave_speed += 0.2
-                        Rabbit.config.min_plant_distance -= 10
+                        rabbit_config.ave_speed += 0.2
+                        rabbit_config.min_plant_distance -= 10
                     elif name == "兔子：繁殖季":    # 兔子：繁殖季：春天兔子繁殖更快
-                        Rabbit.config.reproduction_threshold["春天"] -= 1
+                        rabbit_config.reproduction_threshold["春天"] -= 1
                     elif name == "鳄鱼：节育本能":  # 鳄鱼：节育本能：鳄鱼需要多吃一只兔子才能繁殖
                         for s in ("春天", "夏天", "秋天", "冬天"):
-                            Crocodile.config.reproduction_threshold[s] += 1
+                            croc_config.reproduction_threshold[s] += 1
                     elif name == "鳄鱼：咬合进化":  # 鳄鱼：咬合进化：鳄鱼的捕食范围变大
-                        Crocodile.config.min_eat_distance += 10
+                        croc_config.min_eat_distance += 10
 
                     # 天气科技
                     elif name == "生态调节系统":  # 生态调节系统：生态点增长得更快
-                        ResourceManager.eco_interval -= 3000
+                        self.resource_manager.eco_interval -= 3000
+                        self.world.scheduler.postpone("resources.ecopoint", -3000)
                     elif name == "季节稳定系统":  # 季节稳定系统：每个季节延长 5 秒
-                        Season.config.switch_interval += 5000
+                        season_config.switch_interval += 5000
+                        self.world.scheduler.postpone("season.switch", 5000)
                     elif name == "降雨干预系统":  # 降雨干预系统：全年降雨增多
-                        Season.config.rain_probability = 0.4
+                        season_config.rain_probability = 0.4
 
                     # 建筑科技
                     elif name == "植物庇护站":  # 植物庇护站：植物在冬天的繁殖速度更快
-                        Season.config.interval_multipliers["冬天"] = 1.5
+                        season_config.interval_multipliers["冬天"] = 1.5
                         self.buildings[name].visible = True
                     elif name == "动物缓冲地带":  # 动物缓冲地带：动物在冬天的移速略微增加
-                        Season.config.speed_multipliers["冬天"] = 0.8
+                        season_config.speed_multipliers["冬天"] = 0.8
                         self.buildings[name].visible = True
                     elif name == "兔子哨站":    # 兔子哨站：扩大兔子感知掠食者的范围
-                        Rabbit.config.min_croc_distance += 50
+                        rabbit_config.min_croc_distance += 50
                         self.buildings[name].visible = True
                     
                     tech["applied"] = True  # 标记为已应用
 
-    def draw(self, screen: pygame.surface.Surface) -> None:
-        """绘制科技树、说明和提示"""
-        if not self.visible:
-            return
+    def tech_text(self, tech: dict) -> str:
+        """科技方框中的文字：科技名和消耗"""
+        return f"{tech["name"]} - " + ", ".join([
+            f"{self.RESOUCE_NAME[k]}：{v}"
+            for k, v in tech["cost"].items()
+        ])
 
-        # 更新悬停状态
-        self.update_hover_state()
+    def update_layout(self) -> None:
+        """计算区域标题和科技方框的位置（首次绘制或屏幕尺寸变化时才计算）"""
+        if self.layout_size == (self.width, self.height):
+            return
 
         # 科技方框布局参数
         margin_x = 80
@@ -199,6 +225,7 @@ class TechTree:
         box_height = 40
         padding_x = 20   # 水平方向的内边距
         self.rects = []
+        self.labels = []
 
         # 区域布局
         positions = {
@@ -208,55 +235,78 @@ class TechTree:
             "建筑效果": (self.width // 2 + margin_x, self.height // 2 + margin_y - 80),
         }
 
+        bounds = []
         for area, techs in self.techs.items():
             base_x, base_y = positions[area]
-            label = self.font.render(area, True, color.BLACK)
-            screen.blit(label, (base_x, base_y - 40))
+            self.labels.append((area, (base_x, base_y - 40)))
+            bounds.append(pygame.Rect((base_x, base_y - 40), self.font.size(area)))
 
             for i, tech in enumerate(techs):
-                # 拼接科技名和消耗文本
-                tech_text = f"{tech["name"]} - " + ", ".join([
-                    f"{self.RESOUCE_NAME[k]}：{v}"
-                    for k, v in tech["cost"].items()
-                ])
-                text_surface = self.font.render(tech_text, True, (0, 0, 0))
-
                 # 动态获取文本宽度
-                text_width, _ = self.font.size(tech_text)
+                text_width, _ = self.font.size(self.tech_text(tech))
                 box_width = text_width + padding_x * 2
 
-                # 绘制背景框
+                # 保存点击区域
                 rect = pygame.Rect(base_x, base_y + i * spacing_y, box_width, box_height)
+                self.rects.append((rect, area, i))
+                bounds.append(rect)
+
+        self.panel_rect = bounds[0].unionall(bounds[1:])
+        self.layout_size = (self.width, self.height)
+        self.panel = None
+
+    def compose_panel(self) -> pygame.surface.Surface:
+        """把区域标题和所有科技方框合成到一张面板上"""
+        padding_x = 20
+        panel = pygame.Surface(self.panel_rect.size, pygame.SRCALPHA)
+        offset_x, offset_y = self.panel_rect.topleft
+
+        for area, (x, y) in self.labels:
+            panel.blit(render_text(self.font, area, color.BLACK), (x - offset_x, y - offset_y))
+
+        for rect, area, i in self.rects:
+            tech = self.techs[area][i]
+            if tech["unlocked"]:
+                cur_color = self.color_unlocked
+            elif self.hovered_index == (area, i):
+                cur_color = self.color_hover
+            else:
+                cur_color = self.color_idle
+
+            # 绘制背景框和文字
+            box = rect.move(-offset_x, -offset_y)
+            pygame.draw.rect(panel, cur_color, box)
+            pygame.draw.rect(panel, (0, 0, 0), box, 1)
+            panel.blit(render_text(self.font, self.tech_text(tech), (0, 0, 0)), (box.x + padding_x, box.y + 8))
+        return panel
 
-                if tech["unlocked"]:
-                    cur_color = self.color_unlocked
-                elif self.hovered_index == (area, i):
-                    cur_color = self.color_hover
-                else:
-                    cur_color = self.color_idle
+    def draw(self, screen: pygame.surface.Surface) -> None:
+        """绘制科技树、说明和提示"""
+        if not self.visible:
+            return
 
-                pygame.draw.rect(screen, cur_color, rect)
-                pygame.draw.rect(screen, (0, 0, 0), rect, 1)
+        # 更新布局和悬停状态
+        self.update_layout()
+        self.update_hover_state()
 
-                # 绘制文字
-                screen.blit(text_surface, (rect.x + padding_x, rect.y + 8))
+        # 悬停或解锁状态变化时重新合成面板，否则直接贴上缓存的面板
+        key = (self.hovered_index, tuple(tech["unlocked"] for techs in self.techs.values() for tech in techs))
+        if self.panel is None or key != self.panel_key:
+            self.panel = self.compose_panel()
+            self.panel_key = key
+        screen.blit(self.panel, self.panel_rect)
 
-                # 保存点击区域
-                self.rects.append((rect, area, i))
-        
         # 绘制悬停说明
         self.draw_hover_description(screen)
 
         # 绘制解锁提示
         if self.unlock_message and pygame.time.get_ticks() - self.unlock_time < self.message_duration:
-            tip_surface = self.font.render(self.unlock_message, True, color.BLACK)
+            tip_surface = render_text(self.font, self.unlock_message, color.BLACK)
             bg_rect = tip_surface.get_rect(topright=(self.width - 30, 60))
             bg_rect.inflate_ip(12, 6)
 
             # 白色半透明背景
-            tip_bg = pygame.Surface(bg_rect.size, pygame.SRCALPHA)
-            tip_bg.fill((255, 255, 255, 140))
-            screen.blit(tip_bg, bg_rect.topleft)
+            screen.blit(get_panel(bg_rect.size, (255, 255, 255, 140)), bg_rect.topleft)
 
             # 文字绘制
             screen.blit(tip_surface, (bg_rect.left + 6, bg_rect.top + 3))
@@ -273,16 +323,14 @@ class TechTree:
                 desc = self.tooltips.get(tech["name"], "")
                 if desc:
                     # 渲染文本
-                    text_surf = self.font.render(desc, True, (0, 0, 0))
+                    text_surf = render_text(self.font, desc, (0, 0, 0))
                     padding = 10
                     bg_rect = text_surf.get_rect()
                     bg_rect.topleft = (mouse_pos[0] + 20, mouse_pos[1] + 20)
                     bg_rect.inflate_ip(padding * 2, padding * 2)
 
                     # 绘制背景框
-                    bg_surf = pygame.Surface(bg_rect.size, pygame.SRCALPHA)
-                    bg_surf.fill((255, 255, 255, 140))
-                    screen.blit(bg_surf, bg_rect.topleft)
+                    screen.blit(get_panel(bg_rect.size, (255, 255, 255, 140)), bg_rect.topleft)
 
                     # 绘制说明文字
                     screen.blit(text_surf, (bg_rect.x + padding, bg_rect.y + padding))
@@ -1,10 +1,15 @@
 # game/ui/__init__.py
 
-from .button import (Button, create_ui_buttons, toggle_pause, restart)
+from .button import (Button, create_ui_buttons, toggle_pause, restart, speed_text)
+from .renderer import (Canvas, Renderer, SpriteLayer)
 
 __all__ = [
     'Button',
     'create_ui_buttons',
     'toggle_pause',
     'restart',
+    'speed_text',
+    'Canvas',
+    'Renderer',
+    'SpriteLayer',
 ]
@@ -11,7 +11,7 @@ from typing import Optional, Callable, TYPE_CHECKING
 
 import pygame
 
-from game.utils import (color, sound_manager, get_font)
+from game.utils import (color, sound_manager, get_font, render_text, get_panel)
 
 
 if TYPE_CHECKING:
@@ -43,6 +43,7 @@ class Button:
         self.color_hover = color_hover          # 悬停颜色
         self.text_color = text_color            # 文字颜色
         self.hovered = False                    # 悬停状态
+        self.faded_text: Optional[tuple[str, pygame.surface.Surface]] = None   # 半透明时使用的文字副本（文字变化时才重新复制）
 
         self.font = get_font(name=font_name, size=font_size)   # 创建字体
 
@@ -53,20 +54,17 @@ class Button:
 
         color_now = self.color_hover if self.hovered else self.color_idle
         text_to_render = self.text() if callable(self.text) else self.text
-        text_surface = self.font.render(text_to_render, True, self.text_color)
-        text_surface.set_alpha(self.alpha)
-
-        # 创建带透明度的 Surface
-        rect_surface = pygame.Surface(self.rect.size, pygame.SRCALPHA)
-        
-        # 绘制圆角矩形填充颜色（带透明度）
-        pygame.draw.rect(rect_surface, (*color_now, self.alpha), rect_surface.get_rect(), border_radius=8)
-        
-        # 把透明 surface 贴到屏幕上
-        screen.blit(rect_surface, self.rect.topleft)
-
-        # 设置文字透明度
-        text_surface.set_alpha(self.alpha)
+        text_surface = render_text(self.font, text_to_render, self.text_color)
+
+        # 带透明度的圆角矩形（同样的颜色和透明度只创建一次）
+        screen.blit(get_panel(self.rect.size, (*color_now, self.alpha), border_radius=8), self.rect.topleft)
+
+        # 设置文字透明度（缓存的文字表面是共享的，半透明时使用按钮自己保留的副本）
+        if self.alpha < 255:
+            if self.faded_text is None or self.faded_text[0] != text_to_render:
+                self.faded_text = (text_to_render, text_surface.copy())
+            text_surface = self.faded_text[1]
+            text_surface.set_alpha(self.alpha)
         screen.blit(
             text_surface,
             (
@@ -81,7 +79,7 @@ class Button:
 
     def draw_tooltip(self, screen: pygame.surface.Surface) -> None:
         """绘制提示框"""
-        tip_surface = self.font.render(self.tooltip_text, True, color.BLACK)
+        tip_surface = render_text(self.font, self.tooltip_text, color.BLACK)
         bg_rect = tip_surface.get_rect()
 
         # 鼠标当前位置 + 偏移量（避免遮挡）
@@ -90,13 +88,8 @@ class Button:
         bg_rect.topleft = (mouse_x + offset_x, mouse_y + offset_y)
         bg_rect.inflate_ip(12, 8)
 
-        # 创建透明白背景（带圆角）
-        bg_surface = pygame.Surface(bg_rect.size, pygame.SRCALPHA)
-        bg_surface.fill((255, 255, 255, 140))
-        pygame.draw.rect(bg_surface, (255, 255, 255, 140), bg_surface.get_rect(), border_radius=6)
-
-        # 绘制背景与文字
-        screen.blit(bg_surface, bg_rect.topleft)
+        # 绘制透明白背景与文字
+        screen.blit(get_panel(bg_rect.size, (255, 255, 255, 140)), bg_rect.topleft)
         screen.blit(tip_surface, (bg_rect.left + 6, bg_rect.top + 4))
 
     def handle_event(self, event: pygame.event.Event) -> None:
@@ -119,6 +112,15 @@ def toggle_pause(world: World) -> None:
         world.pause = not world.pause
 
 
+def speed_text(world: World) -> str:
+    """倍速按钮文字：超出时间预算、实际倍速明显低于所选倍速时显示实际倍速"""
+    speed = world.clock.speed
+    effective = world.sim_clock.effective_speed
+    if effective < speed * 0.9:
+        return f"≈{effective:.0f}x"
+    return f"{speed}x"
+
+
 def restart(world: World, width: int, height: int, set_buttons: Callable[[list[Button]], None]) -> list[Button]:
     """按钮响应函数：重置"""
     sound_manager.stop_all_bgm()
@@ -164,7 +166,7 @@ def create_ui_buttons(
 
         Button(rect_info=(130, 15, 45, 30),
                on_click=lambda: world.clock.change_speed(),
-               text=lambda: f"{world.clock.speed}x",
+               text=lambda: speed_text(world),
                tooltip_text="切换倍速"),
 
         Button(rect_info=(width - 100, 15, 80, 30),
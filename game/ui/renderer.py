@@ -0,0 +1,255 @@
+"""
+renderer.py
+
+功能: 分层批量绘制与脏矩形渲染，只重绘实体位置或贴图发生变化的区域和界面覆盖的区域，并只向屏幕提交这些区域
+时间: 2026/10/17
+版本: 1.0
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass
+from itertools import repeat
+from operator import attrgetter
+from typing import Any, Callable, Iterable, Optional, Sequence
+
+import numpy as np
+import pygame
+
+
+IMAGE_PATH = attrgetter("image_path")
+
+
+def _round_center(values: np.ndarray) -> np.ndarray:
+    """按 pygame 的方式把中心坐标取整：四舍五入，.5 远离 0"""
+    values = np.asarray(values, dtype=float)
+    return np.copysign(np.floor(np.abs(values) + 0.5), values).astype(np.int64)
+
+
+@dataclass
+class SpriteLayer:
+    """一层精灵：实体、贴图和绘制区域按绘制顺序存放在平行的序列中，整层用一次 blits 绘制"""
+
+    entities: list[Any]         # 实体
+    images: list[pygame.surface.Surface]   # 贴图
+    left: np.ndarray            # 绘制区域左上角横坐标
+    top: np.ndarray             # 绘制区域左上角纵坐标
+    width: np.ndarray           # 绘制区域宽度
+    height: np.ndarray          # 绘制区域高度
+
+    def __len__(self) -> int:
+        return len(self.entities)
+
+    @classmethod
+    def from_arrays(cls, entities: Sequence[Any], xs: np.ndarray, ys: np.ndarray) -> SpriteLayer:
+        """由实体和中心坐标数组生成一层精灵（同一贴图只向实体查询一次，绘制区域整体计算）"""
+        entities = list(entities)
+        count = len(entities)
+
+        # 同种实体共用配置中的贴图路径（尺寸也来自同一份配置），按路径对象分组，避免逐个对路径求哈希
+        keys = list(map(id, map(IMAGE_PATH, entities)))
+        table = {key: entity.image for key, entity in dict(zip(keys, entities)).items()}
+        images = list(map(table.__getitem__, keys))
+
+        # 贴图尺寸都相同时直接填充，否则按编号查表得到每个实体的尺寸
+        sizes = [image.get_size() for image in table.values()]
+        if len(set(sizes)) <= 1:
+            w, h = sizes[0] if sizes else (0, 0)
+            width, height = np.full(count, w, dtype=np.int64), np.full(count, h, dtype=np.int64)
+        else:
+            codes = {key: code for code, key in enumerate(table)}
+            index = np.fromiter(map(codes.__getitem__, keys), dtype=np.int64, count=count)
+            sizes = np.array(sizes, dtype=np.int64)
+            width, height = sizes[index, 0], sizes[index, 1]
+
+        # 与 Rect.center 赋值一致：中心四舍五入到整数（.5 远离 0 取整），再减去一半尺寸
+        left = _round_center(xs) - width // 2
+        top = _round_center(ys) - height // 2
+        return cls(entities, images, left, top, width, height)
+
+    @classmethod
+    def from_entities(cls, entities: Sequence[Any]) -> SpriteLayer:
+        """由带有 x、y 坐标的实体生成一层精灵"""
+        count = len(entities)
+        xs = np.fromiter(map(attrgetter("x"), entities), dtype=float, count=count)
+        ys = np.fromiter(map(attrgetter("y"), entities), dtype=float, count=count)
+        return cls.from_arrays(entities, xs, ys)
+
+    @classmethod
+    def concat(cls, layers: Sequence[SpriteLayer]) -> SpriteLayer:
+        """按顺序拼接多层精灵"""
+        entities, images = [], []
+        for layer in layers:
+            entities += layer.entities
+            images += layer.images
+
+        def join(name: str) -> np.ndarray:
+            return np.concatenate([getattr(layer, name) for layer in layers] or [np.zeros(0, dtype=np.int64)])
+
+        return cls(entities, images, join("left"), join("top"), join("width"), join("height"))
+
+    def blit_sequence(self, indices: Optional[Iterable[int]] = None) -> list[tuple[pygame.surface.Surface, tuple[int, int]]]:
+        """供 Surface.blits 使用的 (贴图, 位置) 序列，可只取部分精灵"""
+        if indices is None:
+            return list(zip(self.images, zip(self.left.tolist(), self.top.tolist())))
+        images, left, top = self.images, self.left, self.top
+        return [(images[i], (int(left[i]), int(top[i]))) for i in indices]
+
+    def rects(self, indices: np.ndarray) -> list[pygame.Rect]:
+        """部分精灵的绘制区域"""
+        return list(map(
+            pygame.Rect, self.left[indices].tolist(), self.top[indices].tolist(),
+            self.width[indices].tolist(), self.height[indices].tolist()
+        ))
+
+    def colliding(self, region: pygame.Rect) -> np.ndarray:
+        """与区域相交的精灵下标（按绘制顺序）"""
+        return np.flatnonzero(
+            (self.left < region.right) & (self.left + self.width > region.left)
+            & (self.top < region.bottom) & (self.top + self.height > region.top)
+        )
+
+
+class Canvas(pygame.Surface):
+    """离屏画布，开启记录时保存每次 blit / fill 覆盖的区域"""
+
+    def __init__(self, display: pygame.surface.Surface):
+        super().__init__(display.get_size(), 0, display)   # 与屏幕像素格式一致，复制到屏幕时无需转换
+        self.records: Optional[list[pygame.Rect]] = None   # 本次记录的区域，None 表示不记录
+
+    def blit(self, source: pygame.surface.Surface, dest: Any, area: Any = None, special_flags: int = 0) -> pygame.Rect:
+        rect = super().blit(source, dest, area, special_flags)
+        if self.records is not None and rect:
+            self.records.append(rect)
+        return rect
+
+    def fill(self, fill_color: Any, rect: Any = None, special_flags: int = 0) -> pygame.Rect:
+        rect = super().fill(fill_color, rect, special_flags)
+        if self.records is not None and rect:
+            self.records.append(rect)
+        return rect
+
+
+class Renderer:
+    """记录上一帧所有精灵的绘制区域和界面区域，逐帧比较后只修补受损的区域
+
+    背景颜色变化（季节渐变）或调用方要求时整屏重绘；受损区域过多或过大时整屏重绘更快。
+    """
+
+    def __init__(self, display: pygame.surface.Surface, max_regions: int = 64, max_coverage: float = 0.5):
+        self.display = display
+        self.canvas = Canvas(display)
+        self.max_regions = max_regions     # 合并后受损区域数量的上限
+        self.max_coverage = max_coverage   # 受损区域占屏幕面积比例的上限
+
+        self.background: Optional[tuple[int, ...]] = None   # 上一帧的背景颜色
+        self.drawn = SpriteLayer.concat([])   # 上一帧的所有精灵（各层按绘制顺序拼接）
+        self.image_ids = np.zeros(0, dtype=np.int64)   # 上一帧每个精灵贴图的 id（贴图仍被引用，id 不会被复用）
+        self.overlay_rects: list[pygame.Rect] = []   # 上一帧界面覆盖的区域
+        self.forced = True   # 上一帧是否被要求整屏重绘（其中的雨滴、面板等没有记录区域，下一帧也要整屏重绘）
+        self.full_redraws = 0   # 整屏重绘的帧数（统计）
+
+    def render(
+            self, background: tuple[int, ...], layers: Sequence[SpriteLayer],
+            draw_overlay: Callable[[pygame.surface.Surface], None], full: bool = False
+    ) -> list[pygame.Rect]:
+        """绘制一帧（layers 按绘制顺序排列），返回提交到屏幕的区域"""
+        drawn = SpriteLayer.concat(layers)
+        image_ids = np.fromiter(map(id, drawn.images), dtype=np.int64, count=len(drawn))
+
+        damage = None
+        if not full and not self.forced and background == self.background:
+            damage = self._damage(drawn, image_ids)
+        self.background = background
+        self.drawn = drawn
+        self.image_ids = image_ids
+        self.forced = full
+
+        if damage is None:
+            dirty = self._redraw_all(background, layers, draw_overlay)
+        else:
+            dirty = self._redraw_damage(background, drawn, damage, draw_overlay)
+        return dirty
+
+    def _damage(self, drawn: SpriteLayer, image_ids: np.ndarray) -> Optional[list[pygame.Rect]]:
+        """本帧受损的区域：新增、移除、移动或换了贴图的精灵的前后区域，以及上一帧的界面；过多时返回 None"""
+        previous = self.drawn
+
+        # 每个精灵在上一帧中的下标（-1 表示新增），再整体比较位置和贴图
+        index = dict(zip(previous.entities, range(len(previous))))
+        found = np.fromiter(map(index.get, drawn.entities, repeat(-1)), dtype=np.int64, count=len(drawn))
+        kept = np.flatnonzero(found >= 0)
+        old = found[kept]
+        changed = (
+            (previous.left[old] != drawn.left[kept]) | (previous.top[old] != drawn.top[kept])
+            | (self.image_ids[old] != image_ids[kept])
+        )
+        seen = np.zeros(len(previous), dtype=bool)
+        seen[old] = True
+
+        damage = list(self.overlay_rects)
+        damage += drawn.rects(np.flatnonzero(found < 0))
+        damage += previous.rects(old[changed])
+        damage += drawn.rects(kept[changed])
+        damage += previous.rects(np.flatnonzero(~seen))
+
+        damage = self._merge(damage)
+        area = sum(rect.width * rect.height for rect in damage)
+        if len(damage) > self.max_regions or area > self.max_coverage * self.canvas.get_width() * self.canvas.get_height():
+            return None
+        return damage
+
+    @staticmethod
+    def _merge(rects: list[pygame.Rect]) -> list[pygame.Rect]:
+        """合并相互重叠的区域，避免同一块区域重复修补"""
+        merged: list[pygame.Rect] = []
+        for rect in rects:
+            rect = pygame.Rect(rect)
+            index = rect.collidelist(merged)
+            while index >= 0:
+                rect.union_ip(merged.pop(index))
+                index = rect.collidelist(merged)
+            merged.append(rect)
+        return merged
+
+    def _draw_overlay(self, draw_overlay: Callable[[pygame.surface.Surface], None]) -> list[pygame.Rect]:
+        """绘制界面，并记录界面覆盖的区域（下一帧先修补这些区域，半透明背景不会叠加）"""
+        canvas = self.canvas
+        canvas.records = []
+        draw_overlay(canvas)
+        self.overlay_rects = canvas.records
+        canvas.records = None
+        return self.overlay_rects
+
+    def _redraw_all(
+            self, background: tuple[int, ...], layers: Sequence[SpriteLayer],
+            draw_overlay: Callable[[pygame.surface.Surface], None]
+    ) -> list[pygame.Rect]:
+        """整屏重绘（每层一次 blits）"""
+        canvas = self.canvas
+        canvas.fill(background)
+        for layer in layers:
+            canvas.blits(layer.blit_sequence(), False)
+        self._draw_overlay(draw_overlay)
+
+        self.display.blit(canvas, (0, 0))
+        pygame.display.flip()
+        self.full_redraws += 1
+        return [canvas.get_rect()]
+
+    def _redraw_damage(
+            self, background: tuple[int, ...], drawn: SpriteLayer, damage: list[pygame.Rect],
+            draw_overlay: Callable[[pygame.surface.Surface], None]
+    ) -> list[pygame.Rect]:
+        """只修补受损的区域：填充背景后，按原有顺序重绘与之相交的精灵（裁剪到该区域内）"""
+        canvas = self.canvas
+        for region in damage:
+            canvas.set_clip(region)
+            canvas.fill(background, region)
+            canvas.blits(drawn.blit_sequence(drawn.colliding(region).tolist()), False)
+        canvas.set_clip(None)
+
+        dirty = self._merge(damage + self._draw_overlay(draw_overlay))
+        for rect in dirty:
+            self.display.blit(canvas, rect, rect)
+        pygame.display.update(dirty)
+        return dirty
@@ -3,17 +3,21 @@
 from . import color
 from .config import (
     MapConfig, RabbitConfig, CrocodileConfig, PlantConfig, SeasonConfig,
-    BASE_PATH, SOUNDS_PATH, SPRITES_PATH, BUILDING_PATH, ITEM_PATH
+    BASE_PATH, SOUNDS_PATH, SPRITES_PATH, BUILDING_PATH, ITEM_PATH, FRAME_TIME
 )
 from .helpers import (draw_centered_text, draw_guide)
 from .sounds import sound_manager
-from .fonts import get_font
+from .fonts import (get_font, render_text)
+from .images import (load_image, get_panel)
+from .probability import hazard_probability
 
 __all__ = [
     'color',
     'MapConfig', 'RabbitConfig', 'CrocodileConfig', 'PlantConfig', 'SeasonConfig',
-    'BASE_PATH', 'SOUNDS_PATH', 'SPRITES_PATH', 'BUILDING_PATH', 'ITEM_PATH',
+    'BASE_PATH', 'SOUNDS_PATH', 'SPRITES_PATH', 'BUILDING_PATH', 'ITEM_PATH', 'FRAME_TIME',
     'draw_centered_text', 'draw_guide',
     'sound_manager',
-    'get_font',
+    'get_font', 'render_text',
+    'load_image', 'get_panel',
+    'hazard_probability',
 ]
@@ -21,6 +21,9 @@ PLANT_PATH = SPRITES_PATH / "plants"          # 植物图片资源
 BUILDING_PATH = SPRITES_PATH / "buildings"    # 建筑图片资源
 ITEM_PATH = SPRITES_PATH / "items"            # 道具图片资源
 
+# 模拟时间
+FRAME_TIME = 1000 / 60   # 基础帧时长（毫秒），动物速度以每帧移动的像素计
+
 
 @dataclass
 class MapConfig:
@@ -28,6 +31,8 @@ class MapConfig:
 
     width: int = 1280   # 地图宽度
     height: int = 800   # 地图高度
+    grid_cell_size: int = 64   # 空间网格的格子边长
+    field_cell_size: int = 16  # 势场网格的格子边长
 
 
 @dataclass
@@ -46,6 +51,7 @@ class RabbitConfig:
     min_plant_distance: int = 60      # 觅食范围
     min_plant_distance_infected: int = 150   # 寻找治愈性药草的范围
     min_croc_distance: int = 200      # 躲避鳄鱼的范围
+    steering: str = "field"          # 转向方式：query（逐个查询鳄鱼和植物）/ field（采样势场梯度）
 
     min_distance_square: int = min_distance ** 2
 
@@ -53,6 +59,7 @@ class RabbitConfig:
     range_speed: float = 0.2          # 速度范围
     speed_change_rate: float = 0.05           # 速度随机变化范围
     angle_change_rate: float = math.pi / 12   # 角度随机变化范围
+    decision_interval: int = 150      # 目标选择间隔（毫秒，0 表示每帧都重新选择）
     plant_eat_boost: float = 0.15     # 吃植物加速幅度
     max_eat_boost: int = 2            # 吃植物的最大加速次数
 
@@ -68,6 +75,8 @@ class RabbitConfig:
     boost_duration: int = 10000       # 加速时长
 
     infection_range: int = 80           # 传染半径
+    infection_rate: float = math.inf    # 传染率（每次接触每秒，inf 表示一接触就传染，与原先每帧接触必传染一致）
+    recovery_rate: float = 0.0          # 自然康复率（每秒，0 表示只能靠治愈药草康复）
     infected_multiplier: int = 2        # 感染后寿命流失倍速
     infection_speed_down: float = 0.3   # 感染后速度降低
 
@@ -86,6 +95,7 @@ class CrocodileConfig:
     min_distance: int = 100           # 鳄鱼间最小距离
     min_hunt_distance: int = 500      # 觅食范围
     min_eat_distance: int = 40        # 进食范围
+    assignment: str = "greedy"        # 猎物分配方式：nearest（各自追最近的）/ greedy（贪心）/ hungarian（匈牙利算法）
 
     min_distance_square: int = min_distance ** 2
 
@@ -93,6 +103,7 @@ class CrocodileConfig:
     range_speed: float = 0.2          # 速度范围
     speed_change_rate: float = 0.05           # 速度随机变化范围
     angle_change_rate: float = math.pi / 12   # 角度随机变化范围
+    decision_interval: int = 150      # 目标选择间隔（毫秒，0 表示每帧都重新选择；greedy / hungarian 时为全局分配的间隔）
 
     reproduction_threshold: dict = field(default_factory=lambda: {"春天": 6, "夏天": 6, "秋天": 6, "冬天": 6})  # 四季鳄鱼的繁殖阈值
     reproduction_resource: int = 5    # 繁殖时增加的资源
@@ -133,6 +144,7 @@ class PlantConfig:
     
     rain_bonus: float = 0.8        # 雨水增益倍率
     winter_harshness: float = 1.0  # 冬天植物死亡倍率
+    withering_rate: float = 0.06   # 冬天每株植物的枯萎率（每秒）
     is_fragile: bool = False       # 冬天是否脆弱
     survive_winter: bool = False   # 是否免疫寒冷
 
@@ -6,14 +6,18 @@ fonts.py
 版本: 1.0
 """
 
+from collections import OrderedDict
+
 import pygame
 
 
 class FontManager:
-    """创建并缓存字体"""
+    """创建并缓存字体，以及渲染好的文字表面"""
     
-    def __init__(self):
+    def __init__(self, max_texts: int = 512):
         self.font_cache = {}
+        self.text_cache = OrderedDict()   # (字体, 文字, 颜色, 抗锯齿) -> 文字表面，按最近使用排序
+        self.max_texts = max_texts        # 文字表面缓存的容量，超出时淘汰最久未使用的
         
     def get_font(self, name: str = "SimSun", size: int = 24, bold: bool = False) -> pygame.font.Font:
         """获取字体对象"""
@@ -29,6 +33,26 @@ class FontManager:
         self.font_cache[cache_key] = font
         return font
 
+    def render_text(
+            self, font: pygame.font.Font, text: str, color: tuple[int, ...], antialias: bool = True
+    ) -> pygame.surface.Surface:
+        """获取渲染好的文字表面（内容不变时不再重新栅格化；表面是共享的，调用方不要修改）"""
+        # 创建缓存的键
+        cache_key = (font, text, tuple(color), antialias)
+
+        # 如果文字已经在缓存中，标记为最近使用并直接返回
+        surface = self.text_cache.get(cache_key)
+        if surface is not None:
+            self.text_cache.move_to_end(cache_key)
+            return surface
+
+        # 渲染新文字并缓存，超出容量时淘汰最久未使用的
+        surface = font.render(text, antialias, color)
+        self.text_cache[cache_key] = surface
+        if len(self.text_cache) > self.max_texts:
+            self.text_cache.popitem(last=False)
+        return surface
+
 
 # 创建全局字体管理器实例
 font_manager = FontManager()
@@ -37,3 +61,9 @@ font_manager = FontManager()
 def get_font(name: str = "SimSun", size: int = 24, bold: bool = False) -> pygame.font.Font:
     """快捷获取字体对象的函数"""
     return font_manager.get_font(name, size, bold)
+
+def render_text(
+        font: pygame.font.Font, text: str, color: tuple[int, ...], antialias: bool = True
+) -> pygame.surface.Surface:
+    """快捷获取文字表面的函数"""
+    return font_manager.render_text(font, text, color, antialias)
@@ -12,7 +12,7 @@ from typing import TYPE_CHECKING
 import pygame
 
 from game.utils import (color, MapConfig)
-from .fonts import get_font
+from .fonts import (get_font, render_text)
 
 
 if TYPE_CHECKING:
@@ -25,7 +25,7 @@ def draw_centered_text(
 ) -> None:
     """绘制游戏结局"""
     font = get_font(name=font_name, size=32)
-    text_surface = font.render(text, True, text_color)
+    text_surface = render_text(font, text, text_color)
 
     x = (MapConfig.width - text_surface.get_width()) // 2
     y = (MapConfig.height - text_surface.get_height()) // 2 + y_offset
@@ -33,7 +33,7 @@ def draw_centered_text(
     screen.blit(text_surface, (x, y))
 
     font = get_font(name=font_name, size=22)
-    text_surface = font.render(f"生态箱持续到了 {clock.years} 年 {clock.months} 月", True, text_color)
+    text_surface = render_text(font, f"生态箱持续到了 {clock.years} 年 {clock.months} 月", text_color)
 
     x = (MapConfig.width - text_surface.get_width()) // 2
     y = (MapConfig.height - text_surface.get_height()) // 2 + y_offset + 60
@@ -41,23 +41,35 @@ def draw_centered_text(
     screen.blit(text_surface, (x, y))
 
 
+guide_cache: dict[tuple[int, int], pygame.surface.Surface] = {}   # 屏幕尺寸 -> 合成好的指南界面
+
+
 def draw_guide(screen: pygame.surface.Surface) -> None:
-    """绘制指南界面"""
+    """绘制指南界面（整个界面只合成一次，屏幕尺寸变化时才重新合成）"""
+    size = screen.get_size()
+    if size not in guide_cache:
+        guide_cache[size] = compose_guide(size)
+    screen.blit(guide_cache[size], (0, 0))
+
+
+def compose_guide(size: tuple[int, int]) -> pygame.surface.Surface:
+    """把半透明背景、指南窗口和文字合成到一张覆盖整个屏幕的表面上"""
+    width, _ = size
+
     # 半透明背景覆盖
-    overlay = pygame.Surface((MapConfig.width, MapConfig.height), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 180))  # 黑色半透明
-    screen.blit(overlay, (0, 0))
+    guide = pygame.Surface(size, pygame.SRCALPHA)
+    guide.fill((0, 0, 0, 180))  # 黑色半透明
     
     # 绘制指南窗口
     guide_width, guide_height = 550, 550
-    guide_rect = pygame.Rect((MapConfig.width - guide_width) // 2, 130, guide_width, guide_height)
-    pygame.draw.rect(screen, color.WHITE, guide_rect, border_radius=10)
-    pygame.draw.rect(screen, color.BLACK, guide_rect, 2, border_radius=10)
+    guide_rect = pygame.Rect((width - guide_width) // 2, 130, guide_width, guide_height)
+    pygame.draw.rect(guide, color.WHITE, guide_rect, border_radius=10)
+    pygame.draw.rect(guide, color.BLACK, guide_rect, 2, border_radius=10)
     
     # 标题
     title_font = get_font(name="SimHei", size=30)
-    title = title_font.render("游戏指南", True, color.BLACK)
-    screen.blit(title, (guide_rect.centerx - title.get_width() // 2, guide_rect.top + 20))
+    title = render_text(title_font, "游戏指南", color.BLACK)
+    guide.blit(title, (guide_rect.centerx - title.get_width() // 2, guide_rect.top + 20))
     
     # 内容
     content_font = get_font(name="SimSun", size=18)
@@ -86,6 +98,7 @@ def draw_guide(screen: pygame.surface.Surface) -> None:
     # 渲染文本
     y_pos = guide_rect.top + 60
     for line in guide_text:
-        text_surface = content_font.render(line, True, color.BLACK)
-        screen.blit(text_surface, (guide_rect.left + 20, y_pos))
+        text_surface = render_text(content_font, line, color.BLACK)
+        guide.blit(text_surface, (guide_rect.left + 20, y_pos))
         y_pos += 25
+    return guide
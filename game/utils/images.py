@@ -0,0 +1,66 @@
+"""
+images.py
+
+功能: 游戏贴图系统
+时间: 2026/10/17
+版本: 1.0
+"""
+
+from pathlib import Path
+
+import pygame
+
+
+class ImageManager:
+    """按需加载并缓存贴图（首次绘制时才加载，无显示环境下不会触发），以及界面用的纯色面板"""
+
+    def __init__(self):
+        self.image_cache = {}
+        self.panel_cache = {}   # (尺寸, 颜色, 圆角半径) -> 面板表面
+
+    def load_image(self, path: str | Path, size: tuple[int, int]) -> pygame.surface.Surface:
+        """获取缩放后的贴图"""
+        # 创建缓存的键
+        cache_key = (str(path), tuple(size))
+
+        # 如果贴图已经在缓存中，直接返回
+        if cache_key in self.image_cache:
+            return self.image_cache[cache_key]
+
+        # 加载新贴图并缓存
+        image = pygame.transform.smoothscale(pygame.image.load(path).convert_alpha(), size)
+        self.image_cache[cache_key] = image
+        return image
+
+    def get_panel(
+            self, size: tuple[int, int], fill_color: tuple[int, ...], border_radius: int = 0
+    ) -> pygame.surface.Surface:
+        """获取纯色面板（可半透明、带圆角），同样的尺寸和颜色只创建一次；表面是共享的，调用方不要修改"""
+        # 创建缓存的键
+        cache_key = (tuple(size), tuple(fill_color), border_radius)
+
+        # 如果面板已经在缓存中，直接返回
+        if cache_key in self.panel_cache:
+            return self.panel_cache[cache_key]
+
+        # 创建新面板并缓存
+        panel = pygame.Surface(size, pygame.SRCALPHA)
+        if border_radius > 0:
+            pygame.draw.rect(panel, fill_color, panel.get_rect(), border_radius=border_radius)
+        else:
+            panel.fill(fill_color)
+        self.panel_cache[cache_key] = panel
+        return panel
+
+
+# 创建全局贴图管理器实例
+image_manager = ImageManager()
+
+# 快捷访问函数
+def load_image(path: str | Path, size: tuple[int, int]) -> pygame.surface.Surface:
+    """快捷获取贴图的函数"""
+    return image_manager.load_image(path, size)
+
+def get_panel(size: tuple[int, int], fill_color: tuple[int, ...], border_radius: int = 0) -> pygame.surface.Surface:
+    """快捷获取纯色面板的函数"""
+    return image_manager.get_panel(size, fill_color, border_radius)
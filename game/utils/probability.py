@@ -0,0 +1,21 @@
+"""
+probability.py
+
+功能: 概率换算，把按秒定义的发生率换算为每个 tick 的概率
+时间: 2026/10/17
+版本: 1.0
+"""
+
+import math
+
+
+def hazard_probability(rate: float, delta_time: float) -> float:
+    """把每秒的危险率换算为 delta_time 毫秒内至少发生一次的概率（与帧率、倍速无关）
+
+    rate 为 math.inf 时表示立即发生：只要时间在推进，概率就是 1。
+    """
+    if delta_time <= 0:
+        return 0.0
+    if math.isinf(rate):
+        return 1.0
+    return -math.expm1(-rate * delta_time / 1000)
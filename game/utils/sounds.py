@@ -18,11 +18,19 @@ class SoundManager:
     """管理声音播放、停止等事件"""
 
     def __init__(self, sound_folder: str = SOUNDS_PATH):
-        pygame.mixer.init()
-        self.sound_dict = self.load_all_sounds(sound_folder)
+        self.sound_folder = sound_folder
+        self._sound_dict = None   # 首次使用时才初始化混音器并加载音效
         self.bgms = ()
         self.bgms_num = len(self.bgms)
-        self.set_volume()
+
+    @property
+    def sound_dict(self) -> dict[str, pygame.mixer.Sound]:
+        """所有音效（首次访问时加载）"""
+        if self._sound_dict is None:
+            pygame.mixer.init()
+            self._sound_dict = self.load_all_sounds(self.sound_folder)
+            self.set_volume()
+        return self._sound_dict
 
     @staticmethod
     def load_all_sounds(sound_folder: str) -> dict[str, pygame.mixer.Sound]:
@@ -10,7 +10,7 @@ import pygame
 
 from game.core import World
 from game.utils import (MapConfig, draw_centered_text, sound_manager)
-from game.ui import (Button, create_ui_buttons, toggle_pause, restart)
+from game.ui import (Button, Renderer, create_ui_buttons, toggle_pause, restart)
 
 
 # ---------- 初始化 ----------
@@ -30,17 +30,31 @@ def set_buttons(new_buttons: list[Button]) -> None:
 buttons: list[Button] = create_ui_buttons(world, WIDTH, HEIGHT, set_buttons)
 
 
+def draw_overlay(surface: pygame.surface.Surface) -> None:
+    """绘制界面：世界的状态栏与面板、按钮、结局"""
+    world.draw_overlay(surface)
+
+    # 绘制按钮
+    for b in buttons:
+        b.draw(surface)
+
+    # 显示结局
+    if world.ending1:
+        draw_centered_text(surface, world.clock, text="植物灭绝了！")
+    elif world.ending2:
+        draw_centered_text(surface, world.clock, text="兔子灭绝了！")
+    elif world.ending3:
+        draw_centered_text(surface, world.clock, text="鳄鱼灭绝了！")
+
+
 # ---------- 主循环 ----------
 running = True
+frame_clock = pygame.time.Clock()
+frame_time = 0   # 上一帧经过的真实时间（毫秒）
+renderer = Renderer(screen)   # 脏矩形渲染，只提交变化的区域
 sound_manager.play_random_bgm()
 
 while running:
-    # 绘制背景颜色
-    screen.fill(world.season.get_color())
-
-    # 动物和植物灭绝检测
-    world.check_end()
-
     # 事件监听
     for event in pygame.event.get():
         # 处理退出游戏指令
@@ -68,30 +82,12 @@ while running:
             elif event.key in (pygame.K_p, pygame.K_SPACE):
                 toggle_pause(world)
 
-    # 更新逻辑
-    if world.can_update():
-        world.update_always()
-        if world.can_progress():
-            world.update_when_active()
+    # 更新逻辑（按真实时间和倍速推进若干个固定步长的 tick）
+    world.advance(frame_time)
     
-    # 绘制世界
-    world.draw(screen)
-
-    # 绘制按钮
-    for b in buttons:
-        b.draw(screen)
-
-    # 显示结局
-    if world.ending1:
-        draw_centered_text(screen, world.clock, text="植物灭绝了！")
-    elif world.ending2:
-        draw_centered_text(screen, world.clock, text="兔子灭绝了！")
-    elif world.ending3:
-        draw_centered_text(screen, world.clock, text="鳄鱼灭绝了！")
-
-    # 更新一帧画面
-    pygame.display.flip()
-    pygame.time.Clock().tick(60)
+    # 绘制一帧画面（季节颜色渐变、降雨、科技树和指南打开时整屏重绘）
+    renderer.render(world.season.get_color(), world.sprite_layers(), draw_overlay, full=world.needs_full_redraw())
+    frame_time = frame_clock.tick(60)
 
 
 # ---------- 结束游戏 ----------
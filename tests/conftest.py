@@ -0,0 +1,17 @@
+"""
+conftest.py
+
+功能: 测试公共设置，使用无显示、无声音的 SDL 驱动，并让测试可以直接导入 game 包
+时间: 2026/10/17
+版本: 1.0
+"""
+
+import os
+import sys
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import game.core  # noqa: E402,F401  先导入 core，避免 game.entities 先被导入时的循环依赖
@@ -0,0 +1,95 @@
+"""
+test_assignment.py
+
+功能: 目标分配的测试：匈牙利算法与穷举最优解一致，贪心匹配合法，全局分配按决策间隔进行
+时间: 2026/10/17
+版本: 1.0
+"""
+
+from itertools import permutations
+
+import numpy as np
+import pytest
+
+from game.core import (World, greedy_match, hungarian_match, match_targets)
+from game.entities import Crocodile
+from game.utils import (MapConfig, CrocodileConfig)
+
+
+def score(cost: np.ndarray, result: np.ndarray, max_cost: float) -> tuple[int, float]:
+    """(-匹配数, 总代价)，越小越好"""
+    pairs = [(row, col) for row, col in enumerate(result) if col >= 0]
+    assert all(cost[row, col] < max_cost for row, col in pairs)
+    return -len(pairs), sum(cost[row, col] for row, col in pairs)
+
+
+def brute_force(cost: np.ndarray, max_cost: float) -> tuple[int, float]:
+    """穷举所有一一对应，先使匹配数最多，再使总代价最小"""
+    if cost.shape[0] > cost.shape[1]:
+        cost = cost.T
+    n, m = cost.shape
+    best = (0, 0.0)
+    for cols in permutations(range(m), n):
+        pairs = [cost[row, col] for row, col in enumerate(cols) if cost[row, col] < max_cost]
+        best = min(best, (-len(pairs), sum(pairs)))
+    return best
+
+
+def check_valid(result: np.ndarray, shape: tuple[int, int]) -> None:
+    assert result.shape == (shape[0],)
+    cols = [col for col in result if col >= 0]
+    assert len(cols) == len(set(cols)) and all(col < shape[1] for col in cols)
+
+
+@pytest.mark.parametrize("shape", [(1, 1), (3, 3), (5, 5), (2, 6), (6, 3), (4, 7)])
+def test_hungarian_matches_brute_force(shape):
+    rng = np.random.default_rng(sum(shape))
+    for _ in range(20):
+        cost = rng.uniform(0, 10, shape)
+        for max_cost in (np.inf, 5.0):
+            result = hungarian_match(cost, max_cost)
+            check_valid(result, shape)
+            count, total = score(cost, result, max_cost)
+            best_count, best_total = brute_force(cost, max_cost)
+            assert count == best_count
+            assert total == pytest.approx(best_total)
+
+
+def test_hungarian_beats_greedy():
+    cost = np.array([[1.0, 2.0], [2.0, 100.0]])
+    assert list(greedy_match(cost, np.inf)) == [0, 1]      # 总代价 101
+    assert list(hungarian_match(cost, np.inf)) == [1, 0]   # 总代价 4
+
+
+def test_greedy_is_valid_and_respects_max_cost():
+    rng = np.random.default_rng(0)
+    for shape in [(4, 4), (3, 8), (8, 3)]:
+        cost = rng.uniform(0, 10, shape)
+        result = greedy_match(cost, 5.0)
+        check_valid(result, shape)
+        score(cost, result, 5.0)
+
+
+def test_empty_and_out_of_range():
+    assert list(hungarian_match(np.zeros((3, 0)), np.inf)) == [-1, -1, -1]
+    assert list(hungarian_match(np.full((2, 2), 9.0), 5.0)) == [-1, -1]
+    assert list(greedy_match(np.full((2, 2), 9.0), 5.0)) == [-1, -1]
+
+
+def test_match_targets_dispatch():
+    cost = np.array([[1.0, 2.0], [2.0, 100.0]])
+    assert list(match_targets(cost, np.inf, "hungarian")) == [1, 0]
+    with pytest.raises(ValueError):
+        match_targets(cost, np.inf, "auction")
+
+
+@pytest.mark.parametrize("interval, expected", [(0, 60), (150, 7), (400, 3)])
+def test_assign_prey_runs_at_decision_interval(monkeypatch, interval, expected):
+    calls = []
+    original = Crocodile.assign_prey
+    monkeypatch.setattr(Crocodile, "assign_prey", lambda *args: calls.append(1) or original(*args))
+    config = CrocodileConfig(assignment="greedy", decision_interval=interval)
+    world = World(MapConfig.width, MapConfig.height, headless=True, seed=0, croc_config=config)
+    for _ in range(60):   # 1 秒
+        world.step()
+    assert len(calls) == expected
@@ -0,0 +1,57 @@
+"""
+test_clock.py
+
+功能: 固定步长模拟时钟的测试
+时间: 2026/10/17
+版本: 1.0
+"""
+
+from game.core import SimulationClock
+
+
+def test_ticks_due_accumulates_fractional_time():
+    clock = SimulationClock(step=10)
+    assert [clock.ticks_due(4) for _ in range(5)] == [0, 0, 1, 0, 1]
+    assert clock.accumulator == 0
+
+
+def test_speed_multiplies_ticks_not_step_length():
+    clock = SimulationClock(step=10)
+    assert clock.ticks_due(10, speed=16) == 16
+    for _ in range(16):
+        assert clock.tick(pause=False) == 10
+    assert clock.time == 160 and clock.tick_count == 16
+
+
+def test_pause_does_not_advance_time():
+    clock = SimulationClock(step=10)
+    assert clock.tick(pause=True) == 0
+    assert clock.time == 0 and clock.tick_count == 0
+
+
+def test_drop_backlog():
+    clock = SimulationClock(step=10)
+    clock.ticks_due(25)
+    clock.drop_backlog()
+    assert clock.ticks_due(5) == 0
+
+
+def test_effective_speed_tracks_achieved_rate():
+    clock = SimulationClock(step=10)
+    for _ in range(200):
+        clock.record(real_time=10, ticks=20)
+    assert abs(clock.effective_speed - 20) < 0.01
+    clock.record(real_time=0, ticks=5)
+    assert abs(clock.effective_speed - 20) < 0.01
+
+
+def test_speed_text_shows_effective_speed_when_over_budget():
+    from game.core import World
+    from game.ui import speed_text
+    from game.utils import MapConfig
+
+    world = World(MapConfig.width, MapConfig.height, headless=True, seed=0, speeds=(1, 256), initial_speed=256)
+    world.sim_clock.effective_speed = 256
+    assert speed_text(world) == "256x"
+    world.sim_clock.effective_speed = 19.6
+    assert speed_text(world) == "≈20x"
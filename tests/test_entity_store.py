@@ -0,0 +1,73 @@
+"""
+test_entity_store.py
+
+功能: 实体注册表的测试：稳定的 ID、帧末统一删除、交换删除后索引保持一致
+时间: 2026/10/17
+版本: 1.0
+"""
+
+import random
+
+from game.core import EntityStore
+
+
+class Item:
+    """测试实体"""
+
+
+def test_ids_are_stable_and_never_reused():
+    store = EntityStore([Item() for _ in range(5)])
+    assert [e.eid for e in store] == [0, 1, 2, 3, 4]
+
+    first = store.get(0)
+    store.kill(first)
+    store.flush()
+    new = Item()
+    store.add(new)
+    assert new.eid == 5
+    assert store.get(0) is None
+
+
+def test_kill_is_deferred_until_flush():
+    items = [Item() for _ in range(3)]
+    store = EntityStore(items)
+    store.kill(items[1])
+    store.kill(items[1])   # 重复标记无影响
+
+    assert len(store) == 3 and items[1] in store
+    assert not store.is_alive(items[1]) and store.is_alive(items[0])
+
+    assert store.flush() == [items[1]]
+    assert len(store) == 2 and items[1] not in store
+
+
+def test_random_kills_keep_slots_consistent():
+    rng = random.Random(7)
+    store = EntityStore()
+    alive = set()
+    for _ in range(200):
+        for _ in range(rng.randint(0, 5)):
+            item = Item()
+            store.add(item)
+            alive.add(item)
+        for item in rng.sample(sorted(alive, key=lambda e: e.eid), min(len(alive), rng.randint(0, 4))):
+            store.kill(item)
+            alive.discard(item)
+        store.flush()
+
+        assert set(store) == alive
+        assert all(store.get(e.eid) is e for e in alive)
+        assert all(store.items[slot].eid == eid for eid, slot in store.slots.items())
+
+
+def test_restore_keeps_ids_and_order():
+    items = [Item() for _ in range(4)]
+    store = EntityStore(items)
+    store.kill(items[0])
+    store.flush()
+
+    copy = EntityStore()
+    copy.restore(list(store), store.next_id)
+    assert list(copy) == list(store)
+    assert copy.next_id == 4
+    assert copy.get(items[2].eid) is items[2]
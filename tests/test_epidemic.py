@@ -0,0 +1,37 @@
+"""
+test_epidemic.py
+
+功能: 瘟疫传播的测试：灾害引发的感染计入当 tick 的新增感染
+时间: 2026/10/17
+版本: 1.0
+"""
+
+from game.core import World
+from game.utils import MapConfig
+
+
+def infected_ids(world: World) -> set[int]:
+    return {r.eid for r in world.rabbits if r.infected}
+
+
+def test_plague_cases_are_counted_in_new_cases():
+    world = World(MapConfig.width, MapConfig.height, headless=True, seed=0)
+    world.scheduler.register("test.plague", lambda: world.disaster.animal_plague(world))
+    world.scheduler.schedule("test.plague", 0)
+
+    before = infected_ids(world)
+    world.step()
+    after = infected_ids(world)
+    assert len(after - before) >= 1
+    assert world.epidemic.new_cases == len(after - before)
+    assert world.epidemic.total_cases == len(after)
+
+
+def test_counters_reset_every_tick():
+    world = World(MapConfig.width, MapConfig.height, headless=True, seed=0)
+    world.disaster.animal_plague(world)
+    world.step()
+    for rabbit in world.rabbits:
+        rabbit.immune = True   # 不再有新的传染
+    world.step()
+    assert world.epidemic.new_cases == 0 and world.epidemic.contacts == 0
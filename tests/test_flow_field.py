@@ -0,0 +1,86 @@
+"""
+test_flow_field.py
+
+功能: 势场的测试：增量维护与重建一致、梯度方向、梯度为 0 时的回退，以及兔子紧贴鳄鱼时仍会逃离
+时间: 2026/10/17
+版本: 1.0
+"""
+
+import math
+import random
+
+import numpy as np
+import pytest
+
+from game.core import (World, FlowField)
+from game.entities import (Rabbit, Crocodile)
+from game.utils import (MapConfig, FRAME_TIME)
+
+
+class Point:
+    """只有坐标的测试实体"""
+
+    def __init__(self, x: float, y: float):
+        self.x = x
+        self.y = y
+
+
+def test_incremental_updates_match_rebuild():
+    rng = random.Random(0)
+    points = [Point(rng.uniform(0, 400), rng.uniform(0, 400)) for _ in range(50)]
+    field = FlowField(400, 400, 16, 60)
+    field.rebuild(points)
+    for point in points[:20]:
+        point.x, point.y = rng.uniform(0, 400), rng.uniform(0, 400)
+    field.sync(points[10:])
+    field.set_radius(45)
+
+    expected = FlowField(400, 400, 16, 45)
+    expected.rebuild(points[10:])
+    assert np.array_equal(field.potential, expected.potential)
+    assert {e: set(b) for e, b in field.buckets.items()} == {e: set(b) for e, b in expected.buckets.items()}
+
+
+def test_gradient_points_towards_source():
+    source = Point(200, 200)
+    field = FlowField(400, 400, 16, 80)
+    field.add(source)
+    gx, gy = field.gradient(150, 200)
+    assert gx > 0 and abs(gy) < 1e-9
+    assert field.gradient(50, 50) is None   # 半径外
+
+
+def test_zero_gradient_falls_back_to_nearest_source():
+    near, far = Point(100, 100), Point(220, 100)
+    field = FlowField(400, 400, 16, 80)
+    field.rebuild([near, far])
+    assert field.gradient(near.x, near.y) == (0, 0)   # 源所在格子中心差分为 0
+    assert field.nearest(near.x + 3, near.y) is near
+    assert Rabbit._field_target(near.x + 3, near.y, field, 60) == (near.x, near.y)
+    field.remove(near)
+    assert field.nearest(near.x + 3, near.y) is None   # 只在核覆盖范围内查找
+    assert Rabbit._field_target(50, 300, field, 60) is None
+
+
+@pytest.mark.parametrize("radius", [0, -5])
+def test_non_positive_radius_is_rejected(radius):
+    with pytest.raises(ValueError):
+        FlowField(400, 400, 16, radius)
+
+
+def test_rabbit_next_to_crocodile_flees():
+    world = World(MapConfig.width, MapConfig.height, headless=True, seed=0)
+    croc = Crocodile(400, 400, world.croc_config, world.rngs.get("crocodile"))
+    rabbit = Rabbit(403, 402, world.rabbit_config, world.rngs.get("rabbit"))
+    world.fields.danger.rebuild([croc])
+    world.croc_grid.rebuild([croc])
+    world.rabbit_grid.rebuild([rabbit])
+    assert world.fields.danger.gradient(rabbit.x, rabbit.y) == (0, 0)
+    rabbit.decision_time = 0   # 第一个 tick 就做决策
+
+    start = math.dist((rabbit.x, rabbit.y), (croc.x, croc.y))
+    for _ in range(30):
+        rabbit.move(world.croc_grid, world.rabbit_grid, None, world.plant_grid, world.plant_config,
+                    world.fields, world.season, FRAME_TIME)
+        assert rabbit.threat is not None
+    assert math.dist((rabbit.x, rabbit.y), (croc.x, croc.y)) > start + 10
@@ -0,0 +1,35 @@
+"""
+test_forking.py
+
+功能: 世界分叉的测试：子模拟数量校验，结局分布合法且不影响原世界
+时间: 2026/10/17
+版本: 1.0
+"""
+
+import pytest
+
+from game.core import (World, fork_world, what_if)
+from game.utils import MapConfig
+
+
+def make_world() -> World:
+    return World(MapConfig.width, MapConfig.height, headless=True, seed=31)
+
+
+@pytest.mark.parametrize("forks", [0, -1])
+def test_non_positive_forks_are_rejected(forks):
+    world = make_world()
+    with pytest.raises(ValueError):
+        fork_world(world, forks=forks, months=1, workers=1)
+    with pytest.raises(ValueError):
+        what_if(world, "植物护盾", forks=forks, months=1, workers=1)
+
+
+def test_fork_report_is_a_distribution():
+    world = make_world()
+    tick_count = world.sim_clock.tick_count
+    report = fork_world(world, forks=2, months=1, workers=1)
+    assert len(report.results) == 2
+    assert sum(report.probabilities.values()) == pytest.approx(1)
+    assert report.mean_survival_months >= 1
+    assert world.sim_clock.tick_count == tick_count
@@ -0,0 +1,36 @@
+"""
+test_probability.py
+
+功能: 危险率换算与瘟疫默认传染率的测试
+时间: 2026/10/17
+版本: 1.0
+"""
+
+import math
+
+from game.core import World
+from game.utils import (MapConfig, FRAME_TIME, hazard_probability)
+
+
+def test_hazard_probability_matches_exponential():
+    assert math.isclose(hazard_probability(3.0, 500), 1 - math.exp(-1.5))
+    # 同样的总时长，分成多步与一步发生的概率一致（与帧率无关）
+    survive = (1 - hazard_probability(3.0, 100)) ** 5
+    assert math.isclose(1 - survive, hazard_probability(3.0, 500))
+
+
+def test_hazard_probability_edge_cases():
+    assert hazard_probability(3.0, 0) == 0
+    assert hazard_probability(0.0, 1000) == 0
+    assert hazard_probability(math.inf, FRAME_TIME) == 1
+    assert hazard_probability(math.inf, 0) == 0
+
+
+def test_default_infection_rate_infects_on_first_contact():
+    world = World(MapConfig.width, MapConfig.height, headless=True, seed=0)
+    source, target = list(world.rabbits)[:2]
+    target.x, target.y = source.x + 1, source.y
+    world.epidemic.infect(source, 0)
+
+    world.epidemic.update(world.rabbits, FRAME_TIME, FRAME_TIME)
+    assert target.infected
@@ -0,0 +1,104 @@
+"""
+test_renderer.py
+
+功能: 分层精灵和脏矩形渲染的测试：绘制区域与 Rect.center 一致，局部修补与整屏重绘逐像素相同
+时间: 2026/10/17
+版本: 1.0
+"""
+
+import random
+
+import numpy as np
+import pygame
+import pytest
+
+from game.ui import (Renderer, SpriteLayer)
+
+
+WIDTH, HEIGHT = 200, 150
+BACKGROUND = (200, 230, 200)
+
+
+class Sprite:
+    """带有坐标和贴图的测试实体（同一贴图路径对应同一张贴图）"""
+
+    def __init__(self, x: float, y: float, kind: tuple[str, pygame.surface.Surface]):
+        self.x = x
+        self.y = y
+        self.image_path, self.image = kind
+
+
+def make_image(size: tuple[int, int], rgba: tuple[int, int, int, int]) -> pygame.surface.Surface:
+    image = pygame.Surface(size, pygame.SRCALPHA)
+    image.fill(rgba)
+    pygame.draw.circle(image, (0, 0, 0, 255), (size[0] // 2, size[1] // 2), min(size) // 3)
+    return image
+
+
+@pytest.fixture
+def display():
+    pygame.display.init()
+    yield pygame.display.set_mode((WIDTH, HEIGHT))
+    pygame.display.quit()
+
+
+def test_layer_rects_match_rect_center():
+    kinds = [("a", pygame.Surface((7, 4))), ("b", pygame.Surface((10, 10)))]
+    points = [(10.5, 11.5), (3.49, 0.5), (-0.5, 7.51), (99.5, 42.0), (0, 0)]
+    sprites = [Sprite(x, y, kinds[i % 2]) for i, (x, y) in enumerate(points)]
+    for layer in (SpriteLayer.from_entities(sprites), SpriteLayer.from_entities(sprites[:1])):
+        expected = [s.image.get_rect(center=(s.x, s.y)) for s in layer.entities]
+        assert layer.rects(np.arange(len(layer))) == expected
+
+
+def test_partial_redraws_are_pixel_identical(display):
+    rng = random.Random(0)
+    kinds = [
+        ("rabbit", make_image((12, 10), (255, 255, 255, 255))),
+        ("infected", make_image((12, 10), (120, 200, 80, 255))),
+        ("crocodile", make_image((24, 14), (40, 120, 40, 160))),
+    ]
+    plants = [Sprite(rng.uniform(0, WIDTH), rng.uniform(0, HEIGHT), ("plant", make_image((8, 8), (0, 160, 0, 255))))
+              for _ in range(30)]
+    animals = [Sprite(rng.uniform(0, WIDTH), rng.uniform(0, HEIGHT), rng.choice(kinds)) for _ in range(20)]
+
+    def draw_overlay(surface: pygame.surface.Surface) -> None:
+        panel = pygame.Surface((60, 20), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 100))   # 半透明界面：不修补就会越叠越深
+        surface.blit(panel, (5, 5))
+
+    renderer = Renderer(display)
+    reference = pygame.Surface((WIDTH, HEIGHT), 0, display)
+    partial = 0
+    for frame in range(60):
+        for sprite in rng.sample(animals, 3):
+            sprite.x += rng.uniform(-3, 3)
+            sprite.y += rng.uniform(-3, 3)
+        if frame % 7 == 0:
+            rng.choice(animals).image_path, rng.choice(animals).image = rng.choice(kinds)
+        if frame % 11 == 0:
+            animals.append(Sprite(rng.uniform(0, WIDTH), rng.uniform(0, HEIGHT), rng.choice(kinds)))
+        if frame % 13 == 0:
+            plants.remove(rng.choice(plants))
+
+        layers = [SpriteLayer.from_entities(plants), SpriteLayer.from_entities(animals)]
+        dirty = renderer.render(BACKGROUND, layers, draw_overlay)
+        partial += dirty != [display.get_rect()]
+
+        reference.fill(BACKGROUND)
+        for layer in layers:
+            reference.blits(layer.blit_sequence(), False)
+        draw_overlay(reference)
+        assert pygame.image.tobytes(display, "RGB") == pygame.image.tobytes(reference, "RGB"), frame
+    assert partial > 40
+
+
+def test_background_change_and_request_force_full_redraw(display):
+    layer = SpriteLayer.from_entities([Sprite(50, 50, ("a", make_image((10, 10), (255, 0, 0, 255))))])
+    renderer = Renderer(display)
+    renderer.render(BACKGROUND, [layer], lambda surface: None)
+    assert renderer.render(BACKGROUND, [layer], lambda surface: None) == []
+    assert renderer.render((0, 0, 0), [layer], lambda surface: None) == [display.get_rect()]
+    renderer.render((0, 0, 0), [layer], lambda surface: None, full=True)
+    assert renderer.render((0, 0, 0), [layer], lambda surface: None) == [display.get_rect()]   # 整屏重绘的下一帧仍整屏
+    assert renderer.full_redraws == 4
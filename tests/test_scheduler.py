@@ -0,0 +1,85 @@
+"""
+test_scheduler.py
+
+功能: 定时事件调度器的测试：到期顺序、取代与取消、推迟、状态恢复
+时间: 2026/10/17
+版本: 1.0
+"""
+
+from game.core import EventScheduler
+
+
+def make_scheduler(fired: list) -> EventScheduler:
+    scheduler = EventScheduler()
+    for key in ("a", "b", "c"):
+        scheduler.register(key, lambda k=key: fired.append((k, scheduler.time)))
+    return scheduler
+
+
+def test_events_fire_in_due_order_at_their_due_time():
+    fired = []
+    scheduler = make_scheduler(fired)
+    scheduler.schedule("b", 200)
+    scheduler.schedule("a", 100)
+    scheduler.schedule("c", 200)
+
+    assert scheduler.advance(150) == 1
+    assert scheduler.advance(500) == 2
+    assert fired == [("a", 100), ("b", 200), ("c", 200)]   # 同一时刻先安排的先触发
+    assert scheduler.time == 500
+
+
+def test_reschedule_replaces_and_cancel_removes():
+    fired = []
+    scheduler = make_scheduler(fired)
+    scheduler.schedule("a", 100)
+    scheduler.schedule("a", 300)
+    scheduler.schedule("b", 50)
+    scheduler.cancel("b")
+
+    scheduler.advance(1000)
+    assert fired == [("a", 300)]
+    assert not scheduler.is_scheduled("a") and scheduler.next_due() is None
+
+
+def test_periodic_event_does_not_drift():
+    scheduler = EventScheduler()
+    times = []
+
+    def tick() -> None:
+        times.append(scheduler.time)
+        scheduler.schedule("tick", 100)
+
+    scheduler.register("tick", tick)
+    scheduler.schedule("tick", 100)
+    for now in range(16, 1001, 16):   # 以不整除的帧长推进
+        scheduler.advance(now)
+    assert times == [100 * i for i in range(1, 10)]
+
+
+def test_postpone_and_remaining():
+    scheduler = make_scheduler([])
+    scheduler.schedule("a", 1000)
+    scheduler.advance(400)
+    assert scheduler.remaining("a") == 600
+    scheduler.postpone("a", 500)
+    assert scheduler.remaining("a") == 1100
+    scheduler.postpone("a", -2000)
+    assert scheduler.remaining("a") == 0
+    assert scheduler.remaining("b") == 0
+
+
+def test_state_round_trip():
+    fired = []
+    scheduler = make_scheduler(fired)
+    scheduler.schedule("a", 100)
+    scheduler.schedule("b", 300)
+    scheduler.cancel("a")
+    state = scheduler.get_state()
+
+    restored_fired = []
+    restored = make_scheduler(restored_fired)
+    restored.set_state(state)
+    scheduler.advance(1000)
+    restored.advance(1000)
+    assert fired == restored_fired == [("b", 300)]
@@ -0,0 +1,37 @@
+"""
+test_simulation.py
+
+功能: 批量模拟的测试：年数上限按经历的时间计算，配置覆盖项的解析
+时间: 2026/10/17
+版本: 1.0
+"""
+
+import pytest
+
+from game.core import (SimulationJob, build_configs, run_simulation)
+
+
+def test_year_limit_counts_elapsed_months():
+    # 游戏从第 0 年 3 月开始，1 年的上限应运行满 12 个月（到第 1 年 3 月）
+    result = run_simulation(SimulationJob(seed=0, max_years=1))
+    assert result.outcome == "survived"
+    assert result.survival_months == 12
+    assert (result.years, result.months) == (1, 3)
+
+
+def test_same_seed_gives_same_result():
+    job = SimulationJob(seed=3, max_years=1, overrides={"rabbit.ave_speed": 1.5})
+    assert run_simulation(job) == run_simulation(job)
+
+
+def test_build_configs_updates_derived_squares():
+    configs = build_configs({"croc.min_distance": 50, "rabbit.ave_speed": 1.5})
+    assert configs["croc_config"].min_distance_square == 2500
+    assert configs["rabbit_config"].ave_speed == 1.5
+
+
+def test_build_configs_rejects_unknown_fields():
+    with pytest.raises(KeyError):
+        build_configs({"rabbit.no_such_field": 1})
+    with pytest.raises(KeyError):
+        build_configs({"wolf.ave_speed": 1})
@@ -0,0 +1,77 @@
+"""
+test_snapshot.py
+
+功能: 世界快照的测试：保存后恢复的世界与原世界状态一致，并且继续运行的结果完全相同
+时间: 2026/10/17
+版本: 1.0
+"""
+
+import pytest
+
+from game.core import (World, world_to_bytes, world_from_bytes, save_snapshot, load_snapshot)
+from game.utils import MapConfig
+
+
+def advance(world: World, ticks: int) -> None:
+    for _ in range(ticks):
+        world.step()
+
+
+def summary(world: World) -> tuple:
+    """与比较相关的世界状态"""
+    return (
+        world.sim_clock.tick_count, world.sim_clock.time, world.clock.years, world.clock.months,
+        world.season.current, world.seed, world.scheduler.get_state(),
+        [(a.eid, a.x, a.y, a.angle, a.speed, a.age, a.eaten) for a in world.animals],
+        [r.infected for r in world.rabbits],
+        [(p.eid, p.x, p.y, p.medicative) for p in world.plants],
+        (world.resource_manager.leafium, world.resource_manager.animite, world.resource_manager.ecopoint),
+    )
+
+
+@pytest.mark.parametrize("vectorized", [False, True])
+def test_round_trip_is_identical(vectorized):
+    world = World(MapConfig.width, MapConfig.height, headless=True, seed=21, vectorized=vectorized)
+    advance(world, 500)
+
+    restored = world_from_bytes(world_to_bytes(world), headless=True)
+    assert summary(restored) == summary(world)
+    assert world_to_bytes(restored) == world_to_bytes(world)
+
+
+@pytest.mark.parametrize("vectorized", [False, True])
+def test_restored_world_continues_identically(vectorized):
+    world = World(MapConfig.width, MapConfig.height, headless=True, seed=22, vectorized=vectorized)
+    advance(world, 400)
+    restored = world_from_bytes(world_to_bytes(world), headless=True)
+
+    advance(world, 800)
+    advance(restored, 800)
+    assert summary(restored) == summary(world)
+
+
+def test_save_and_load_file(tmp_path):
+    world = World(MapConfig.width, MapConfig.height, headless=True, seed=23)
+    advance(world, 200)
+    path = tmp_path / "world.snap"
+    save_snapshot(world, path)
+    assert summary(load_snapshot(path, headless=True)) == summary(world)
+
+
+def test_restart_after_load_uses_constructor_arguments():
+    world = World(MapConfig.width, MapConfig.height, headless=True, seed=24, test_state=1,
+                  speeds=(1, 8), initial_speed=8)
+    for area, techs in world.tech_tree.techs.items():
+        for index in range(len(techs)):
+            world.tech_tree.unlock_tech(area, index)
+    unlocked = (world.plant_config.reproduction_interval, world.rabbit_config.ave_speed)
+    restored = world_from_bytes(world_to_bytes(world), headless=True)
+    assert (restored.plant_config.reproduction_interval, restored.rabbit_config.ave_speed) == unlocked
+
+    restored.restart()
+    fresh = World(MapConfig.width, MapConfig.height, headless=True, seed=24, test_state=1,
+                  speeds=(1, 8), initial_speed=8)
+    assert restored.plant_config == fresh.plant_config and restored.rabbit_config == fresh.rabbit_config
+    assert not any(t["unlocked"] for techs in restored.tech_tree.techs.values() for t in techs)
+    assert (restored.clock.speed, restored.clock.speeds, restored.options["test_state"]) == (8, (1, 8), 1)
+    assert summary(restored) == summary(fresh)
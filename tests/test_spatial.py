@@ -0,0 +1,128 @@
+"""
+test_spatial.py
+
+功能: 空间哈希网格和空位采样网格的测试，查询结果与暴力遍历一致，采样不会漏掉空位
+时间: 2026/10/17
+版本: 1.0
+"""
+
+import math
+import random
+
+from game.core import (SpatialGrid, FreeSpaceSampler, segment_distance)
+
+
+class Point:
+    """只有坐标的测试实体"""
+
+    def __init__(self, x: float, y: float):
+        self.x = x
+        self.y = y
+
+
+def random_points(rng: random.Random, n: int, size: float = 500) -> list[Point]:
+    return [Point(rng.uniform(0, size), rng.uniform(0, size)) for _ in range(n)]
+
+
+def test_query_radius_matches_brute_force():
+    rng = random.Random(1)
+    points = random_points(rng, 300)
+    grid = SpatialGrid(32)
+    grid.rebuild(points)
+
+    for _ in range(50):
+        x, y, radius = rng.uniform(0, 500), rng.uniform(0, 500), rng.uniform(5, 120)
+        found = {p for p, _ in grid.query_radius(x, y, radius)}
+        expected = {p for p in points if math.hypot(p.x - x, p.y - y) < radius}
+        assert found == expected
+
+
+def test_query_radius_batch_matches_single_queries():
+    rng = random.Random(2)
+    grid = SpatialGrid(32)
+    grid.rebuild(random_points(rng, 200))
+    queries = [(rng.uniform(0, 500), rng.uniform(0, 500)) for _ in range(40)]
+
+    for (x, y), hits in zip(queries, grid.query_radius_batch(queries, 60)):
+        assert {p for p, _ in hits} == {p for p, _ in grid.query_radius(x, y, 60)}
+
+
+def test_nearest_matches_brute_force():
+    rng = random.Random(3)
+    points = random_points(rng, 150)
+    grid = SpatialGrid(32)
+    grid.rebuild(points)
+
+    for _ in range(50):
+        x, y = rng.uniform(0, 500), rng.uniform(0, 500)
+        in_range = [p for p in points if math.hypot(p.x - x, p.y - y) < 100]
+        expected = min(in_range, key=lambda p: math.hypot(p.x - x, p.y - y)) if in_range else None
+        assert grid.nearest(x, y, 100) is expected
+
+
+def test_update_moves_entity_between_cells():
+    grid = SpatialGrid(32)
+    p = Point(10, 10)
+    grid.insert(p)
+    p.x, p.y = 200, 200
+    grid.update(p)
+
+    assert grid.query_radius(10, 10, 5) == []
+    assert [e for e, _ in grid.query_radius(200, 200, 5)] == [p]
+
+    grid.remove(p)
+    assert len(grid) == 0 and p not in grid
+
+
+def test_query_segment_matches_brute_force():
+    rng = random.Random(4)
+    points = random_points(rng, 200)
+    grid = SpatialGrid(32)
+    grid.rebuild(points)
+
+    for _ in range(30):
+        ax, ay, bx, by = (rng.uniform(0, 500) for _ in range(4))
+        found = {p for p, _ in grid.query_segment(ax, ay, bx, by, 20)}
+        expected = {p for p in points if segment_distance(p.x, p.y, ax, ay, bx, by) < 20}
+        assert found == expected
+
+
+def test_sampler_finds_space_between_probe_points():
+    # 两个点覆盖了格子内 4×4 探测点阵的每个点，但格子的角 (0, 0) 仍然可以放置
+    sampler = FreeSpaceSampler(100, 100, 10)
+    for p in (Point(10.2, 1.0), Point(1.0, 10.2)):
+        sampler.insert(p)
+    assert sampler.is_valid(0, 0)
+
+    position = sampler._probe(0)
+    assert position is not None and sampler.is_valid(*position)
+    assert not sampler.exhausted[0]
+
+
+def test_sampler_only_reports_full_when_no_space_remains():
+    rng = random.Random(5)
+    sampler = FreeSpaceSampler(120, 120, 15, rng=rng)
+    while not sampler.is_full:
+        position = sampler.sample()
+        if position is not None:
+            sampler.insert(Point(*position))
+
+    # 细网格扫描整张地图，不应再有可放置的位置
+    steps = [i * 0.5 for i in range(241)]
+    assert not any(sampler.is_valid(x, y) for x in steps for y in steps)
+
+
+def test_sampler_reopens_cells_after_removal():
+    rng = random.Random(6)
+    sampler = FreeSpaceSampler(60, 60, 15, rng=rng)
+    points = []
+    while not sampler.is_full:
+        position = sampler.sample()
+        if position is not None:
+            points.append(Point(*position))
+            sampler.insert(points[-1])
+
+    sampler.remove(points[0])
+    assert not sampler.is_full
+    position = sampler.sample()
+    assert position is not None and sampler.is_valid(*position)
@@ -0,0 +1,66 @@
+"""
+test_world.py
+
+功能: 无界面世界的测试：相同种子的模拟完全一致，重置后按原有参数和种子重建
+时间: 2026/10/17
+版本: 1.0
+"""
+
+from game.core import World
+from game.utils import (MapConfig, RabbitConfig)
+
+
+def make_world(**kwargs) -> World:
+    return World(MapConfig.width, MapConfig.height, headless=True, **kwargs)
+
+
+def signature(world: World, ticks: int = 300) -> tuple:
+    """推进若干 tick 后的世界状态摘要"""
+    for _ in range(ticks):
+        world.step()
+    return (
+        world.sim_clock.tick_count, len(world.plants), len(world.rabbits), len(world.crocodiles),
+        tuple((round(a.x, 6), round(a.y, 6)) for a in world.animals),
+        tuple((round(p.x, 6), round(p.y, 6)) for p in world.plants),
+    )
+
+
+def test_restart_reuses_seed():
+    world = make_world(seed=11)
+    expected = signature(world)
+    world.restart()
+    assert world.seed == 11
+    assert signature(world) == expected
+
+
+def test_restart_after_reseed_uses_new_seed():
+    world = make_world(seed=11)
+    world.reseed(12)
+    world.restart()
+    assert world.seed == 12
+    assert signature(world) == signature(make_world(seed=12))
+
+
+def test_restart_without_seed_draws_a_new_one():
+    world = make_world()
+    assert not world.seeded
+    seeds = {world.seed}
+    for _ in range(3):
+        world.restart()
+        seeds.add(world.seed)
+    assert len(seeds) > 1
+
+
+def test_restart_keeps_constructor_arguments():
+    config = RabbitConfig(initial_num=3, ave_speed=2.0)
+    world = make_world(seed=5, rabbit_config=config, speeds=(1, 8), initial_speed=8, vectorized=True)
+
+    # 科技树会直接修改配置，重置后应恢复构造时的配置
+    world.rabbit_config.ave_speed += 1
+    world.restart()
+
+    assert world.headless and world.vectorized
+    assert world.clock.speeds == (1, 8) and world.clock.speed == 8
+    assert world.rabbit_config.ave_speed == 2.0
+    assert world.rabbit_config is not config
+    assert len(world.rabbits) == 3
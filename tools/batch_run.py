@@ -0,0 +1,82 @@
+"""
+batch_run.py
+
+功能: 在多进程中批量运行无界面模拟，统计结局、存活时间和种群峰值
+时间: 2026/10/17
+版本: 1.0
+
+用法:
+    python tools/batch_run.py -n 32 --years 10 --set rabbit.ave_speed=1.0 --set plant.reproduction_interval=1500
+"""
+
+import argparse
+import ast
+import csv
+from collections import Counter
+from dataclasses import asdict
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from game.core import (SimulationJob, SimulationResult, run_batch)
+from game.core.simulation import OUTCOMES
+
+
+def parse_override(text: str) -> tuple[str, object]:
+    """解析 "前缀.字段=值" 形式的配置覆盖"""
+    key, sep, value = text.partition("=")
+    if not sep:
+        raise argparse.ArgumentTypeError(f"配置覆盖格式应为 前缀.字段=值: {text}")
+    try:
+        value = ast.literal_eval(value)
+    except (ValueError, SyntaxError):
+        pass
+    return key.strip(), value
+
+
+def print_results(results: list[SimulationResult]) -> None:
+    """打印每次模拟的结果和汇总"""
+    print(f"{'种子':>6} {'结局':<6} {'存活':>8} {'植物峰值':>8} {'兔子峰值':>8} {'鳄鱼峰值':>8}")
+    for r in results:
+        print(
+            f"{r.seed:>6} {OUTCOMES[r.outcome]:<6} {f'{r.years}年{r.months}月':>8} "
+            f"{r.peak_plants:>8} {r.peak_rabbits:>8} {r.peak_crocodiles:>8}"
+        )
+
+    counter = Counter(r.outcome for r in results)
+    mean_months = sum(r.survival_months for r in results) / len(results)
+    print()
+    print("汇总: " + "  ".join(f"{OUTCOMES[k]} {counter[k]}/{len(results)}" for k in OUTCOMES))
+    print(f"平均存活: {mean_months:.1f} 个月")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="批量运行无界面生态箱模拟")
+    parser.add_argument("-n", "--runs", type=int, default=8, help="模拟次数")
+    parser.add_argument("--seed", type=int, default=0, help="起始种子，第 i 次模拟使用 seed + i")
+    parser.add_argument("--years", type=int, default=10, help="每次模拟的最长年数")
+    parser.add_argument("--workers", type=int, default=None, help="进程数（默认使用全部核心）")
+    parser.add_argument("--set", dest="overrides", type=parse_override, action="append", default=[],
+                        metavar="前缀.字段=值", help="覆盖配置，前缀为 rabbit / croc / plant / season")
+    parser.add_argument("--vectorized", action="store_true", help="使用 NumPy 批量移动引擎")
+    parser.add_argument("--csv", type=Path, default=None, help="将结果写入 CSV 文件")
+    args = parser.parse_args()
+
+    overrides = dict(args.overrides)
+    jobs = [
+        SimulationJob(seed=args.seed + i, overrides=overrides, max_years=args.years, vectorized=args.vectorized)
+        for i in range(args.runs)
+    ]
+    results = run_batch(jobs, workers=args.workers)
+    print_results(results)
+
+    if args.csv is not None:
+        with open(args.csv, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=list(asdict(results[0])))
+            writer.writeheader()
+            for r in results:
+                writer.writerow(asdict(r))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+sweep.py
+
+功能: 配置参数扫描，并行模拟每个参数点并输出灭绝概率汇总表
+时间: 2026/10/17
+版本: 1.0
+
+用法:
+    # 网格扫描
+    python tools/sweep.py --grid rabbit.ave_speed=0.8,0.9,1.0 --grid croc.min_eat_distance=30,40,50 --runs 16
+    # 拉丁超立方采样
+    python tools/sweep.py --range rabbit.ave_speed=0.7:1.2 --range plant.reproduction_interval=1500:3000 \
+        --method lhs --samples 20 --runs 8
+"""
+
+import argparse
+import ast
+import csv
+import random
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from game.core import (SweepRow, grid_points, random_points, latin_hypercube_points, run_sweep)
+from game.core.simulation import OUTCOMES
+
+
+def parse_value(text: str) -> object:
+    """解析单个取值"""
+    try:
+        return ast.literal_eval(text)
+    except (ValueError, SyntaxError):
+        return text
+
+
+def parse_grid(text: str) -> tuple[str, list]:
+    """解析 "前缀.字段=值1,值2,..." 形式的网格取值"""
+    key, sep, values = text.partition("=")
+    if not sep:
+        raise argparse.ArgumentTypeError(f"网格格式应为 前缀.字段=值1,值2: {text}")
+    return key.strip(), [parse_value(v) for v in values.split(",")]
+
+
+def parse_range(text: str) -> tuple[str, tuple[float, float]]:
+    """解析 "前缀.字段=下限:上限" 形式的取值范围"""
+    key, sep, bounds = text.partition("=")
+    low, colon, high = bounds.partition(":")
+    if not sep or not colon:
+        raise argparse.ArgumentTypeError(f"范围格式应为 前缀.字段=下限:上限: {text}")
+    return key.strip(), (float(low), float(high))
+
+
+def print_table(rows: list[SweepRow]) -> None:
+    """打印汇总表"""
+    keys = list(rows[0].overrides)
+    header = keys + [OUTCOMES[k] for k in OUTCOMES] + ["平均存活(月)"]
+    print("  ".join(f"{h:>12}" for h in header))
+    for row in rows:
+        cells = [f"{row.overrides[k]:>12.4g}" if isinstance(row.overrides[k], float) else f"{row.overrides[k]!s:>12}"
+                 for k in keys]
+        cells += [f"{row.probabilities[k]:>12.2f}" for k in OUTCOMES]
+        cells.append(f"{row.mean_survival_months:>12.1f}")
+        print("  ".join(cells))
+
+
+def write_csv(rows: list[SweepRow], path: Path) -> None:
+    """将汇总表写入 CSV 文件"""
+    keys = list(rows[0].overrides)
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(keys + ["runs"] + [f"p_{k}" for k in OUTCOMES] + ["mean_survival_months"])
+        for row in rows:
+            writer.writerow(
+                [row.overrides[k] for k in keys] + [row.runs]
+                + [row.probabilities[k] for k in OUTCOMES] + [row.mean_survival_months]
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="生态箱配置参数扫描")
+    parser.add_argument("--grid", type=parse_grid, action="append", default=[],
+                        metavar="前缀.字段=值1,值2", help="网格扫描的取值")
+    parser.add_argument("--range", dest="ranges", type=parse_range, action="append", default=[],
+                        metavar="前缀.字段=下限:上限", help="随机或拉丁超立方采样的范围")
+    parser.add_argument("--method", choices=("random", "lhs"), default="lhs", help="范围采样方法")
+    parser.add_argument("--samples", type=int, default=10, help="范围采样的参数点数量")
+    parser.add_argument("--runs", type=int, default=8, help="每个参数点的模拟次数")
+    parser.add_argument("--years", type=int, default=10, help="每次模拟的最长年数")
+    parser.add_argument("--seed", type=int, default=0, help="起始种子")
+    parser.add_argument("--workers", type=int, default=None, help="进程数（默认使用全部核心）")
+    parser.add_argument("--vectorized", action="store_true", help="使用 NumPy 批量移动引擎")
+    parser.add_argument("--csv", type=Path, default=None, help="将汇总表写入 CSV 文件")
+    args = parser.parse_args()
+
+    if args.grid and args.ranges:
+        parser.error("--grid 与 --range 不能同时使用")
+    if args.grid:
+        points = grid_points(dict(args.grid))
+    elif args.ranges:
+        sample = latin_hypercube_points if args.method == "lhs" else random_points
+        points = sample(dict(args.ranges), args.samples, random.Random(args.seed))
+    else:
+        parser.error("需要至少一个 --grid 或 --range")
+
+    rows = run_sweep(
+        points, runs=args.runs, max_years=args.years, seed=args.seed,
+        workers=args.workers, vectorized=args.vectorized
+    )
+    print_table(rows)
+    if args.csv is not None:
+        write_csv(rows, args.csv)
+
+
+if __name__ == "__main__":
+    main()